@@ -0,0 +1,65 @@
+"""
+조항 스캐너 모듈
+- 미리 컴파일한 정규식 + finditer 한 번으로 조항 위치 탐색
+- LawTextSplitter / UnifiedDocumentLoader가 같이 사용
+
+사용법:
+    from article_scanner import iter_article_spans, iter_articles
+
+    for article_num, start, end in iter_article_spans(text):
+        content = text[start:end]
+
+    for article_num, article_text in iter_articles(text):
+        ...   # "제N조\\n내용" 형태 (너무 짧은 조항 제외)
+"""
+import re
+from typing import Iterator, Tuple
+
+# 정규식: 제N조, 제N조의N
+ARTICLE_PATTERN = re.compile(r'제\s*\d+\s*조(?:의\s*\d+)?')
+
+# 이보다 짧은 조항 내용은 청크로 만들지 않음 (글자)
+MIN_ARTICLE_LENGTH = 50
+
+
+def iter_article_spans(text: str) -> Iterator[Tuple[str, int, int]]:
+    """
+    조항 번호와 내용 위치를 한 번의 탐색으로 생성
+
+    내용 범위는 조항 번호 바로 뒤부터 다음 조항 번호 직전까지
+    (re.split(r'(제\\s*\\d+\\s*조(?:의\\s*\\d+)?)', text)의 조각과 같은 경계)
+
+    Args:
+        text: 원본 법률 문서
+
+    Yields:
+        (article_num, start, end)
+    """
+    matches = ARTICLE_PATTERN.finditer(text)
+    current = next(matches, None)
+
+    while current is not None:
+        following = next(matches, None)
+        end = following.start() if following is not None else len(text)
+        yield current.group(), current.end(), end
+        current = following
+
+
+def iter_articles(text: str, min_length: int = MIN_ARTICLE_LENGTH) -> Iterator[Tuple[str, str]]:
+    """
+    조항 번호와 청크 본문("제N조\\n내용") 생성
+
+    Args:
+        text: 원본 법률 문서
+        min_length: 최소 내용 길이 (이보다 짧으면 건너뜀)
+
+    Yields:
+        (article_num, article_text)
+    """
+    for article_num, start, end in iter_article_spans(text):
+        content = text[start:end].strip()
+
+        if len(content) < min_length:
+            continue
+
+        yield article_num, f"{article_num}\n{content}"
@@ -0,0 +1,800 @@
+"""
+성능 벤치마크 모듈
+
+사용법:
+    python tools/benchmark.py          # 전체 벤치마크
+    python tools/benchmark.py scan     # 특정 벤치마크만
+"""
+import sys
+import time
+import logging
+import tempfile
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Dict, Callable
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("benchmark")
+
+
+def _best_of(func: Callable, repeat: int) -> float:
+    """repeat번 실행해서 가장 빠른 시간(초) 반환"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+# 1. 디렉토리 스캔 (DirectoryLoader 2회 vs os.scandir 1회)
+
+def _make_file_tree(root: Path, n_files: int, fanout: int = 50) -> None:
+    """
+    n_files개의 .txt/.md 파일(+ 무시 대상 .json, 숨김 파일, .ipynb_checkpoints, 대문자 확장자)을 가진 중첩 폴더 생성
+    """
+    body = "제1조(목적)\n이 법은 근로조건의 기준을 정함을 목적으로 한다.\n" * 5
+
+    for i in range(n_files):
+        sub_dir = root / f"group_{i % fanout:03d}" / f"part_{(i // fanout) % 4}"
+        sub_dir.mkdir(parents=True, exist_ok=True)
+        ext = ".txt" if i % 2 == 0 else ".md"
+        (sub_dir / f"doc_{i:05d}{ext}").write_text(body, encoding="utf-8")
+
+        if i % 10 == 0:
+            (sub_dir / f"meta_{i:05d}.json").write_text("{}", encoding="utf-8")
+
+        # DirectoryLoader(load_hidden=False, 대소문자 구분)가 읽지 않는 파일들
+        if i % 100 == 0:
+            (sub_dir / f".hidden_{i:05d}.txt").write_text(body, encoding="utf-8")
+            (sub_dir / f"UPPER_{i:05d}.TXT").write_text(body, encoding="utf-8")
+
+            checkpoint_dir = sub_dir / ".ipynb_checkpoints"
+            checkpoint_dir.mkdir(exist_ok=True)
+            (checkpoint_dir / f"doc_{i:05d}-checkpoint{ext}").write_text(body, encoding="utf-8")
+
+
+def _legacy_directory_load(directory: Path, doc_type: str) -> list:
+    """기존 방식: DirectoryLoader(**/*.txt) + DirectoryLoader(**/*.md)"""
+    from langchain_community.document_loaders import DirectoryLoader, TextLoader
+
+    all_docs = []
+    for glob in ("**/*.txt", "**/*.md"):
+        loader = DirectoryLoader(
+            str(directory),
+            glob=glob,
+            loader_cls=TextLoader,
+            loader_kwargs={'encoding': 'utf-8'}
+        )
+        all_docs.extend(loader.load())
+
+    for doc in all_docs:
+        doc.metadata['type'] = doc_type
+        doc.metadata['size'] = len(doc.page_content)
+
+    return all_docs
+
+
+def benchmark_directory_scan(n_files: int = 10000, repeat: int = 3) -> Dict[str, float]:
+    """
+    10k 파일 트리에서 기존 DirectoryLoader 방식과 scandir 스캐너 비교
+
+    Returns:
+        {"legacy": 초, "scandir": 초, "speedup": 배수}
+    """
+    from document_loader import DocumentLoader
+
+    # 파일마다 찍히는 DEBUG 로그는 측정에서 제외
+    logging.getLogger("document_loader").setLevel(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        laws_dir = root / "laws"
+        _make_file_tree(laws_dir, n_files)
+
+        loader = DocumentLoader(data_dir=str(root))
+
+        # 결과가 같은지 먼저 확인 (순서 무관)
+        legacy_docs = _legacy_directory_load(laws_dir, "law")
+        new_docs = loader._load_from_directory(laws_dir, "law")
+
+        def key(doc):
+            return (doc.metadata['source'], doc.page_content, doc.metadata['type'], doc.metadata['size'])
+
+        if sorted(map(key, legacy_docs)) != sorted(map(key, new_docs)):
+            raise AssertionError("scandir 스캐너 결과가 DirectoryLoader 결과와 다릅니다")
+
+        legacy = _best_of(lambda: _legacy_directory_load(laws_dir, "law"), repeat)
+        scandir = _best_of(lambda: loader._load_from_directory(laws_dir, "law"), repeat)
+
+    result = {"legacy": legacy, "scandir": scandir, "speedup": legacy / scandir}
+    logger.info(
+        f"[scan] {n_files}개 파일: DirectoryLoader {legacy:.3f}초 → "
+        f"scandir {scandir:.3f}초 (x{result['speedup']:.1f})"
+    )
+    return result
+
+
+# 2. 청크 저장소 (바이너리 저장/로드)
+
+def benchmark_chunk_store(n_chunks: int = 100000, repeat: int = 3) -> Dict[str, float]:
+    """
+    n_chunks개 청크 저장 후 전체 로드 / 단건 조회 시간 측정
+
+    Returns:
+        {"save": 초, "load_records": 초, "load_all": 초, "get": 건당 초, "mb": 파일 크기}
+    """
+    import random
+    from langchain.schema import Document
+    from chunk_store import save_chunks, ChunkStore
+
+    text = "① 사용자는 1년간 80퍼센트 이상 출근한 근로자에게 15일의 유급휴가를 주어야 한다. " * 4
+    chunks = [
+        Document(
+            page_content=text,
+            metadata={
+                "source": f"data/raw/laws/law_{i // 200:04d}.txt",
+                "type": "law",
+                "chunk_id": i % 200 + 1,
+                "article_num": f"제{i % 200 + 1}조",
+                "title": "연차 유급휴가",
+                "keywords": ["연차", "유급휴가", "출근율"]
+            }
+        )
+        for i in range(n_chunks)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "chunks.bin")
+
+        save = _best_of(lambda: save_chunks(chunks, path), 1)
+        size_mb = Path(path).stat().st_size / 1024 / 1024
+
+        with ChunkStore(path) as store:
+            if store.load_all()[12345 % n_chunks].page_content != chunks[12345 % n_chunks].page_content:
+                raise AssertionError("저장/로드 결과가 다릅니다")
+
+            load_records = _best_of(store.load_records, repeat)
+            load_all = _best_of(store.load_all, repeat)
+
+            positions = [random.randrange(n_chunks) for _ in range(1000)]
+            get = _best_of(lambda: [store.get(p) for p in positions], repeat) / len(positions)
+
+    result = {"save": save, "load_records": load_records, "load_all": load_all, "get": get, "mb": size_mb}
+    logger.info(
+        f"[chunk_store] {n_chunks}개 청크 ({size_mb:.1f}MB): 저장 {save:.3f}초, "
+        f"레코드 로드 {load_records:.3f}초, Document 로드 {load_all:.3f}초, "
+        f"단건 조회 {get * 1e6:.1f}µs"
+    )
+    return result
+
+
+# 3. 코퍼스 아레나 (청크 복사 vs 오프셋 레코드) 메모리
+
+def _peak_memory(func: Callable):
+    """func 실행 중 추가로 할당된 메모리 최대치(바이트)와 결과 반환"""
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, result
+
+
+def _make_case_documents(n_docs: int, doc_chars: int) -> list:
+    """판례 덤프 흉내용 대용량 Document 생성"""
+    from langchain.schema import Document
+
+    sentence = "원고는 피고 회사에서 근로하다가 해고되었는데, 해고의 정당한 이유가 있는지가 쟁점이다. "
+    body = (sentence * (doc_chars // len(sentence) + 1))[:doc_chars]
+    return [
+        Document(
+            page_content=f"[사건 {i}] " + body,
+            metadata={"source": f"data/raw/cases/case_{i:05d}.txt", "type": "case"}
+        )
+        for i in range(n_docs)
+    ]
+
+
+def benchmark_corpus_arena(n_docs: int = 200, doc_chars: int = 200000) -> Dict[str, float]:
+    """
+    SimpleSplitter.split_documents (청크마다 문자열/dict 복사)와
+    CorpusArena + split_spans (오프셋 레코드) 메모리 비교
+
+    Returns:
+        {"documents_mb": MB, "arena_mb": MB, "ratio": 배수}
+    """
+    from text_splitter import SimpleSplitter
+    from corpus_arena import CorpusArena
+
+    logging.getLogger("text_splitter").setLevel(logging.INFO)
+
+    splitter = SimpleSplitter()
+    documents = _make_case_documents(n_docs, doc_chars)
+
+    documents_peak, chunks = _peak_memory(lambda: splitter.split_documents(documents))
+
+    def build_arena():
+        arena = CorpusArena.from_documents(documents)
+        return arena, splitter.split_spans(arena)
+
+    arena_peak, (arena, spans) = _peak_memory(build_arena)
+
+    if len(spans) != len(chunks) or arena.to_document(spans[-1]) != chunks[-1]:
+        raise AssertionError("아레나 분할 결과가 split_documents와 다릅니다")
+
+    result = {
+        "documents_mb": documents_peak / 1024 / 1024,
+        "arena_mb": arena_peak / 1024 / 1024,
+        "ratio": documents_peak / arena_peak,
+    }
+    logger.info(
+        f"[arena] {n_docs}개 문서 x {doc_chars}자 → {len(spans)}개 청크: "
+        f"Document 복사 {result['documents_mb']:.1f}MB → 아레나 {result['arena_mb']:.1f}MB "
+        f"(x{result['ratio']:.1f} 절감)"
+    )
+    return result
+
+
+# 4. Chunk 레코드 (__slots__) vs Document + dict 복사 메모리
+
+def _make_law_text(n_articles: int) -> str:
+    """n_articles개 조항을 가진 법령 텍스트 생성"""
+    body = "사용자는 근로계약을 체결할 때에 근로자에게 임금, 소정근로시간, 휴일을 명시하여야 한다."
+    return "\n\n".join(f"제{i}조(조항{i})\n① {body}" for i in range(1, n_articles + 1))
+
+
+def benchmark_chunk_records(n_articles: int = 100000) -> Dict[str, float]:
+    """
+    LawTextSplitter로 n_articles개 조항을 분할할 때
+    split_document(Document + 메타데이터 복사)와 split_chunks(Chunk) 메모리 비교
+
+    Returns:
+        {"documents_mb": MB, "chunks_mb": MB, "ratio": 배수}
+    """
+    from langchain.schema import Document
+    from text_splitter import LawTextSplitter
+
+    logging.getLogger("text_splitter").setLevel(logging.WARNING)
+
+    splitter = LawTextSplitter(use_llm=False)
+    document = Document(
+        page_content=_make_law_text(n_articles),
+        metadata={"source": "data/raw/laws/대용량법.txt", "type": "law", "size": 0}
+    )
+
+    documents_peak, documents = _peak_memory(lambda: splitter.split_document(document))
+    del documents
+    chunks_peak, chunks = _peak_memory(lambda: splitter.split_chunks(document))
+
+    result = {
+        "documents_mb": documents_peak / 1024 / 1024,
+        "chunks_mb": chunks_peak / 1024 / 1024,
+        "ratio": documents_peak / chunks_peak,
+    }
+    logger.info(
+        f"[records] {len(chunks)}개 조항 청크: Document {result['documents_mb']:.1f}MB → "
+        f"Chunk {result['chunks_mb']:.1f}MB (x{result['ratio']:.1f} 절감)"
+    )
+    return result
+
+
+# 5. 조항 스캐너 (re.split + re.match vs 컴파일된 finditer 한 번)
+
+def _make_full_labor_law() -> str:
+    """
+    근로기준법 전문 크기(본칙 116조 + 조의N, 교차 참조 포함)의 텍스트 생성
+    """
+    paragraphs = [
+        "① 사용자는 근로자에게 제{ref}조에 따른 휴일을 주어야 하며, 이를 위반한 경우 제109조에 따라 처벌한다.",
+        "② 제1항에도 불구하고 당사자 간에 합의하면 1주 간에 12시간을 한도로 근로시간을 연장할 수 있다.",
+        "③ 그 밖에 필요한 사항은 대통령령으로 정한다.",
+    ]
+
+    lines = ["# 근로기준법", ""]
+    for num in range(1, 117):
+        suffixes = [""] + (["의2", "의3"] if num % 9 == 0 else [])
+        for suffix in suffixes:
+            lines.append(f"제{num}조{suffix}(조항 {num}{suffix})")
+            lines.extend(p.format(ref=(num * 7) % 116 + 1) for p in paragraphs)
+            lines.append("")
+
+    return "\n".join(lines)
+
+
+def _legacy_split_articles(text: str) -> list:
+    """기존 방식: re.split으로 나눈 뒤 조항마다 re.match로 번호를 다시 찾음"""
+    import re
+
+    pattern = r'(제\s*\d+\s*조(?:의\s*\d+)?)'
+    chunks = re.split(pattern, text)
+
+    articles = []
+    for i in range(1, len(chunks), 2):
+        if i + 1 < len(chunks):
+            article_num = chunks[i].strip()
+            article_content = chunks[i + 1].strip()
+            if len(article_content) < 50:
+                continue
+            articles.append(f"{article_num}\n{article_content}")
+
+    return [
+        (re.match(pattern, article).group(1), article)
+        for article in articles
+    ]
+
+
+def benchmark_article_scanner(repeat: int = 50) -> Dict[str, float]:
+    """
+    근로기준법 전문 크기 텍스트에서 기존 분할과 finditer 스캐너 비교 (결과 동일성 확인)
+
+    Returns:
+        {"legacy_ms": ms, "scanner_ms": ms, "speedup": 배수}
+    """
+    from article_scanner import iter_articles
+
+    text = _make_full_labor_law()
+
+    if _legacy_split_articles(text) != list(iter_articles(text)):
+        raise AssertionError("조항 스캐너 결과가 기존 분할과 다릅니다")
+
+    legacy = _best_of(lambda: _legacy_split_articles(text), repeat)
+    scanner = _best_of(lambda: list(iter_articles(text)), repeat)
+
+    result = {"legacy_ms": legacy * 1000, "scanner_ms": scanner * 1000, "speedup": legacy / scanner}
+    logger.info(
+        f"[articles] {len(text)}자: re.split+re.match {result['legacy_ms']:.2f}ms → "
+        f"finditer {result['scanner_ms']:.2f}ms (x{result['speedup']:.1f}, 결과 동일)"
+    )
+    return result
+
+
+# 6. 조항 묶음 프롬프트 (조항별 요청 vs N개 묶음 요청)
+
+def _make_simulated_llm(overhead: float, per_article: float, parallel: int):
+    """
+    Ollama 응답 시간을 흉내 내는 가짜 LLM (Runnable)
+
+    요청마다 overhead초 + 조항당 per_article초, 동시에 parallel개까지만 처리
+    묶음 프롬프트면 [조항 번호]마다 JSON 배열 항목을 돌려줌
+    """
+    import re
+    import json
+    import asyncio
+    from langchain_core.runnables import RunnableLambda
+    from langchain_core.messages import AIMessage
+
+    label_pattern = re.compile(r"^\[(.+?)\]$", re.MULTILINE)
+    slots = {}
+
+    async def respond(messages):
+        prompt = messages[0].content
+        labels = label_pattern.findall(prompt)
+
+        loop = asyncio.get_running_loop()
+        if loop not in slots:
+            slots[loop] = asyncio.Semaphore(parallel)
+
+        async with slots[loop]:
+            await asyncio.sleep(overhead + per_article * max(1, len(labels)))
+
+        if labels:
+            content = json.dumps(
+                [{"article_num": label, "title": f"{label} 요약", "keywords": ["근로"]} for label in labels],
+                ensure_ascii=False
+            )
+        else:
+            label = prompt.split("법률 조항:\n", 1)[-1].split("\n", 1)[0]
+            content = json.dumps({"title": f"{label} 요약", "keywords": ["근로"]}, ensure_ascii=False)
+
+        return AIMessage(content=content)
+
+    return RunnableLambda(lambda messages: asyncio.run(respond(messages)), afunc=respond)
+
+
+def benchmark_prompt_packing(
+    n_articles: int = 120,
+    pack_size: int = 8,
+    overhead: float = 0.05,
+    per_article: float = 0.01,
+    parallel: int = 2
+) -> Dict[str, float]:
+    """
+    짧은 조항들의 메타데이터 생성 처리량 비교 (가짜 LLM 지연 모델 사용)
+
+    Returns:
+        {"single_aps": 초당 조항 수, "packed_aps": 초당 조항 수, "speedup": 배수}
+    """
+    from text_splitter import MetadataGenerator
+
+    texts = [f"제{i}조\n({i}번 조항) 사용자는 근로자에게 임금을 지급하여야 한다." for i in range(1, n_articles + 1)]
+
+    generator = MetadataGenerator(use_cache=False, max_concurrency=parallel)
+    generator.llm = _make_simulated_llm(overhead, per_article, parallel)
+
+    started = time.perf_counter()
+    single = generator.generate_many(texts, pack_size=1)
+    single_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    packed = generator.generate_many(texts, pack_size=pack_size)
+    packed_time = time.perf_counter() - started
+
+    if single != packed:
+        raise AssertionError("묶음 결과가 조항별 결과와 다릅니다")
+
+    result = {
+        "single_aps": n_articles / single_time,
+        "packed_aps": n_articles / packed_time,
+        "speedup": single_time / packed_time
+    }
+    logger.info(
+        f"[packing] 조항 {n_articles}개: 조항별 {result['single_aps']:.1f}개/초 → "
+        f"{pack_size}개 묶음 {result['packed_aps']:.1f}개/초 (x{result['speedup']:.1f})"
+    )
+    return result
+
+
+# 7. 가짜 Ollama 서버로 전체 적재 처리량 (분할 → 메타데이터 → 임베딩)
+
+@contextmanager
+def _fake_ollama_process(latency: float, capacity: int, dist: str, spread: float):
+    """
+    가짜 Ollama 서버를 별도 프로세스로 띄우고 주소를 넘겨줌
+
+    같은 프로세스에서 돌리면 서버 스레드가 클라이언트와 GIL을 나눠 써서 처리량이 낮게 나옴
+    """
+    import socket
+    import subprocess
+    import urllib.request
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    process = subprocess.Popen(
+        [sys.executable, str(Path(__file__).parent / "fake_ollama.py"),
+         str(port), str(latency), str(capacity), "--dist", dist, "--spread", str(spread)],
+        stdout=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    try:
+        for _ in range(100):
+            try:
+                urllib.request.urlopen(url + "/api/tags", timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        else:
+            raise RuntimeError("가짜 Ollama 서버가 시작되지 않았습니다")
+
+        yield url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def benchmark_ingest(
+    n_laws: int = 4,
+    articles_per_law: int = 50,
+    latency: float = 0.05,
+    capacity: int = 4,
+    dist: str = "lognormal",
+    spread: float = 0.5,
+    pack_size: int = 1,
+    embed_batch: int = 32
+) -> Dict[str, float]:
+    """
+    가짜 Ollama 서버(별도 프로세스)를 상대로 법령 적재 전체 처리량 측정
+
+    LawTextSplitter.split_documents(조항 분할 + 메타데이터 동시 요청) 뒤
+    EmbeddingEngine으로 청크를 embed_batch개씩 capacity개 동시 임베딩 (벡터 DB 저장은 제외)
+
+    Returns:
+        {"articles": 조항 수, "split_s": 분할+메타데이터 초, "embed_s": 임베딩 초,
+         "articles_per_s": 전체 초당 조항 수, 서버 통계...}
+    """
+    import json
+    import urllib.request
+    from langchain_core.documents import Document
+    from text_splitter import LawTextSplitter, MetadataGenerator
+    from embeddings import EmbeddingEngine
+
+    documents = [
+        # 법령마다 본문을 달리해서 싱글 플라이트/캐시로 요청이 합쳐지지 않게
+        Document(
+            page_content=_make_law_text(articles_per_law).replace("사용자는", f"{i}번 법령의 사용자는"),
+            metadata={"source": f"law_{i}.txt", "doc_type": "law"}
+        )
+        for i in range(n_laws)
+    ]
+
+    with _fake_ollama_process(latency, capacity, dist, spread) as url:
+        splitter = LawTextSplitter(use_llm=False, structure_aware=True)
+        splitter.use_llm = True
+        splitter.metadata_gen = MetadataGenerator(
+            base_url=url, use_cache=False, max_concurrency=capacity, pack_size=pack_size
+        )
+        engine = EmbeddingEngine(base_url=url, batch_size=embed_batch, max_concurrency=capacity, use_cache=False)
+
+        started = time.perf_counter()
+        chunks = splitter.split_documents(documents)
+        split_time = time.perf_counter() - started
+
+        _, vectors = engine.embed_chunks(chunks)
+        total_time = time.perf_counter() - started
+
+        with urllib.request.urlopen(url + "/api/stats") as response:
+            server_stats = json.loads(response.read())
+
+    if len(vectors) != len(chunks):
+        raise AssertionError("임베딩 수가 청크 수와 다릅니다")
+
+    result = {
+        "articles": len(chunks),
+        "split_s": split_time,
+        "embed_s": total_time - split_time,
+        "articles_per_s": len(chunks) / total_time,
+        **server_stats
+    }
+    logger.info(
+        f"[ingest] 조항 {len(chunks)}개 ({dist} {latency}s, 동시 {capacity}): "
+        f"분할+메타데이터 {split_time:.2f}s + 임베딩 {result['embed_s']:.2f}s → "
+        f"{result['articles_per_s']:.1f}개/초"
+    )
+    return result
+
+
+# 8. 임베딩 (고정 묶음 순차 요청 vs 길이순 묶음 동시 요청)
+
+def benchmark_embedding(
+    n_chunks: int = 512,
+    batch_size: int = 32,
+    latency: float = 0.05,
+    capacity: int = 4
+) -> Dict[str, float]:
+    """
+    OllamaEmbeddings.embed_documents를 batch_size개씩 순서대로 부르는 방식과 EmbeddingEngine 비교
+
+    Returns:
+        {"sequential_tps": 초당 텍스트 수, "engine_tps": 초당 텍스트 수, "speedup": 배수}
+    """
+    import asyncio
+    import numpy as np
+    from langchain.schema import Document
+    from langchain_ollama import OllamaEmbeddings
+    from embeddings import EmbeddingEngine
+
+    # 짧은 조항과 긴 판례 문단이 섞인 길이 분포
+    texts = [f"{i}번 청크 " + "근로자의 임금 " * (5 + (i * 37) % 200) for i in range(n_chunks)]
+
+    with _fake_ollama_process(latency, capacity, "fixed", 0.0) as url:
+        embeddings = OllamaEmbeddings(model="bona/bge-m3-korean:latest", base_url=url)
+
+        started = time.perf_counter()
+        vectors = []
+        for i in range(0, len(texts), batch_size):
+            vectors.extend(embeddings.embed_documents(texts[i:i + batch_size]))
+        sequential_time = time.perf_counter() - started
+
+        engine = EmbeddingEngine(embeddings=embeddings, batch_size=batch_size, max_concurrency=capacity, use_cache=False)
+        started = time.perf_counter()
+        matrix = engine.embed_texts(texts)
+        engine_time = time.perf_counter() - started
+
+        # 동기 API를 다시 불러도(같은 비동기 클라이언트) 그리고 이벤트 루프 안에서 불러도 동작하는지
+        _, again = engine.embed_chunks([Document(page_content=text) for text in texts[:8]])
+
+        async def from_running_loop():
+            return engine.embed_texts(texts[:8])
+
+        inside_loop = asyncio.run(from_running_loop())
+
+    if not np.allclose(np.asarray(vectors, dtype=np.float32), matrix):
+        raise AssertionError("EmbeddingEngine 결과 순서가 입력과 다릅니다")
+    if not (np.allclose(matrix[:8], again) and np.allclose(matrix[:8], inside_loop)):
+        raise AssertionError("EmbeddingEngine 반복 호출 결과가 첫 호출과 다릅니다")
+
+    result = {
+        "sequential_tps": n_chunks / sequential_time,
+        "engine_tps": n_chunks / engine_time,
+        "speedup": sequential_time / engine_time,
+        "list_mb": sum(len(v) for v in vectors) * 32 / 1e6,  # 파이썬 float 객체 + 리스트 포인터 근사
+        "matrix_mb": matrix.nbytes / 1e6
+    }
+    logger.info(
+        f"[embedding] 청크 {n_chunks}개: 순차 {result['sequential_tps']:.1f}개/초 → "
+        f"길이순 {capacity}개 동시 {result['engine_tps']:.1f}개/초 (x{result['speedup']:.1f}), "
+        f"메모리 {result['list_mb']:.1f}MB → {result['matrix_mb']:.1f}MB"
+    )
+    return result
+
+
+# 9. 동시 질문 임베딩 (질문마다 요청 vs 마이크로 배치)
+
+def benchmark_query_coalescing(
+    n_clients: int = 32,
+    queries_per_client: int = 10,
+    latency: float = 0.02,
+    capacity: int = 4,
+    window_ms: float = 5.0
+) -> Dict[str, float]:
+    """
+    n_clients개 스레드가 동시에 embed_query를 부를 때 처리량과 p99 지연 비교
+
+    Returns:
+        {"direct_qps", "coalesced_qps", "speedup", "direct_p99_ms", "coalesced_p99_ms", "avg_batch"}
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from langchain_ollama import OllamaEmbeddings
+    from embedding_coalescer import EmbeddingCoalescer
+
+    questions = [f"{i}번 질문: 연차휴가는 며칠인가요?" for i in range(n_clients * queries_per_client)]
+
+    def measure(embedding) -> tuple:
+        latencies = []
+
+        def client(start: int) -> None:
+            for question in questions[start:start + queries_per_client]:
+                began = time.perf_counter()
+                embedding.embed_query(question)
+                latencies.append(time.perf_counter() - began)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(n_clients) as pool:
+            list(pool.map(client, range(0, len(questions), queries_per_client)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return len(questions) / elapsed, latencies[int(len(latencies) * 0.99) - 1] * 1000
+
+    with _fake_ollama_process(latency, capacity, "fixed", 0.0) as url:
+        embeddings = OllamaEmbeddings(model="bona/bge-m3-korean:latest", base_url=url)
+        direct_qps, direct_p99 = measure(embeddings)
+
+        coalescer = EmbeddingCoalescer(embeddings, window_ms=window_ms, max_in_flight=capacity)
+        coalesced_qps, coalesced_p99 = measure(coalescer)
+        coalescer.close()
+
+    result = {
+        "direct_qps": direct_qps,
+        "coalesced_qps": coalesced_qps,
+        "speedup": coalesced_qps / direct_qps,
+        "direct_p99_ms": direct_p99,
+        "coalesced_p99_ms": coalesced_p99,
+        "avg_batch": coalescer.stats()["avg_batch"]
+    }
+    logger.info(
+        f"[coalescing] 동시 {n_clients}명: 질문마다 {direct_qps:.1f}개/초 (p99 {direct_p99:.0f}ms) → "
+        f"{window_ms}ms 묶음 {coalesced_qps:.1f}개/초 (p99 {coalesced_p99:.0f}ms, 평균 묶음 {result['avg_batch']})"
+    )
+    return result
+
+
+# 10. 단계별 순차 적재 vs 파이프라인 적재 (가짜 Ollama 서버)
+
+def benchmark_pipeline(
+    n_laws: int = 6,
+    articles_per_law: int = 40,
+    latency: float = 0.05,
+    capacity: int = 4,
+    embed_batch: int = 32,
+    store_latency: float = 0.05
+) -> Dict[str, float]:
+    """
+    같은 구성요소로 단계별 순차 적재와 IngestPipeline 처리량 비교
+
+    저장은 배치당 store_latency초 걸리는 가짜 저장 함수
+
+    Returns:
+        {"sequential_cps": 초당 청크 수, "pipeline_cps": 초당 청크 수, "speedup": 배수}
+    """
+    import asyncio
+    from langchain_ollama import OllamaEmbeddings
+    from document_load_and_split import UnifiedDocumentLoader
+    from text_splitter import MetadataGenerator
+    from ingest_pipeline import IngestPipeline
+
+    def store(documents, vectors):
+        time.sleep(store_latency)
+
+    with tempfile.TemporaryDirectory() as tmp, _fake_ollama_process(latency, capacity, "lognormal", 0.5) as url:
+        law_dir = Path(tmp) / "laws"
+        law_dir.mkdir()
+        for i in range(n_laws):
+            text = _make_law_text(articles_per_law).replace("사용자는", f"{i}번 법령의 사용자는")
+            (law_dir / f"law_{i}.txt").write_text(text, encoding="utf-8")
+
+        loader = UnifiedDocumentLoader(data_dir=tmp, use_llm=False)
+        embeddings = OllamaEmbeddings(model="bona/bge-m3-korean:latest", base_url=url)
+
+        def make_generator(tag: str) -> MetadataGenerator:
+            # 두 방식이 같은 조항을 요청하도록 모델 이름만 달리해서 서버 쪽 조건은 같게
+            return MetadataGenerator(model=f"fake-{tag}", base_url=url, use_cache=False, max_concurrency=capacity)
+
+        # 단계별 순차: 분할 전부 → 메타데이터 전부 → 임베딩 전부 → 저장 전부
+        generator = make_generator("sequential")
+        started = time.perf_counter()
+
+        chunks = []
+        for file_path in loader.iter_files("law"):
+            chunks.extend(loader.split_text(file_path.read_text(encoding="utf-8"), str(file_path), "law"))
+
+        results = generator.generate_many([chunk.page_content for chunk in chunks])
+        for chunk, metadata in zip(chunks, results):
+            chunk.metadata.update(title=metadata["title"], keywords=metadata["keywords"])
+
+        vectors = []
+        for i in range(0, len(chunks), embed_batch):
+            vectors.extend(embeddings.embed_documents([chunk.page_content for chunk in chunks[i:i + embed_batch]]))
+
+        for i in range(0, len(chunks), embed_batch):
+            store(chunks[i:i + embed_batch], vectors[i:i + embed_batch])
+
+        sequential_time = time.perf_counter() - started
+
+        # 파이프라인
+        pipeline = IngestPipeline(
+            loader,
+            metadata_gen=make_generator("pipeline"),
+            embeddings=embeddings,
+            sink=store,
+            doc_types=("law",),
+            llm_batch=capacity * 2,
+            embed_batch=embed_batch,
+            upsert_batch=embed_batch,
+            report_interval=0
+        )
+        stats = pipeline.run()
+
+    if stats["chunks"] != len(chunks):
+        raise AssertionError("파이프라인 청크 수가 순차 적재와 다릅니다")
+
+    result = {
+        "chunks": len(chunks),
+        "sequential_cps": len(chunks) / sequential_time,
+        "pipeline_cps": stats["chunks_per_s"],
+        "speedup": sequential_time / stats["elapsed_s"],
+        "stages": stats["stages"]
+    }
+    logger.info(
+        f"[pipeline] 청크 {len(chunks)}개: 순차 {result['sequential_cps']:.1f}개/초 → "
+        f"파이프라인 {result['pipeline_cps']:.1f}개/초 (x{result['speedup']:.1f})"
+    )
+    return result
+
+
+BENCHMARKS = {
+    "scan": benchmark_directory_scan,
+    "chunk_store": benchmark_chunk_store,
+    "arena": benchmark_corpus_arena,
+    "records": benchmark_chunk_records,
+    "articles": benchmark_article_scanner,
+    "packing": benchmark_prompt_packing,
+    "ingest": benchmark_ingest,
+    "embedding": benchmark_embedding,
+    "coalescing": benchmark_query_coalescing,
+    "pipeline": benchmark_pipeline,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"알 수 없는 벤치마크: {name} (가능: {', '.join(BENCHMARKS)})")
+            continue
+
+        print("=" * 60)
+        print(f"벤치마크: {name}")
+        print("=" * 60)
+        print(BENCHMARKS[name]())
@@ -0,0 +1,135 @@
+"""
+코퍼스 아레나 모듈
+- 원본 문서 문자열을 복사 없이 한 곳에 보관 (문서당 문자열 하나)
+- 청크는 (doc_id, chunk_id, start, end) 오프셋 레코드로만 표현
+- 본문 문자열은 임베딩/프롬프트에 넣을 때만 잘라서 생성
+
+고정 크기 + 중복(overlap) 분할에서 청크마다 text[start:end] 복사본과
+메타데이터 dict 복사본을 만들지 않으므로, 대용량 판례 덤프에서 메모리를 크게 줄임
+
+사용법:
+    arena = CorpusArena.from_documents(docs)
+    spans = SimpleSplitter().split_spans(arena)
+
+    texts = arena.texts(spans[:32])        # 임베딩할 때만 문자열 생성
+    doc = arena.to_document(spans[0])      # LangChain 경계에서만 Document 생성
+"""
+from typing import List, Dict, Tuple, Iterable, Iterator, NamedTuple, Optional
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from langchain.schema import Document
+
+
+def fixed_size_spans(length: int, chunk_size: int, chunk_overlap: int) -> Iterator[Tuple[int, int]]:
+    """
+    고정 크기 + 중복 분할의 (start, end) 오프셋 생성
+
+    SimpleSplitter / UnifiedDocumentLoader가 쓰던 while 루프와 같은 경계
+
+    Args:
+        length: 전체 글자 수
+        chunk_size: 청크 크기 (글자)
+        chunk_overlap: 중복 크기 (글자)
+    """
+    start = 0
+
+    while start < length:
+        end = start + chunk_size
+        yield start, min(end, length)
+        start = end - chunk_overlap
+
+
+class ChunkSpan(NamedTuple):
+    """아레나 안의 청크 위치 (문서 기준 글자 오프셋)"""
+    doc_id: int
+    chunk_id: int
+    start: int
+    end: int
+
+
+class CorpusArena:
+    """
+    여러 문서를 보관하고 청크를 오프셋으로만 가리키는 아레나
+
+    - 문서 본문은 읽어 둔 문자열을 그대로 참조 (추가 복사 없음)
+    - 문서 메타데이터는 문서당 하나만 보관하고 청크끼리 공유
+    """
+
+    def __init__(self):
+        self._texts: List[str] = []
+        self._metadata: List[Dict] = []
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Document]) -> "CorpusArena":
+        """Document들로 아레나 생성 (page_content는 복사하지 않고 참조)"""
+        arena = cls()
+        for doc in documents:
+            arena.add(doc.page_content, doc.metadata)
+        return arena
+
+    def add(self, text: str, metadata: Optional[Dict] = None) -> int:
+        """
+        문서 하나 추가
+
+        Args:
+            text: 문서 내용
+            metadata: 문서 메타데이터 (청크들이 공유)
+
+        Returns:
+            doc_id
+        """
+        self._texts.append(text)
+        self._metadata.append(dict(metadata or {}))
+        return len(self._texts) - 1
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def doc_length(self, doc_id: int) -> int:
+        """문서 글자 수"""
+        return len(self._texts[doc_id])
+
+    def metadata(self, doc_id: int) -> Dict:
+        """문서 메타데이터 (공유 객체, 수정 주의)"""
+        return self._metadata[doc_id]
+
+    def text(self, span: ChunkSpan) -> str:
+        """청크 본문 문자열 생성"""
+        return self._texts[span.doc_id][span.start:span.end]
+
+    def texts(self, spans: Iterable[ChunkSpan]) -> List[str]:
+        """여러 청크 본문을 한 번에 생성 (임베딩 배치용)"""
+        return [self.text(span) for span in spans]
+
+    def to_document(self, span: ChunkSpan) -> Document:
+        """
+        청크를 LangChain Document로 변환
+
+        메타데이터 형식은 SimpleSplitter 결과와 같음 (문서 메타데이터 + chunk_id)
+        """
+        metadata = dict(self._metadata[span.doc_id])
+        metadata["chunk_id"] = span.chunk_id
+        return Document(page_content=self.text(span), metadata=metadata)
+
+    def iter_documents(self, spans: Iterable[ChunkSpan]) -> Iterator[Document]:
+        """청크들을 Document로 하나씩 변환"""
+        for span in spans:
+            yield self.to_document(span)
+
+    def fixed_spans(self, doc_id: int, chunk_size: int, chunk_overlap: int) -> List[ChunkSpan]:
+        """
+        문서 하나를 고정 크기로 분할한 청크 레코드
+
+        Args:
+            doc_id: 문서 번호
+            chunk_size: 청크 크기 (글자)
+            chunk_overlap: 중복 크기 (글자)
+        """
+        return [
+            ChunkSpan(doc_id, chunk_id, start, end)
+            for chunk_id, (start, end) in enumerate(
+                fixed_size_spans(len(self._texts[doc_id]), chunk_size, chunk_overlap), 1
+            )
+        ]
@@ -3,7 +3,7 @@
 파일을 읽으면서 바로 청킹까지 완료
 """
 
-import re
+import os
 import json
 
 from start import path_extend
@@ -14,12 +14,18 @@ logger = setup_logger(__name__)
 logger.info(f"document_load_and_split.py 활성화")
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple, Iterator, Optional
 
 from langchain.schema import Document
 from langchain_community.chat_models import ChatOllama
 from langchain.schema import HumanMessage
 
+from ingest_manifest import IngestManifest, content_hash
+from ingest_checkpoint import IngestCheckpoint
+from metadata_cache import MetadataCache
+from corpus_arena import CorpusArena, ChunkSpan, fixed_size_spans
+from article_scanner import iter_articles
+
 
 # 통합 문서 로더
 
@@ -28,20 +34,49 @@ class UnifiedDocumentLoader:
     파일 읽기 + 청킹을 한 번에 처리하는 로더
     """
     
+    # 문서 타입 → (하위 폴더, 파일 패턴)
+    CATEGORIES = {
+        "law": ("laws", ("*.txt",)),
+        "faq": ("faqs", ("*.txt", "*.md")),
+        "case": ("cases", ("*.txt",)),
+    }
+    
+    # FAQ/판례 고정 크기 분할 설정 (글자)
+    CHUNK_SIZE = 1000
+    CHUNK_OVERLAP = 100
+    
+    # _generate_metadata 프롬프트를 바꾸면 올릴 것 (메타데이터 캐시 키에 포함)
+    PROMPT_VERSION = "unified-v1"
+    
     def __init__(
         self,
         data_dir: str = "data/raw",
         use_llm: bool = True,
-        ollama_model: str = "qwen2.5:1.5b"
+        ollama_model: str = "qwen2.5:1.5b",
+        incremental: bool = False,
+        processed_dir: str = "data/processed",
+        llm_cache: bool = True,
+        checkpoint: bool = False,
+        resume: bool = False
     ):
         """
         Args:
             data_dir: 데이터 폴더
             use_llm: 메타데이터 생성 여부
             ollama_model: Ollama 모델
+            incremental: True면 바뀌지 않은 파일은 건너뛰고 이전 청크 재사용
+            processed_dir: 매니페스트/청크 캐시 폴더
+            llm_cache: True면 조항별 LLM 메타데이터를 processed_dir에 캐시
+            checkpoint: True면 LLM 메타데이터까지 끝난 법령 청크를 processed_dir에 주기적으로 기록
+            resume: True면 기존 체크포인트를 읽어서 끝난 (source, chunk_id)는 건너뜀 (checkpoint 포함)
         """
         self.data_dir = Path(data_dir)
         self.use_llm = use_llm
+        self.ollama_model = ollama_model
+        
+        # 청크 캐시 구분용 파이프라인 이름 (LLM 모델이 바뀌면 캐시도 달라짐)
+        self.pipeline = f"unified:{ollama_model if use_llm else 'no-llm'}"
+        self.manifest = IngestManifest(processed_dir) if incremental else None
         
         if not self.data_dir.exists():
             raise FileNotFoundError(f"폴더 없음: {self.data_dir}")
@@ -53,12 +88,38 @@ class UnifiedDocumentLoader:
         else:
             self.llm = None
             logger.info("LLM 비활성화")
+        
+        self.metadata_cache = (
+            MetadataCache(str(Path(processed_dir) / "llm_metadata.sqlite"))
+            if self.use_llm and llm_cache else None
+        )
+        
+        # 오래 걸리는 LLM 단계만 체크포인트 (FAQ/판례 분할은 다시 해도 금방 끝남)
+        self.checkpoint = (
+            IngestCheckpoint(processed_dir, self.pipeline, resume=resume)
+            if self.use_llm and (checkpoint or resume) else None
+        )
     
-    def _generate_metadata(self, text: str) -> Dict:
-        """LLM으로 메타데이터 생성"""
+    def _generate_metadata(self, text: str) -> Optional[Dict]:
+        """
+        LLM으로 메타데이터 생성 (캐시 조회 → LLM 요청 → 캐시 저장)
+        
+        파일/조항을 하나씩 순서대로 처리하므로 같은 조항 동시 요청 합치기(싱글 플라이트)는 쓰지 않음
+        (동시 요청은 MetadataGenerator.agenerate_many에서 합침)
+        
+        Returns:
+            메타데이터 (LLM 요청/파싱에 실패하면 None → 체크포인트에 남기지 않고 다음 실행에서 재시도)
+        """
         if not self.use_llm or not self.llm:
             return {"title": "", "keywords": []}
         
+        cache_key = MetadataCache.make_key(text, self.ollama_model, self.PROMPT_VERSION)
+        
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         text_preview = text[:300]
         
         prompt = f"""다음 법률 조항을 분석하여 제목과 키워드 5개를 추출하세요.
@@ -76,154 +137,258 @@ JSON 형식으로 출력:
             json_end = result.rfind('}') + 1
             
             if json_start != -1 and json_end > json_start:
-                return json.loads(result[json_start:json_end])
+                metadata = json.loads(result[json_start:json_end])
+                
+                if self.metadata_cache is not None:
+                    self.metadata_cache.put(cache_key, metadata)
+                
+                return metadata
             
         except Exception as e:
             logger.debug(f"메타데이터 생성 실패: {e}")
         
-        return {"title": "", "keywords": []}
+        return None
     
-    def _split_law_text(self, text: str, source_path: str) -> List[Document]:
-        """
-        법령 텍스트를 조항 단위로 분할하면서 Document 생성
+    def _iter_law_chunks(self, text: str, source_path: str, generate: bool = True) -> Iterator[Document]:
         """
-        # 조항 패턴
-        pattern = r'(제\s*\d+\s*조(?:의\s*\d+)?)'
-        chunks = re.split(pattern, text)
+        법령 텍스트를 조항 단위로 분할하면서 Document 생성 (제너레이터)
         
-        documents = []
+        체크포인트가 있으면 이미 끝난 chunk_id는 LLM 요청 없이 기록된 청크 사용
         
-        for i in range(1, len(chunks), 2):
-            if i + 1 < len(chunks):
-                article_num = chunks[i].strip()
-                article_content = chunks[i + 1].strip()
-                
-                if len(article_content) < 50:
-                    continue
-                
-                full_text = f"{article_num}\n{article_content}"
-                
-                # 메타데이터 생성
-                llm_meta = self._generate_metadata(full_text)
-                
-                # Document 생성 (바로!)
-                doc = Document(
-                    page_content=full_text,
-                    metadata={
-                        "source": source_path,
-                        "type": "law",
-                        "chunk_id": len(documents) + 1,
-                        "article_num": article_num,
-                        "title": llm_meta.get("title", article_num),
-                        "keywords": llm_meta.get("keywords", [])
-                    }
-                )
-                
-                documents.append(doc)
-                logger.info(f"✓ {article_num}: {doc.metadata['title']}")
-        
-        return documents
-    
-    def _split_simple_text(self, text: str, source_path: str, doc_type: str) -> List[Document]:
-        """
-        FAQ/판례를 단순 분할하면서 Document 생성
+        Args:
+            generate: False면 LLM 메타데이터 없이 분할만 (제목 = 조항 번호, 키워드 없음)
         """
-        chunk_size = 1000
-        chunk_overlap = 100
+        chunk_id = 0
         
-        documents = []
-        start = 0
-        chunk_id = 1
+        done, sha256 = {}, None
+        if generate and self.checkpoint is not None:
+            sha256 = content_hash(text)
+            done = self.checkpoint.completed(source_path, sha256)
         
-        while start < len(text):
-            end = start + chunk_size
-            chunk_text = text[start:end]
+        for article_num, full_text in iter_articles(text):
+            chunk_id += 1
+            
+            if chunk_id in done:
+                self.checkpoint.skip()
+                yield done[chunk_id]
+                continue
             
+            # 메타데이터 생성 (실패하면 빈 제목/키워드)
+            llm_meta = self._generate_metadata(full_text) if generate else {}
+            generated = llm_meta is not None
+            if not generated:
+                llm_meta = {"title": "", "keywords": []}
+            
+            # Document 생성 (바로!)
             doc = Document(
-                page_content=chunk_text,
+                page_content=full_text,
+                metadata={
+                    "source": source_path,
+                    "type": "law",
+                    "chunk_id": chunk_id,
+                    "article_num": article_num,
+                    "title": llm_meta.get("title", article_num),
+                    "keywords": llm_meta.get("keywords", [])
+                }
+            )
+            
+            logger.info(f"✓ {article_num}: {doc.metadata['title']}")
+            
+            # 생성에 실패한 조항은 기록하지 않음 → 재개할 때 다시 요청
+            if sha256 is not None and generated:
+                self.checkpoint.add(source_path, sha256, doc)
+            
+            yield doc
+    
+    def _split_law_text(self, text: str, source_path: str) -> List[Document]:
+        """
+        법령 텍스트를 조항 단위로 분할하면서 Document 생성
+        """
+        return list(self._iter_law_chunks(text, source_path))
+    
+    def _iter_simple_chunks(self, text: str, source_path: str, doc_type: str) -> Iterator[Document]:
+        """
+        FAQ/판례를 단순 분할하면서 Document 생성 (제너레이터)
+        """
+        for chunk_id, (start, end) in enumerate(
+            fixed_size_spans(len(text), self.CHUNK_SIZE, self.CHUNK_OVERLAP), 1
+        ):
+            yield Document(
+                page_content=text[start:end],
                 metadata={
                     "source": source_path,
                     "type": doc_type,
                     "chunk_id": chunk_id
                 }
             )
+    
+    def _split_simple_text(self, text: str, source_path: str, doc_type: str) -> List[Document]:
+        """
+        FAQ/판례를 단순 분할하면서 Document 생성
+        """
+        return list(self._iter_simple_chunks(text, source_path, doc_type))
+    
+    def split_text(self, text: str, source_path: str, doc_type: str) -> List[Document]:
+        """
+        LLM 메타데이터 없이 분할만 (메타데이터를 따로 채우는 파이프라인용)
+        
+        법령 청크는 title = 조항 번호, keywords = [] 로 채워짐
+        
+        Args:
+            text: 원본 내용
+            source_path: 원본 경로
+            doc_type: law / faq / case
+        """
+        if doc_type == "law":
+            return list(self._iter_law_chunks(text, source_path, generate=False))
+        return self._split_simple_text(text, source_path, doc_type)
+    
+    def iter_files(self, doc_type: str) -> Iterator[Path]:
+        """
+        문서 타입에 해당하는 파일 경로들
+        
+        Args:
+            doc_type: law / faq / case
+        """
+        sub_dir, patterns = self.CATEGORIES[doc_type]
+        directory = self.data_dir / sub_dir
+        
+        if not directory.exists():
+            logger.warning(f"폴더 없음: {directory}")
+            return
+        
+        for pattern in patterns:
+            yield from directory.glob(pattern)
+    
+    def iter_file_chunks(self, file_path: Path, doc_type: str) -> Iterator[Document]:
+        """
+        파일 하나를 읽어서 청크를 하나씩 yield
+        
+        Args:
+            file_path: 파일 경로
+            doc_type: law / faq / case
+        """
+        # 증분 모드: 바뀌지 않은 파일은 읽지 않고 캐시 사용
+        if self.manifest is not None:
+            cached = self.manifest.lookup_file(file_path, self.pipeline)
+            if cached is not None:
+                yield from cached
+                return
+        
+        # 파일 읽기 (매니페스트 mtime/크기는 읽기 전 stat으로 기록)
+        stat = os.stat(file_path) if self.manifest is not None else None
+        with open(file_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        
+        # 읽으면서 바로 청킹
+        if doc_type == "law":
+            chunks = self._iter_law_chunks(text, str(file_path))
+        else:
+            chunks = self._iter_simple_chunks(text, str(file_path), doc_type)
+        
+        if self.manifest is None:
+            yield from chunks
+            return
+        
+        produced = []
+        for chunk in chunks:
+            produced.append(chunk)
+            yield chunk
+        
+        self.manifest.record(str(file_path), text, produced, self.pipeline, stat=stat)
+    
+    def iter_chunks(self, doc_type: str) -> Iterator[Document]:
+        """
+        한 문서 타입의 청크를 파일 단위로 스트리밍
+        
+        한 번에 파일 하나의 청크만 메모리에 올라감
+        
+        Args:
+            doc_type: law / faq / case
+        """
+        for file_path in self.iter_files(doc_type):
+            logger.debug(f"파일: {file_path.name}")
             
-            documents.append(doc)
+            count = 0
+            for chunk in self.iter_file_chunks(file_path, doc_type):
+                count += 1
+                yield chunk
             
-            start = end - chunk_overlap
-            chunk_id += 1
+            logger.debug(f"→ {file_path.name}: {count}개 청크")
+        
+        if self.manifest is not None:
+            self.manifest.save()
+            logger.info(f"매니페스트: {self.manifest.stats()}")
         
-        return documents
+        if self.checkpoint is not None:
+            self.checkpoint.flush()
+            logger.info(f"체크포인트: {self.checkpoint.stats()}")
     
-    def load_laws(self) -> List[Document]:
-        """법령 로드 + 청킹"""
-        laws_dir = self.data_dir / "laws"
+    def iter_all(self) -> Iterator[Document]:
+        """
+        모든 문서의 청크를 법령 → FAQ → 판례 순으로 스트리밍
+        
+        Example:
+            >>> for chunk in loader.iter_all():
+            ...     store(chunk)
+        """
+        for doc_type in self.CATEGORIES:
+            yield from self.iter_chunks(doc_type)
+    
+    def load_arena(self, doc_types: Tuple[str, ...] = ("faq", "case")) -> Tuple[CorpusArena, List[ChunkSpan]]:
+        """
+        FAQ/판례 파일을 하나의 아레나 버퍼에 읽고 오프셋 레코드로 분할
+        
+        청크 본문/메타데이터 복사본을 만들지 않으므로 대용량 판례 덤프에 적합.
+        법령은 "조항번호 + 줄바꿈 + 내용" 형태로 본문을 새로 만들기 때문에 대상 아님
+        
+        Args:
+            doc_types: 아레나에 넣을 문서 타입 (faq / case)
+            
+        Returns:
+            (CorpusArena, ChunkSpan 리스트) - iter_all()과 같은 경계/chunk_id
+        """
+        if "law" in doc_types:
+            raise ValueError("법령은 아레나 모드를 지원하지 않습니다 (faq, case만 가능)")
         
-        if not laws_dir.exists():
-            logger.warning(f"폴더 없음: {laws_dir}")
-            return []
+        arena = CorpusArena()
+        spans = []
         
+        for doc_type in doc_types:
+            for file_path in self.iter_files(doc_type):
+                with open(file_path, "r", encoding="utf-8") as f:
+                    doc_id = arena.add(f.read(), {"source": str(file_path), "type": doc_type})
+                
+                spans.extend(arena.fixed_spans(doc_id, self.CHUNK_SIZE, self.CHUNK_OVERLAP))
+        
+        logger.info(f"✓ 아레나: {len(arena)}개 문서, {len(spans)}개 청크")
+        return arena, spans
+    
+    def load_laws(self) -> List[Document]:
+        """법령 로드 + 청킹"""
         logger.info("=" * 50)
         logger.info("법령 로드 + 청킹")
         logger.info("=" * 50)
         
-        all_chunks = []
-        
-        # .txt 파일들
-        for file_path in laws_dir.glob("*.txt"):
-            logger.info(f"\n파일: {file_path.name}")
-            
-            # 파일 읽기
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
-            
-            # 읽으면서 바로 청킹
-            chunks = self._split_law_text(text, str(file_path))
-            all_chunks.extend(chunks)
-            
-            logger.info(f"→ {len(chunks)}개 청크")
+        all_chunks = list(self.iter_chunks("law"))
         
         logger.info(f"\n✅ 법령 총 {len(all_chunks)}개 청크")
         return all_chunks
     
     def load_faqs(self) -> List[Document]:
         """FAQ 로드 + 청킹"""
-        faqs_dir = self.data_dir / "faqs"
-        
-        if not faqs_dir.exists():
-            return []
-        
         logger.info("\nFAQ 로드 + 청킹")
         
-        all_chunks = []
-        
-        for file_path in list(faqs_dir.glob("*.txt")) + list(faqs_dir.glob("*.md")):
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
-            
-            chunks = self._split_simple_text(text, str(file_path), "faq")
-            all_chunks.extend(chunks)
+        all_chunks = list(self.iter_chunks("faq"))
         
         logger.info(f"✓ FAQ {len(all_chunks)}개 청크")
         return all_chunks
     
     def load_cases(self) -> List[Document]:
         """판례 로드 + 청킹"""
-        cases_dir = self.data_dir / "cases"
-        
-        if not cases_dir.exists():
-            return []
-        
         logger.info("\n판례 로드 + 청킹")
         
-        all_chunks = []
-        
-        for file_path in cases_dir.glob("*.txt"):
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
-            
-            chunks = self._split_simple_text(text, str(file_path), "case")
-            all_chunks.extend(chunks)
+        all_chunks = list(self.iter_chunks("case"))
         
         logger.info(f"✓ 판례 {len(all_chunks)}개 청크")
         return all_chunks
@@ -232,6 +397,8 @@ JSON 형식으로 출력:
         """
         모든 문서 로드 + 청킹 (한 번에!)
         
+        청크를 모두 리스트로 모음. 메모리를 아끼려면 iter_all() 사용
+        
         Returns:
             청크된 Document 리스트
         """
@@ -1,19 +1,19 @@
 """
 문서 로더 모듈
-LangChain의 Document와 DirectoryLoader 활용
+LangChain의 Document 활용
+- os.scandir 한 번의 탐색으로 여러 확장자 파일 수집
 """
+import os
+import time
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from start import path_extend
 path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
 
 # LangChain 임포트
 from langchain.schema import Document
-from langchain_community.document_loaders import (
-    DirectoryLoader,
-    TextLoader
-)
 from config.logging_config import setup_logger
 
 logger = setup_logger("document_loader")
@@ -27,12 +27,31 @@ class DocumentLoader:
     - 파일 '내용 전체'를 읽어서 Document로
     """
     
-    def __init__(self, data_dir: str = "data/raw"):
+    # 카테고리 키 → (하위 폴더, 문서 타입). load_all 결과 순서도 이 순서를 따름
+    CATEGORIES = {
+        "laws": ("laws", "law"),
+        "faqs": ("faqs", "faq"),
+        "cases": ("cases", "case"),
+    }
+    
+    def __init__(
+        self,
+        data_dir: str = "data/raw",
+        max_workers: int = 8,
+        extensions: Iterable[str] = (".txt", ".md")
+    ):
         """
         Args:
             data_dir: 데이터 폴더 경로
+            max_workers: 병렬 로딩 시 스레드 풀 최대 크기
+            extensions: 로드할 파일 확장자 (이 순서대로 결과 정렬, 대소문자 구분)
         """
         self.data_dir = Path(data_dir)
+        self.max_workers = max_workers
+        self.extensions = tuple(extensions)
+        
+        # 카테고리별 로딩 소요 시간 (초)
+        self.load_timings: Dict[str, float] = {}
         
         logger.info(f"DocumentLoader 초기화: {self.data_dir}")
         
@@ -44,7 +63,7 @@ class DocumentLoader:
     
     def load_laws(self) -> List[Document]:
         """
-        법령 문서들 로드 (LangChain DirectoryLoader 사용)
+        법령 문서들 로드
         
         Returns:
             Document 리스트 (LangChain Document)
@@ -65,9 +84,76 @@ class DocumentLoader:
         cases_dir = self.data_dir / "cases"
         return self._load_from_directory(cases_dir, doc_type="case")
     
+    def _list_files(self, directory: Path) -> List[Path]:
+        """
+        폴더를 os.scandir로 한 번만 탐색해서 로드 대상 파일 수집
+        
+        확장자 그룹(self.extensions 순서) → 경로 순으로 정렬
+        
+        DirectoryLoader(glob="**/*.txt", load_hidden=False)와 같은 결과:
+        - "."으로 시작하는 파일/폴더(.ipynb_checkpoints 등)는 건너뜀
+        - 확장자는 대소문자 구분 (UP.TXT는 .txt 아님)
+        - 심볼릭 링크 폴더로는 들어가지 않음 (순환 방지)
+        
+        Args:
+            directory: 폴더 경로
+            
+        Returns:
+            파일 경로 리스트
+        """
+        matched = {ext: [] for ext in self.extensions}
+        stack = [str(directory)]
+        
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        ext = os.path.splitext(entry.name)[1]
+                        if ext in matched:
+                            matched[ext].append(entry.path)
+        
+        files = []
+        for ext in self.extensions:
+            files.extend(Path(p) for p in sorted(matched[ext]))
+        return files
+    
+    def _load_file(self, file_path: Path, doc_type: str) -> List[Document]:
+        """
+        파일 하나를 Document로 로드 (한 번에 전체 읽기)
+        
+        Args:
+            file_path: 파일 경로
+            doc_type: 문서 타입 (law/faq/case)
+            
+        Returns:
+            Document 리스트
+        """
+        text = file_path.read_bytes().decode("utf-8")
+        
+        # 텍스트 모드 open()과 같은 줄바꿈 정규화
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        
+        doc = Document(
+            page_content=text,
+            metadata={
+                "source": str(file_path),
+                "type": doc_type,
+                "size": len(text)
+            }
+        )
+        logger.debug(f"문서 로드: {doc.metadata['source']} ({doc.metadata['size']} 글자)")
+        
+        return [doc]
+    
     def _load_from_directory(self, directory: Path, doc_type: str) -> List[Document]:
         """
-        특정 폴더의 모든 파일 로드 (LangChain 활용)
+        특정 폴더의 모든 파일 로드
         
         Args:
             directory: 폴더 경로
@@ -85,67 +171,108 @@ class DocumentLoader:
         documents = []
         
         try:
-            # LangChain의 DirectoryLoader 사용
-            # glob="**/*.txt" : 모든 .txt 파일
-            # loader_cls=TextLoader : 텍스트 파일 로더
-            txt_loader = DirectoryLoader(
-                str(directory),
-                glob="**/*.txt",
-                loader_cls=TextLoader,
-                loader_kwargs={'encoding': 'utf-8'}
-            )
-            txt_docs = txt_loader.load()
-            
-            # .md 파일도 로드
-            md_loader = DirectoryLoader(
-                str(directory),
-                glob="**/*.md",
-                loader_cls=TextLoader,
-                loader_kwargs={'encoding': 'utf-8'}
-            )
-            md_docs = md_loader.load()
-            
-            # 합치기
-            all_docs = txt_docs + md_docs
-            
-            # 메타데이터에 타입 추가
-            for doc in all_docs:
-                doc.metadata['type'] = doc_type
-                doc.metadata['size'] = len(doc.page_content)
-                logger.debug(f"문서 로드: {doc.metadata.get('source')} ({doc.metadata['size']} 글자)")
+            for file_path in self._list_files(directory):
+                documents.extend(self._load_file(file_path, doc_type))
             
-            documents = all_docs
             logger.info(f"✓ {directory.name}에서 {len(documents)}개 문서 로드 완료")
             
         except Exception as e:
             logger.error(f"폴더 로딩 중 에러: {directory}")
             logger.error(f"에러 내용: {str(e)}")
+            documents = []
         
         return documents
     
-    def load_all(self) -> Dict[str, List[Document]]:
+    def load_all(self, parallel: bool = False) -> Dict[str, List[Document]]:
         """
         모든 문서 로드
         
+        Args:
+            parallel: True면 스레드 풀로 카테고리/파일을 동시에 읽음
+            
         Returns:
-            카테고리별 Document 딕셔너리
+            카테고리별 Document 딕셔너리 (laws → faqs → cases 순서)
         """
         logger.info("=" * 50)
-        logger.info("전체 문서 로딩 시작")
+        logger.info(f"전체 문서 로딩 시작 ({'병렬' if parallel else '순차'})")
         logger.info("=" * 50)
         
-        all_docs = {
-            "laws": self.load_laws(),
-            "faqs": self.load_faqs(),
-            "cases": self.load_cases()
-        }
+        if parallel:
+            all_docs = self._load_all_parallel()
+        else:
+            all_docs = {}
+            loaders = {
+                "laws": self.load_laws,
+                "faqs": self.load_faqs,
+                "cases": self.load_cases
+            }
+            for category, load in loaders.items():
+                started = time.perf_counter()
+                all_docs[category] = load()
+                self.load_timings[category] = time.perf_counter() - started
         
         # 통계
         total = sum(len(docs) for docs in all_docs.values())
         logger.info(f"✅ 총 {total}개 문서 로드 완료")
         
         for category, docs in all_docs.items():
-            logger.info(f"  - {category}: {len(docs)}개")
+            logger.info(f"  - {category}: {len(docs)}개 ({self.load_timings.get(category, 0.0):.3f}초)")
+        
+        return all_docs
+    
+    def _load_all_parallel(self) -> Dict[str, List[Document]]:
+        """
+        세 카테고리의 파일들을 하나의 스레드 풀에서 동시에 로드
+        
+        결과는 카테고리 순서, 카테고리 안에서는 파일 목록 순서를 그대로 유지
+        
+        Returns:
+            카테고리별 Document 딕셔너리
+        """
+        def timed_load(file_path: Path, doc_type: str):
+            docs = self._load_file(file_path, doc_type)
+            return docs, time.perf_counter()
+        
+        all_docs = {}
+        started = time.perf_counter()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 1. 모든 파일 작업을 먼저 제출
+            futures = {}
+            for category, (sub_dir, doc_type) in self.CATEGORIES.items():
+                directory = self.data_dir / sub_dir
+                
+                if not directory.exists():
+                    logger.warning(f"폴더가 없습니다: {directory}")
+                    futures[category] = []
+                    continue
+                
+                logger.debug(f"폴더 탐색: {directory}")
+                futures[category] = [
+                    executor.submit(timed_load, file_path, doc_type)
+                    for file_path in self._list_files(directory)
+                ]
+            
+            # 2. 제출 순서대로 결과 수집 (결정적 순서)
+            for category, category_futures in futures.items():
+                documents = []
+                finished = started
+                
+                try:
+                    for future in category_futures:
+                        docs, done_at = future.result()
+                        documents.extend(docs)
+                        finished = max(finished, done_at)
+                    
+                    logger.info(f"✓ {category}에서 {len(documents)}개 문서 로드 완료")
+                    
+                except Exception as e:
+                    logger.error(f"폴더 로딩 중 에러: {self.data_dir / self.CATEGORIES[category][0]}")
+                    logger.error(f"에러 내용: {str(e)}")
+                    documents = []
+                
+                all_docs[category] = documents
+                self.load_timings[category] = finished - started
         
         return all_docs
 
@@ -193,6 +320,14 @@ if __name__ == "__main__":
         loader = DocumentLoader()
         all_documents = loader.load_all()
         
+        # 병렬 로딩 결과가 순차 로딩과 같은지 확인
+        parallel_documents = loader.load_all(parallel=True)
+        same = all(
+            [d.page_content for d in all_documents[c]] == [d.page_content for d in parallel_documents[c]]
+            for c in all_documents
+        )
+        print(f"\n병렬 로딩 결과 일치: {same} (카테고리별 시간: {loader.load_timings})")
+        
         # 간단한 요약
         print("\n" + "=" * 50)
         print("로드된 문서 요약")
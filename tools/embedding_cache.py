@@ -0,0 +1,208 @@
+"""
+임베딩 캐시 모듈 (내용 주소 방식)
+- 키 = sha256(모델명 + 정규화한 텍스트) → 같은 청크는 Weaviate 클래스를 다시 만들어도 재임베딩 안 함
+- 벡터는 float16 원시 파일에 이어 쓰기만 하고(append-only), 열 때 np.memmap으로 매핑
+    → 캐시가 커도 전부 메모리에 올리지 않고 필요한 행만 읽음
+- 키 파일의 n번째 32바이트 다이제스트 = 벡터 파일의 n번째 행 (해시 → 행 번호 색인)
+
+저장 위치 (모델마다 폴더 하나):
+    data/processed/embedding_cache/<모델 해시>/meta.json     # 모델명, 차원
+    data/processed/embedding_cache/<모델 해시>/keys.bin      # 행마다 sha256 32바이트
+    data/processed/embedding_cache/<모델 해시>/vectors.f16   # 행마다 float16 × 차원
+
+사용법:
+    cache = EmbeddingCache(model="bona/bge-m3-korean:latest")
+
+    matrix, missing = cache.get_many(texts)      # 찾은 행은 채워진 float32 행렬, 못 찾은 인덱스
+    ...                                          # missing만 임베딩
+    cache.put_many([texts[i] for i in missing], new_vectors)
+
+    print(cache.stats())   # {"hits": ..., "misses": ..., "rows": ..., "bytes": ...}
+"""
+import os
+import re
+import json
+import hashlib
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("embedding_cache")
+
+DEFAULT_CACHE_DIR = "data/processed/embedding_cache"
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# sha256 다이제스트 길이 (키 파일 한 행)
+_KEY_BYTES = 32
+
+
+def normalize_text(text: str) -> str:
+    """NFC 정규화 + 연속 공백을 하나로 + 앞뒤 공백 제거"""
+    return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class EmbeddingCache:
+    """
+    (모델, 정규화 텍스트) → float16 벡터 행 디스크 캐시
+
+    한 프로세스에서 하나만 쓰는 것을 가정 (스레드끼리는 잠금으로 보호)
+    비정상 종료로 키/벡터 파일 행 수가 어긋나면 열 때 짧은 쪽에 맞춰 자름 (한쪽 파일이 없으면 0행)
+    """
+
+    def __init__(self, model: str, directory: str = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            model: 임베딩 모델명 (모델마다 다른 폴더)
+            directory: 캐시 최상위 폴더
+        """
+        self.model = model
+        self.directory = Path(directory) / hashlib.sha256(model.encode("utf-8")).hexdigest()[:16]
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._meta_path = self.directory / "meta.json"
+        self._keys_path = self.directory / "keys.bin"
+        self._vectors_path = self.directory / "vectors.f16"
+
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, int] = {}
+        self._rows = 0
+        self._mapped: Optional[np.memmap] = None
+        self.dim: Optional[int] = None
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+        self._open()
+
+    def _open(self) -> None:
+        """메타/키 파일 읽기 + 행 수 맞추기"""
+        if self._meta_path.exists():
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                self.dim = json.load(f)["dim"]
+
+        if self.dim is None:
+            return
+
+        # 한쪽 파일이 없으면 0행으로 보고 다른 쪽도 비움 (남은 벡터 행이 새 키와 어긋나지 않게)
+        self._keys_path.touch()
+        self._vectors_path.touch()
+
+        key_rows = self._keys_path.stat().st_size // _KEY_BYTES
+        vector_rows = self._vectors_path.stat().st_size // (2 * self.dim)
+        rows = min(key_rows, vector_rows)
+
+        if key_rows != vector_rows:
+            logger.warning(f"임베딩 캐시 행 수 불일치 (키 {key_rows}, 벡터 {vector_rows}) → {rows}행으로 자름")
+        os.truncate(self._keys_path, rows * _KEY_BYTES)
+        os.truncate(self._vectors_path, rows * 2 * self.dim)
+
+        with open(self._keys_path, "rb") as f:
+            keys = f.read()
+
+        self._index = {keys[i * _KEY_BYTES:(i + 1) * _KEY_BYTES]: i for i in range(rows)}
+        self._rows = rows
+        logger.info(f"임베딩 캐시 열기: {self.directory} ({rows}행, {self.dim}차원)")
+
+    def make_key(self, text: str) -> bytes:
+        """sha256(모델명 + 정규화 텍스트) 다이제스트"""
+        return hashlib.sha256(f"{self.model}\0{normalize_text(text)}".encode("utf-8")).digest()
+
+    def _vectors(self) -> np.memmap:
+        """벡터 파일 매핑 (행이 늘었으면 다시 매핑, 잠금 안에서 호출)"""
+        if self._mapped is None or self._mapped.shape[0] != self._rows:
+            self._mapped = np.memmap(self._vectors_path, dtype=np.float16, mode="r", shape=(self._rows, self.dim))
+        return self._mapped
+
+    def get_many(self, texts: Sequence[str]) -> Tuple[Optional[np.ndarray], List[int]]:
+        """
+        캐시 조회
+
+        Returns:
+            (len(texts) × 차원 float32 행렬 - 찾은 행만 채워짐, 차원을 모르면 None,
+             못 찾은 텍스트 인덱스 리스트)
+        """
+        keys = [self.make_key(text) for text in texts]
+
+        with self._lock:
+            rows = [self._index.get(key) for key in keys]
+            missing = [i for i, row in enumerate(rows) if row is None]
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+            if self.dim is None:
+                return None, missing
+
+            matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+            found = [i for i, row in enumerate(rows) if row is not None]
+            if found:
+                matrix[found] = self._vectors()[[rows[i] for i in found]]
+
+        return matrix, missing
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray) -> int:
+        """
+        새 벡터를 파일 끝에 추가 (이미 있는 키와 같은 호출 안의 중복은 건너뜀)
+
+        Returns:
+            추가한 행 수
+        """
+        vectors = np.asarray(vectors)
+        if len(texts) == 0:
+            return 0
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                with open(self._meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"model": self.model, "dim": self.dim}, f)
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"임베딩 차원이 캐시와 다릅니다: {vectors.shape[1]} != {self.dim}")
+
+            new_keys, new_rows = [], []
+            for i, text in enumerate(texts):
+                key = self.make_key(text)
+                if key in self._index:
+                    continue
+                self._index[key] = self._rows + len(new_keys)
+                new_keys.append(key)
+                new_rows.append(i)
+
+            if not new_keys:
+                return 0
+
+            # 벡터 먼저, 키 나중 (중간에 죽으면 열 때 짧은 쪽에 맞춰 자름)
+            with open(self._vectors_path, "ab") as f:
+                f.write(vectors[new_rows].astype(np.float16).tobytes())
+            with open(self._keys_path, "ab") as f:
+                f.write(b"".join(new_keys))
+
+            self._rows += len(new_keys)
+
+        return len(new_keys)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스 수, 저장 행 수, 벡터 파일 크기"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rows": self._rows,
+            "bytes": self._rows * 2 * (self.dim or 0)
+        }
+
+    def close(self) -> None:
+        """매핑 해제"""
+        with self._lock:
+            self._mapped = None
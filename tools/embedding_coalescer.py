@@ -0,0 +1,197 @@
+"""
+질문 임베딩 마이크로 배치 모듈
+- 동시에 들어온 embed_query 호출을 짧은 시간(window_ms) 동안 모아서 embed_documents 한 번으로 요청
+- 결과를 기다리던 호출마다 나눠 줌 → HTTP/모델 호출 오버헤드를 질문마다가 아니라 묶음마다 한 번
+- 부하가 없을 때는 첫 질문이 window_ms만큼 늦어지는 대신, 부하가 많을 때 초당 처리량이 늘어남
+
+bge-m3처럼 질문/문서 임베딩 방식이 같은 모델용 (질문 접두어가 따로 있는 모델은 쓰지 말 것)
+
+사용법:
+    embedding = EmbeddingCoalescer(OllamaEmbeddings(model="bona/bge-m3-korean:latest"), window_ms=5, max_batch=32)
+    vector = embedding.embed_query("연차휴가는 며칠인가요?")        # 여러 스레드에서 동시에 호출
+    vector = await embedding.aembed_query("최저임금은 얼마인가요?")
+
+    # 질문 캐시와 같이 쓸 때: 캐시에 없는 질문만 묶음 요청
+    embedding = CachedQueryEmbeddings(EmbeddingCoalescer(OllamaEmbeddings(...)))
+
+    print(embedding.stats())   # {"queries": ..., "batches": ..., "avg_batch": ..., "max_batch": ...}
+"""
+import time
+import queue
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("embedding_coalescer")
+
+# 작업자 종료 표시
+_STOP = object()
+
+
+class EmbeddingCoalescer(Embeddings):
+    """
+    embed_query 마이크로 배치 Embeddings 래퍼
+
+    작업자 스레드 하나가 대기열에서 첫 질문을 꺼낸 뒤 window_ms 동안(또는 max_batch개가 찰 때까지)
+    더 모아서 embed_documents 요청을 보냄. 요청은 별도 스레드 풀(max_in_flight)에서 실행하므로
+    한 묶음을 기다리는 동안 다음 묶음을 모음
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        window_ms: float = 5.0,
+        max_batch: int = 32,
+        max_in_flight: int = 4
+    ):
+        """
+        Args:
+            embeddings: 감쌀 임베딩 모델 (OllamaEmbeddings 등)
+            window_ms: 첫 질문 뒤 더 모을 최대 시간 (밀리초, 2~10 권장)
+            max_batch: 묶음 하나의 최대 질문 수
+            max_in_flight: 동시에 보낼 묶음 요청 수
+        """
+        self.embeddings = embeddings
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.max_in_flight = max_in_flight
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+        # 통계
+        self.queries = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.failures = 0
+
+    # 작업자
+
+    def _ensure_worker(self) -> None:
+        """첫 호출 때 작업자 스레드 시작 (잠금 안에서 호출)"""
+        if self._worker is None:
+            self._executor = ThreadPoolExecutor(self.max_in_flight, thread_name_prefix="embed-batch")
+            self._worker = threading.Thread(target=self._run, name="embed-coalescer", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """대기열에서 묶음을 만들어 요청 스레드 풀로 넘김"""
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch: List[Tuple[str, Future]] = [first]
+            deadline = time.monotonic() + self.window
+            stop = False
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._executor.submit(self._embed_batch, batch)
+            if stop:
+                return
+
+    def _embed_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        """embed_documents 한 번으로 묶음 처리 후 결과 나눠 주기"""
+        with self._lock:
+            self.batches += 1
+            self.largest_batch = max(self.largest_batch, len(batch))
+
+        try:
+            vectors = self.embeddings.embed_documents([text for text, _ in batch])
+        except Exception as e:
+            with self._lock:
+                self.failures += 1
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        # 결과 수가 다르면 어느 질문의 벡터인지 알 수 없으므로 묶음 전체 실패
+        # (zip으로 남은 호출이 끝없이 기다리지 않게)
+        if len(vectors) != len(batch):
+            error = RuntimeError(f"임베딩 결과 수가 요청과 다릅니다: {len(vectors)} != {len(batch)}")
+            logger.error(str(error))
+            with self._lock:
+                self.failures += 1
+            for _, future in batch:
+                future.set_exception(error)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
+    def _submit(self, text: str) -> Future:
+        future: Future = Future()
+
+        # 닫힘 확인과 대기열 추가를 같은 잠금 안에서 → close가 넣은 _STOP 뒤로 들어가는 질문이 없음
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EmbeddingCoalescer가 이미 닫혔습니다")
+
+            self._ensure_worker()
+            self.queries += 1
+            self._queue.put((text, future))
+
+        return future
+
+    def close(self) -> None:
+        """작업자 종료 (대기 중인 묶음은 마저 처리, 닫은 뒤의 질문은 RuntimeError)"""
+        with self._lock:
+            if self._closed:
+                return
+
+            self._closed = True
+            worker, executor = self._worker, self._executor
+            if worker is not None:
+                self._queue.put(_STOP)
+
+        if worker is not None:
+            worker.join()
+            executor.shutdown(wait=True)
+
+    # Embeddings 인터페이스
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._submit(text).result()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.wrap_future(self._submit(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩은 이미 묶음이므로 그대로 전달"""
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def stats(self) -> Dict[str, float]:
+        """질문 수, 묶음 요청 수, 평균/최대 묶음 크기, 실패한 묶음 수"""
+        return {
+            "queries": self.queries,
+            "batches": self.batches,
+            "avg_batch": round(self.queries / self.batches, 1) if self.batches else 0.0,
+            "max_batch": self.largest_batch,
+            "failures": self.failures
+        }
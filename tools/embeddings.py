@@ -0,0 +1,237 @@
+"""
+임베딩 모듈 (Ollama bge-m3)
+- 분할기가 만든 청크를 길이순으로 정렬해서 묶음(batch)으로 임베딩
+    비슷한 길이끼리 묶여서 패딩 낭비가 줄고, 긴 묶음이 먼저 시작해서 마지막에 혼자 남지 않음
+- 묶음 여러 개를 동시에 요청 (max_concurrency)
+- 결과는 청크 순서에 맞춘 float32 NumPy 행렬 하나 (파이썬 float 리스트 아님)
+- (모델, 정규화 텍스트) 임베딩 캐시 → 바뀌지 않은 코퍼스로 벡터스토어를 다시 만들면 요청 0번
+
+사용법:
+    engine = EmbeddingEngine(batch_size=32, max_concurrency=4)
+
+    ids, matrix = engine.embed_chunks(chunks)     # ids[i] = (source, chunk_id), matrix[i] = 벡터
+    matrix = engine.embed_texts(["근로시간", ...])  # (텍스트 수, 차원) float32
+
+    print(engine.stats())
+"""
+import time
+import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+from embedding_cache import EmbeddingCache, DEFAULT_CACHE_DIR, normalize_text
+from sync_loop import run_sync
+
+logger = setup_logger("embeddings")
+
+DEFAULT_EMBEDDING_MODEL = "bona/bge-m3-korean:latest"
+
+
+def chunk_key(chunk) -> Tuple[str, int]:
+    """Document 또는 Chunk 레코드의 (source, chunk_id)"""
+    if hasattr(chunk, "metadata"):
+        return chunk.metadata.get("source", ""), chunk.metadata.get("chunk_id", 0)
+    return chunk.source_meta.get("source", ""), chunk.chunk_id
+
+
+class EmbeddingEngine:
+    """
+    길이순 묶음 + 동시 요청 임베딩 엔진
+
+    묶음 크기는 개수(batch_size)와 글자 수 합(max_batch_chars) 둘 다로 제한
+    (긴 판례 청크만 모인 묶음이 한 요청에 몰리지 않게)
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        base_url: Optional[str] = None,
+        batch_size: int = 32,
+        max_batch_chars: int = 32000,
+        max_concurrency: int = 4,
+        embeddings=None,
+        use_cache: bool = True,
+        cache_dir: str = DEFAULT_CACHE_DIR
+    ):
+        """
+        Args:
+            model: Ollama 임베딩 모델
+            base_url: Ollama 주소 (None이면 기본값 / OLLAMA_HOST)
+            batch_size: 요청 하나에 넣을 최대 텍스트 수
+            max_batch_chars: 요청 하나에 넣을 최대 글자 수 합
+            max_concurrency: 동시에 보낼 요청 수
+            embeddings: embed_documents / aembed_documents를 가진 임베딩 객체 (None이면 OllamaEmbeddings 생성)
+            use_cache: True면 같은 모델/텍스트 벡터를 디스크 캐시에서 재사용
+            cache_dir: 임베딩 캐시 폴더
+        """
+        if embeddings is None:
+            from langchain_ollama import OllamaEmbeddings
+
+            kwargs = {"base_url": base_url} if base_url else {}
+            embeddings = OllamaEmbeddings(model=model, **kwargs)
+
+        self.model = model
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.max_batch_chars = max_batch_chars
+        self.max_concurrency = max_concurrency
+        self.cache = EmbeddingCache(model, cache_dir) if use_cache else None
+
+        # 통계
+        self.requests = 0
+        self.texts = 0
+        self.chars = 0
+        self.seconds = 0.0
+
+    def make_batches(self, texts: Sequence[str]) -> List[List[int]]:
+        """
+        긴 텍스트부터 정렬해서 묶은 인덱스 묶음
+
+        Returns:
+            원래 순서 기준 인덱스 리스트의 리스트
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+
+        for i in order:
+            length = len(texts[i])
+            if current and (len(current) >= self.batch_size or current_chars + length > self.max_batch_chars):
+                batches.append(current)
+                current, current_chars = [], 0
+
+            current.append(i)
+            current_chars += length
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    async def aembed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        캐시에 없는 텍스트만 묶음으로 나눠 동시에 임베딩
+
+        캐시를 쓰면 정규화 결과가 같은 텍스트는 한 번만 요청
+        (캐시에서 읽은 벡터는 float16 정밀도)
+
+        Returns:
+            (len(texts), 차원) float32 행렬 (texts 순서)
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        if self.cache is None:
+            return await self._aembed_uncached(texts)
+
+        matrix, missing = self.cache.get_many(texts)
+        if not missing:
+            logger.info(f"임베딩: {len(texts)}개 모두 캐시")
+            return matrix
+
+        # 정규화 텍스트 → 인덱스들 (같은 호출 안 중복 제거)
+        groups: Dict[str, List[int]] = {}
+        for i in missing:
+            groups.setdefault(normalize_text(texts[i]), []).append(i)
+
+        todo = [texts[indices[0]] for indices in groups.values()]
+        fresh = await self._aembed_uncached(todo)
+
+        if matrix is None:
+            matrix = np.empty((len(texts), fresh.shape[1]), dtype=np.float32)
+        for row, indices in enumerate(groups.values()):
+            matrix[indices] = fresh[row]
+
+        self.cache.put_many(todo, fresh)
+        logger.info(f"임베딩 캐시: {len(texts) - len(missing)}개 적중, {len(todo)}개 새로 저장")
+        return matrix
+
+    async def _aembed_uncached(self, texts: Sequence[str]) -> np.ndarray:
+        """길이순 묶음 동시 요청 (캐시 없이)"""
+        batches = self.make_batches(texts)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        matrix: Optional[np.ndarray] = None
+
+        async def run(batch: List[int]) -> None:
+            nonlocal matrix
+
+            async with semaphore:
+                vectors = await self.embeddings.aembed_documents([texts[i] for i in batch])
+
+            block = np.asarray(vectors, dtype=np.float32)
+            if matrix is None:
+                matrix = np.empty((len(texts), block.shape[1]), dtype=np.float32)
+            matrix[batch] = block
+
+        started = time.perf_counter()
+        await asyncio.gather(*(run(batch) for batch in batches))
+        elapsed = time.perf_counter() - started
+
+        self.requests += len(batches)
+        self.texts += len(texts)
+        self.chars += sum(len(text) for text in texts)
+        self.seconds += elapsed
+
+        logger.info(
+            f"임베딩: {len(texts)}개 / 요청 {len(batches)}개 (동시 {self.max_concurrency}), "
+            f"{elapsed:.2f}s ({len(texts) / elapsed:.1f}개/초)"
+        )
+        return matrix
+
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        aembed_texts의 동기 버전
+
+        전용 이벤트 루프 스레드(sync_loop.run_sync)에서 실행
+        (OllamaEmbeddings 비동기 클라이언트가 루프에 묶이므로 호출마다 asyncio.run을 쓰면 두 번째부터 실패)
+        """
+        return run_sync(self.aembed_texts(texts))
+
+    async def aembed_chunks(self, chunks: Sequence) -> Tuple[List[Tuple[str, int]], np.ndarray]:
+        """
+        청크(Document 또는 Chunk 레코드) 임베딩
+
+        Returns:
+            ([(source, chunk_id), ...], float32 행렬) - 같은 순서
+        """
+        ids = [chunk_key(chunk) for chunk in chunks]
+        matrix = await self.aembed_texts([chunk.page_content for chunk in chunks])
+        return ids, matrix
+
+    def embed_chunks(self, chunks: Sequence) -> Tuple[List[Tuple[str, int]], np.ndarray]:
+        """aembed_chunks의 동기 버전 (embed_texts처럼 전용 이벤트 루프에서 실행)"""
+        return run_sync(self.aembed_chunks(chunks))
+
+    def stats(self) -> Dict[str, float]:
+        """요청 수, 요청한 텍스트 수, 글자 수, 누적 시간, 초당 텍스트 수 (+ 캐시 통계)"""
+        stats = {
+            "requests": self.requests,
+            "texts": self.texts,
+            "chars": self.chars,
+            "seconds": round(self.seconds, 3),
+            "texts_per_s": round(self.texts / self.seconds, 1) if self.seconds else 0.0
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+
+if __name__ == "__main__":
+    from document_load_and_split import UnifiedDocumentLoader
+
+    chunks = UnifiedDocumentLoader(use_llm=False).load_all()
+
+    print("⚠️  ollama serve + ollama pull bona/bge-m3-korean:latest\n")
+    engine = EmbeddingEngine()
+    ids, matrix = engine.embed_chunks(chunks)
+
+    print(f"→ {matrix.shape} {matrix.dtype}")
+    print(f"첫 번째 청크: {ids[0]} {matrix[0][:5]}")
+    print(engine.stats())
@@ -0,0 +1,399 @@
+"""
+가짜 Ollama HTTP 서버 모듈
+- 실제 모델 없이 ChatOllama / MetadataGenerator 동작을 확인하기 위한 로컬 서버
+- /api/chat (스트리밍 NDJSON / 일반 JSON), /api/embed, /api/embeddings(구버전) 지원
+- 지연 분포(fixed/uniform/lognormal/exponential), 동시 처리 수(capacity), 실패율 설정 가능
+    capacity를 넘는 요청은 줄을 서므로 과부하 시 지연이 늘어남
+- GET /api/stats: 처리 통계 (별도 프로세스로 띄웠을 때 벤치마크가 읽음)
+
+응답 내용 (같은 입력이면 항상 같은 응답):
+    chat: 프롬프트의 조항 번호로 만든 메타데이터 JSON
+        {"title": "제50조 요약", "keywords": ["근로", "법률"]}
+    embed: 텍스트 해시를 시드로 만든 단위 길이 의사 난수 벡터 (기본 1024차원, bge-m3와 같음)
+
+사용법:
+    with FakeOllamaServer(latency=0.05, capacity=4) as server:
+        gen = MetadataGenerator(base_url=server.url, use_cache=False)
+        gen.generate("제50조\\n(근로시간) ...")
+        print(server.stats())
+
+    # 포그라운드 실행 (포트, 지연, 동시 처리 수 + 옵션)
+    python tools/fake_ollama.py 11434 0.05 4 --dist lognormal --spread 0.5
+"""
+import re
+import json
+import math
+import time
+import random
+import hashlib
+import argparse
+import socket
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Union
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("fake_ollama")
+
+# 프롬프트 속 조항 번호 ("법률 조항:\n제50조" 또는 묶음 프롬프트 "[제50조]")
+_ARTICLE_PATTERN = re.compile(r'제\s*\d+\s*조(?:의\s*\d+)?')
+_PACKED_LABEL_PATTERN = re.compile(r'^\[(.+?)\]$', re.MULTILINE)
+
+
+def canned_metadata(prompt: str) -> str:
+    """프롬프트에 맞는 결정적 메타데이터 JSON 응답 (묶음 프롬프트면 배열)"""
+    labels = _PACKED_LABEL_PATTERN.findall(prompt)
+
+    if labels:
+        return json.dumps(
+            [{"article_num": label, "title": f"{label} 요약", "keywords": ["근로", "법률"]} for label in labels],
+            ensure_ascii=False
+        )
+
+    match = _ARTICLE_PATTERN.search(prompt)
+    label = match.group() if match else "조항"
+    return json.dumps({"title": f"{label} 요약", "keywords": ["근로", "법률"]}, ensure_ascii=False)
+
+
+def fake_embedding(text: str, dim: int = 1024) -> List[float]:
+    """텍스트 해시를 시드로 만든 결정적 단위 길이 벡터"""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    rng = random.Random(seed)
+    vector = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class LatencyModel:
+    """
+    요청 처리 시간 분포
+
+    - fixed: 항상 mean
+    - uniform: mean × (1 ± spread) 균등 분포
+    - lognormal: 중앙값 mean, 로그 표준편차 spread (가끔 아주 느린 요청이 섞이는 실제 서버와 비슷)
+    - exponential: 평균 mean
+    """
+
+    DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "exponential")
+
+    def __init__(self, mean: float = 0.05, dist: str = "fixed", spread: float = 0.5, seed: int = 0):
+        """
+        Args:
+            mean: 기준 지연 (초)
+            dist: 분포 이름 (DISTRIBUTIONS)
+            spread: uniform 폭 비율 / lognormal 로그 표준편차
+            seed: 난수 시드
+        """
+        if dist not in self.DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포: {dist} (가능: {', '.join(self.DISTRIBUTIONS)})")
+
+        self.mean = mean
+        self.dist = dist
+        self.spread = spread
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """지연 하나 뽑기 (초)"""
+        if self.dist == "fixed" or self.mean <= 0:
+            return max(0.0, self.mean)
+
+        with self._lock:
+            if self.dist == "uniform":
+                return max(0.0, self._random.uniform(self.mean * (1 - self.spread), self.mean * (1 + self.spread)))
+            if self.dist == "lognormal":
+                return self._random.lognormvariate(math.log(self.mean), self.spread)
+            return self._random.expovariate(1 / self.mean)
+
+    def __repr__(self) -> str:
+        return f"{self.dist}({self.mean}s)"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # 동시 연결이 몰려도 연결 거부 대신 capacity 대기열에서 지연으로 나타나게
+    request_queue_size = 256
+
+
+class FakeOllamaServer:
+    """
+    백그라운드 스레드에서 도는 가짜 Ollama 서버
+
+    Attributes:
+        url: ChatOllama(base_url=...)에 넣을 주소
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[float, LatencyModel] = 0.05,
+        capacity: int = 4,
+        fail_rate: float = 0.0,
+        seed: int = 0,
+        embed_latency: float = 0.002,
+        embedding_dim: int = 1024
+    ):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            latency: 요청 하나 처리 시간 (초, 또는 LatencyModel로 분포 지정)
+            capacity: 동시에 처리하는 요청 수 (넘으면 대기, chat/embed 공용)
+            fail_rate: 503으로 실패시킬 비율 (0~1)
+            seed: 실패 난수 시드
+            embed_latency: 임베딩 요청에서 텍스트 하나당 추가 처리 시간 (초)
+            embedding_dim: 임베딩 차원
+        """
+        self.latency = latency if isinstance(latency, LatencyModel) else LatencyModel(latency, seed=seed)
+        self.capacity = capacity
+        self.fail_rate = fail_rate
+        self.embed_latency = embed_latency
+        self.embedding_dim = embedding_dim
+
+        self._slots = threading.Semaphore(capacity)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # 통계
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.chat_requests = 0
+        self.embed_requests = 0
+        self.embedded_texts = 0
+
+        self._httpd = _Server((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOllamaServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"가짜 Ollama 서버 시작: {self.url} (지연 {self.latency}, 동시 {self.capacity})")
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeOllamaServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """처리 요청 수, 실패 수, 최대 동시 요청 수, chat/embed 요청 수, 임베딩한 텍스트 수"""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "max_in_flight": self.max_in_flight,
+            "chat_requests": self.chat_requests,
+            "embed_requests": self.embed_requests,
+            "embedded_texts": self.embedded_texts
+        }
+
+    def _process(self, extra: float = 0.0) -> bool:
+        """
+        자리 차지 → 지연 → 성공 여부 (capacity를 넘으면 자리가 날 때까지 대기)
+
+        Args:
+            extra: 분포에서 뽑은 지연에 더할 시간 (임베딩 텍스트 수 비례분)
+        """
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            with self._slots:
+                time.sleep(self.latency.sample() + extra)
+
+            with self._lock:
+                failed = self._random.random() < self.fail_rate
+                if failed:
+                    self.failures += 1
+            return not failed
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def setup(self):
+                super().setup()
+                # 작은 NDJSON 조각마다 Nagle 지연(~40ms)이 붙지 않게
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def handle(self):
+                try:
+                    super().handle()
+                except (BrokenPipeError, ConnectionResetError):
+                    # 클라이언트가 keep-alive 연결을 끊음
+                    pass
+
+            def _send_json(self, status: int, payload: Dict) -> None:
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/api/tags":
+                    self._send_json(200, {"models": []})
+                elif self.path == "/api/stats":
+                    self._send_json(200, server.stats())
+                else:
+                    self._send_json(200, {"status": "Ollama is running"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+
+                if self.path == "/api/chat":
+                    self._chat(request)
+                elif self.path in ("/api/embed", "/api/embeddings"):
+                    self._embed(request)
+                else:
+                    self._send_json(404, {"error": f"지원하지 않는 경로: {self.path}"})
+
+            def _chat(self, request: Dict) -> None:
+                with server._lock:
+                    server.chat_requests += 1
+
+                if not server._process():
+                    self._send_json(503, {"error": "server busy (fake)"})
+                    return
+
+                prompt = "\n".join(m.get("content", "") for m in request.get("messages", []))
+                content = canned_metadata(prompt)
+                model = request.get("model", "fake")
+
+                if request.get("stream", True):
+                    self._stream_chat(model, content)
+                else:
+                    self._send_json(200, _chat_message(model, content, done=True))
+
+            def _embed(self, request: Dict) -> None:
+                """/api/embed: input(문자열 또는 리스트) → embeddings / /api/embeddings: prompt → embedding"""
+                legacy = self.path == "/api/embeddings"
+                texts = request.get("prompt", "") if legacy else request.get("input", [])
+                if isinstance(texts, str):
+                    texts = [texts]
+
+                with server._lock:
+                    server.embed_requests += 1
+                    server.embedded_texts += len(texts)
+
+                if not server._process(extra=server.embed_latency * len(texts)):
+                    self._send_json(503, {"error": "server busy (fake)"})
+                    return
+
+                vectors = [fake_embedding(text, server.embedding_dim) for text in texts]
+                model = request.get("model", "fake")
+
+                if legacy:
+                    self._send_json(200, {"embedding": vectors[0]})
+                else:
+                    self._send_json(200, {
+                        "model": model,
+                        "embeddings": vectors,
+                        "total_duration": 0,
+                        "load_duration": 0,
+                        "prompt_eval_count": sum(len(text) for text in texts)
+                    })
+
+            def _stream_chat(self, model: str, content: str) -> None:
+                """NDJSON 스트리밍 (chunked 전송)"""
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                pieces = _split_tokens(content)
+                lines = [_chat_message(model, piece, done=False) for piece in pieces]
+                lines.append(_chat_message(model, "", done=True))
+
+                try:
+                    for line in lines:
+                        data = (json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8")
+                        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    # 클라이언트가 스트림을 먼저 닫음 (JSON이 닫히면 끊는 경우)
+                    pass
+
+        return Handler
+
+
+def _split_tokens(content: str, size: int = 8) -> List[str]:
+    """스트리밍용으로 응답을 토큰 비슷한 조각으로 나눔"""
+    return [content[i:i + size] for i in range(0, len(content), size)] or [""]
+
+
+def _chat_message(model: str, content: str, done: bool) -> Dict:
+    """Ollama /api/chat 응답 한 줄"""
+    message = {
+        "model": model,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "message": {"role": "assistant", "content": content},
+        "done": done
+    }
+    if done:
+        message.update({"done_reason": "stop", "total_duration": 0, "eval_count": 0})
+    return message
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가짜 Ollama 서버")
+    parser.add_argument("port", nargs="?", type=int, default=11434)
+    parser.add_argument("latency", nargs="?", type=float, default=0.05, help="기준 지연 (초)")
+    parser.add_argument("capacity", nargs="?", type=int, default=4, help="동시 처리 수")
+    parser.add_argument("--dist", default="fixed", choices=LatencyModel.DISTRIBUTIONS, help="지연 분포")
+    parser.add_argument("--spread", type=float, default=0.5, help="uniform 폭 비율 / lognormal 로그 표준편차")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--embed-latency", type=float, default=0.002, help="임베딩 텍스트 하나당 추가 지연 (초)")
+    parser.add_argument("--dim", type=int, default=1024, help="임베딩 차원")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(
+        port=args.port,
+        latency=LatencyModel(args.latency, args.dist, args.spread, args.seed),
+        capacity=args.capacity,
+        fail_rate=args.fail_rate,
+        seed=args.seed,
+        embed_latency=args.embed_latency,
+        embedding_dim=args.dim
+    )
+    print(f"가짜 Ollama 서버: {server.url} (지연 {server.latency}, 동시 {server.capacity}) (Ctrl+C로 종료)", flush=True)
+
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server._httpd.server_close()
@@ -0,0 +1,179 @@
+"""
+적재 체크포인트 모듈
+- LLM 메타데이터까지 만든 청크를 data/processed에 JSONL로 이어 쓰기 (append-only)
+- 중간에 죽거나 Ollama가 재시작돼도 resume=True면 끝난 (source, chunk_id)는 건너뜀
+
+파일 한 줄 = 완료된 청크 하나:
+    {"source": "...", "sha256": "원본 해시", "chunk_id": 3, "page_content": "...", "metadata": {...}}
+
+원본 내용이 바뀌면(sha256 다름) 그 파일의 체크포인트는 쓰지 않음
+마지막 줄이 쓰다 만 상태(비정상 종료)면 그 줄을 파일에서 잘라내고 읽음 (다음 기록이 조각에 붙지 않게)
+
+사용법:
+    checkpoint = IngestCheckpoint("data/processed", pipeline="unified:qwen2.5:1.5b", resume=True)
+
+    done = checkpoint.completed(source, sha256)    # {chunk_id: Document}
+    ...
+    checkpoint.add(source, sha256, chunk)          # flush_every개마다 / flush_interval초마다 디스크에 기록
+    checkpoint.close()
+"""
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from langchain.schema import Document
+from config.logging_config import setup_logger
+
+logger = setup_logger("ingest_checkpoint")
+
+
+class IngestCheckpoint:
+    """
+    파이프라인별 완료 청크 JSONL 체크포인트
+
+    같은 폴더라도 파이프라인(LLM 모델 등)이 다르면 다른 파일 사용
+        data/processed/checkpoints/<파이프라인 해시>.jsonl
+    """
+
+    def __init__(
+        self,
+        processed_dir: str = "data/processed",
+        pipeline: str = "default",
+        resume: bool = True,
+        flush_every: int = 20,
+        flush_interval: float = 5.0
+    ):
+        """
+        Args:
+            processed_dir: 체크포인트 저장 폴더
+            pipeline: 파이프라인 이름 (청크 결과를 바꾸는 설정 포함)
+            resume: True면 기존 체크포인트를 읽어서 이어서 진행, False면 새로 시작
+            flush_every: 이만큼 청크가 쌓이면 디스크에 기록
+            flush_interval: 마지막 기록 뒤 이 시간(초)이 지나면 기록
+        """
+        key = hashlib.sha256(pipeline.encode("utf-8")).hexdigest()[:16]
+        self.path = Path(processed_dir) / "checkpoints" / f"{key}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.pipeline = pipeline
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+
+        # (source, sha256) → {chunk_id: Document}
+        self._done: Dict[Tuple[str, str], Dict[int, Document]] = {}
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+
+        # 통계
+        self.loaded = 0
+        self.skipped = 0
+        self.written = 0
+
+        if resume:
+            self._load()
+        else:
+            self.path.unlink(missing_ok=True)
+
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _load(self) -> None:
+        """
+        기존 체크포인트 읽기 (깨진 줄은 건너뜀)
+
+        줄바꿈으로 끝나지 않은 마지막 줄(쓰다 만 기록)은 파일에서 잘라냄
+        → 이어 쓰기("a")가 조각 뒤에 붙어서 다음 줄까지 깨지는 것을 막음
+        """
+        if not self.path.exists():
+            return
+
+        complete_bytes = 0
+
+        with open(self.path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                complete_bytes += len(raw)
+
+                try:
+                    record = json.loads(raw.decode("utf-8"))
+                    key = (record["source"], record["sha256"])
+                    document = Document(page_content=record["page_content"], metadata=record["metadata"])
+                    self._done.setdefault(key, {})[record["chunk_id"]] = document
+                    self.loaded += 1
+                except (UnicodeDecodeError, json.JSONDecodeError, KeyError):
+                    logger.warning(f"체크포인트 깨진 줄 무시: {raw[:80]!r}")
+
+        torn_bytes = self.path.stat().st_size - complete_bytes
+        if torn_bytes > 0:
+            logger.warning(f"체크포인트 끝의 쓰다 만 줄 잘라냄 ({torn_bytes}바이트)")
+            os.truncate(self.path, complete_bytes)
+
+        logger.info(f"체크포인트 로드: {self.path} ({self.loaded}개 청크)")
+
+    def completed(self, source: str, sha256: str) -> Dict[int, Document]:
+        """
+        이 파일(내용 해시 기준)에서 이미 끝난 청크
+
+        Returns:
+            {chunk_id: Document} (없으면 빈 dict)
+        """
+        return self._done.get((source, sha256), {})
+
+    def skip(self, count: int = 1) -> None:
+        """체크포인트에서 재사용한 청크 수 기록"""
+        self.skipped += count
+
+    def add(self, source: str, sha256: str, chunk: Document) -> None:
+        """완료된 청크 하나 추가 (주기적으로 디스크에 기록)"""
+        record = {
+            "source": source,
+            "sha256": sha256,
+            "chunk_id": chunk.metadata["chunk_id"],
+            "page_content": chunk.page_content,
+            "metadata": chunk.metadata
+        }
+        self._pending.append(json.dumps(record, ensure_ascii=False))
+        self._done.setdefault((source, sha256), {})[record["chunk_id"]] = chunk
+
+        if (
+            len(self._pending) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """쌓인 청크를 파일 끝에 쓰고 fsync"""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+
+        self._file.write("\n".join(self._pending) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self.written += len(self._pending)
+        logger.debug(f"체크포인트 기록: {len(self._pending)}개 (누적 {self.written}개)")
+        self._pending = []
+
+    def close(self) -> None:
+        """남은 청크 기록 후 파일 닫기"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "IngestCheckpoint":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, int]:
+        """읽은/재사용한/새로 기록한 청크 수"""
+        return {"loaded": self.loaded, "skipped": self.skipped, "written": self.written}
@@ -0,0 +1,255 @@
+"""
+증분 수집(incremental ingest)용 매니페스트 모듈
+- 원본 파일별 내용 해시(sha256), mtime, 크기 기록
+- 바뀌지 않은 파일은 이전 청크를 캐시에서 재사용
+
+저장 위치:
+    data/processed/manifest.json       # 파일별 해시/mtime/크기
+    data/processed/chunk_cache/*.json  # 파이프라인별 청크 캐시
+"""
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from langchain.schema import Document
+from config.logging_config import setup_logger
+
+logger = setup_logger("ingest_manifest")
+
+
+def content_hash(text: str) -> str:
+    """텍스트 내용 해시 (sha256)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class IngestManifest:
+    """
+    원본 파일 → (해시, mtime, 크기, 청크 캐시) 매니페스트
+
+    같은 파일이라도 파이프라인(로더 종류, LLM 모델 등)마다 청크가 다르므로
+    청크 캐시는 pipeline 이름별로 따로 보관
+
+    manifest.json 구조:
+        {
+            "version": 1,
+            "files": {
+                "data/raw/laws/근로기준법.txt": {
+                    "sha256": "...",
+                    "mtime_ns": 1728000000000000000,
+                    "size": 1004,
+                    "chunks": {"unified:qwen2.5:1.5b": "3f2a....json"}
+                }
+            }
+        }
+    """
+
+    VERSION = 1
+
+    def __init__(self, processed_dir: str = "data/processed", filename: str = "manifest.json"):
+        """
+        Args:
+            processed_dir: 매니페스트/캐시 저장 폴더
+            filename: 매니페스트 파일명
+        """
+        self.processed_dir = Path(processed_dir)
+        self.path = self.processed_dir / filename
+        self.cache_dir = self.processed_dir / "chunk_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.files: Dict[str, Dict] = {}
+        self._dirty = False
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        """기존 매니페스트 읽기 (없거나 버전이 다르면 새로 시작)"""
+        if not self.path.exists():
+            logger.info(f"새 매니페스트: {self.path}")
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"매니페스트 읽기 실패, 새로 시작: {e}")
+            return
+
+        if data.get("version") != self.VERSION:
+            logger.warning(f"매니페스트 버전 불일치 ({data.get('version')}), 새로 시작")
+            return
+
+        self.files = data.get("files", {})
+        logger.info(f"매니페스트 로드: {len(self.files)}개 파일")
+
+    def save(self) -> None:
+        """변경된 경우에만 매니페스트 저장 (임시 파일 → 교체)"""
+        if not self._dirty:
+            return
+
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "files": self.files}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+        self._dirty = False
+        logger.debug(f"매니페스트 저장: {self.path} ({len(self.files)}개 파일)")
+
+    # 청크 캐시
+
+    def _cache_path(self, source: str, pipeline: str, sha256: str) -> Path:
+        key = hashlib.sha256(f"{pipeline}\0{source}\0{sha256}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _read_chunks(self, cache_file: str) -> Optional[List[Document]]:
+        path = self.cache_dir / cache_file
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"청크 캐시 읽기 실패: {path} - {e}")
+            return None
+
+        return [Document(page_content=r["page_content"], metadata=r["metadata"]) for r in records]
+
+    def _write_chunks(self, path: Path, chunks: List[Document]) -> None:
+        records = [{"page_content": c.page_content, "metadata": c.metadata} for c in chunks]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+
+    # 조회
+
+    def _cached_chunks(self, source: str, pipeline: str) -> Optional[List[Document]]:
+        cache_file = self.files[source].get("chunks", {}).get(pipeline)
+        if cache_file is None:
+            return None
+        return self._read_chunks(cache_file)
+
+    def lookup_file(self, file_path: Path, pipeline: str) -> Optional[List[Document]]:
+        """
+        파일이 바뀌지 않았으면 캐시된 청크 반환
+
+        mtime/크기가 같으면 파일을 읽지 않고 바로 재사용,
+        다르면 내용 해시를 비교 (touch만 된 파일은 재사용 + mtime 갱신)
+
+        Args:
+            file_path: 원본 파일 경로
+            pipeline: 파이프라인 이름
+
+        Returns:
+            캐시된 청크 리스트, 바뀌었거나 캐시가 없으면 None
+        """
+        source = str(file_path)
+        entry = self.files.get(source)
+
+        if entry is None or pipeline not in entry.get("chunks", {}):
+            self.misses += 1
+            return None
+
+        stat = os.stat(file_path)
+
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            with open(file_path, "r", encoding="utf-8") as f:
+                sha256 = content_hash(f.read())
+
+            if sha256 != entry["sha256"]:
+                self.misses += 1
+                return None
+
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self._dirty = True
+
+        chunks = self._cached_chunks(source, pipeline)
+        if chunks is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"캐시 재사용: {source} ({len(chunks)}개 청크)")
+        return chunks
+
+    def lookup_text(self, source: str, text: str, pipeline: str) -> Optional[List[Document]]:
+        """
+        이미 읽은 문서 내용의 해시가 같으면 캐시된 청크 반환
+
+        Args:
+            source: 원본 경로 (Document.metadata['source'])
+            text: 문서 내용
+            pipeline: 파이프라인 이름
+
+        Returns:
+            캐시된 청크 리스트, 바뀌었거나 캐시가 없으면 None
+        """
+        entry = self.files.get(source)
+
+        if entry is None or entry["sha256"] != content_hash(text) or pipeline not in entry.get("chunks", {}):
+            self.misses += 1
+            return None
+
+        chunks = self._cached_chunks(source, pipeline)
+        if chunks is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"캐시 재사용: {source} ({len(chunks)}개 청크)")
+        return chunks
+
+    # 기록
+
+    def record(
+        self,
+        source: str,
+        text: str,
+        chunks: List[Document],
+        pipeline: str,
+        stat: Optional[os.stat_result] = None
+    ) -> None:
+        """
+        새로 만든 청크를 캐시에 저장하고 매니페스트 갱신
+
+        내용 해시가 바뀌었으면 다른 파이프라인의 오래된 캐시도 무효화
+
+        mtime/크기(lookup_file 빠른 경로)는 text를 읽기 전에 잰 stat으로만 갱신
+        (기록 시점에 stat을 다시 재면, 분할/LLM 도중 파일이 바뀐 경우 새 mtime이
+        옛 내용 해시와 짝지어져서 바뀐 파일에 오래된 청크를 계속 돌려줌)
+
+        Args:
+            source: 원본 경로
+            text: 원본 내용
+            chunks: 이 파일에서 만든 청크들
+            pipeline: 파이프라인 이름
+            stat: text를 읽기 전에 잰 os.stat 결과 (None이면 mtime/크기는 그대로 두고
+                다음 lookup_file에서 내용 해시로 확인)
+        """
+        sha256 = content_hash(text)
+        entry = self.files.get(source)
+
+        if entry is None or entry["sha256"] != sha256:
+            if entry is not None:
+                for stale in entry.get("chunks", {}).values():
+                    (self.cache_dir / stale).unlink(missing_ok=True)
+            entry = {"sha256": sha256, "mtime_ns": None, "size": None, "chunks": {}}
+            self.files[source] = entry
+
+        if stat is not None:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+
+        cache_path = self._cache_path(source, pipeline, sha256)
+        self._write_chunks(cache_path, chunks)
+        entry["chunks"][pipeline] = cache_path.name
+        self._dirty = True
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/미스 통계"""
+        return {"files": len(self.files), "hits": self.hits, "misses": self.misses}
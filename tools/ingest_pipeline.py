@@ -0,0 +1,396 @@
+"""
+파이프라인 적재 모듈 (읽기 → 분할 → LLM 메타데이터 → 임베딩 → 저장)
+- 단계별로 끝날 때까지 기다리지 않고 asyncio 작업으로 동시에 진행
+    파일을 읽는 동안 앞 청크는 LLM, 그 앞 청크는 임베딩/저장 중
+- 단계 사이 큐는 크기 제한 → 뒤 단계가 느리면 앞 단계가 기다림 (메모리 상한)
+- 단계별 처리량과 큐 길이 통계
+
+단계:
+    read   : 원본 파일 읽기 (스레드)
+    split  : UnifiedDocumentLoader.split_text (스레드, LLM 없음)
+    llm    : MetadataGenerator.agenerate_many로 법령 청크 제목/키워드 채우기 (SQLite 캐시 조회/저장은 스레드)
+    embed  : OllamaEmbeddings.aembed_documents
+    upsert : sink(documents, vectors) (스레드)
+
+사용법:
+    loader = UnifiedDocumentLoader(use_llm=False)
+    pipeline = IngestPipeline(
+        loader,
+        metadata_gen=MetadataGenerator(max_concurrency=4),
+        embeddings=OllamaEmbeddings(model="bona/bge-m3-korean:latest"),
+        sink=vectorstore_sink(vectorstore)
+    )
+    stats = pipeline.run()
+    print(stats["chunks_per_s"], stats["stages"]["llm"])
+"""
+import time
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from langchain.schema import Document
+from config.logging_config import setup_logger
+
+logger = setup_logger("ingest_pipeline")
+
+# 단계 종료 표시 (큐 끝에 하나만 넣고, 꺼낸 작업자가 다시 넣어서 형제 작업자에게 전달)
+_DONE = object()
+
+# 저장 함수: (청크 리스트, 벡터 리스트 - 임베딩 없으면 None) → None
+Sink = Callable[[List[Document], Optional[List[List[float]]]], None]
+
+
+def vectorstore_sink(vectorstore) -> Sink:
+    """
+    LangChain 벡터스토어를 저장 함수로 감쌈
+
+    add_embeddings가 있으면 파이프라인에서 만든 벡터를 그대로 저장,
+    없으면 add_documents (벡터스토어가 임베딩을 다시 계산함)
+    """
+    if hasattr(vectorstore, "add_embeddings"):
+        def sink(documents: List[Document], vectors: Optional[List[List[float]]]) -> None:
+            texts = [doc.page_content for doc in documents]
+            vectorstore.add_embeddings(list(zip(texts, vectors)), metadatas=[doc.metadata for doc in documents])
+        return sink
+
+    logger.warning(f"{type(vectorstore).__name__}에 add_embeddings가 없어 add_documents 사용 (임베딩 중복 계산)")
+
+    def sink(documents: List[Document], vectors: Optional[List[List[float]]]) -> None:
+        vectorstore.add_documents(documents)
+    return sink
+
+
+class StageStats:
+    """단계 하나의 처리량 / 입력 큐 길이 통계"""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+
+        # 통계
+        self.items = 0
+        self.batches = 0
+        self.busy = 0.0          # 작업자들이 실제 처리에 쓴 시간 합 (초)
+        self.queue_max = 0
+        self._depth_sum = 0
+        self._depth_samples = 0
+
+    def sample_queue(self, depth: int) -> None:
+        self.queue_max = max(self.queue_max, depth)
+        self._depth_sum += depth
+        self._depth_samples += 1
+
+    def as_dict(self, elapsed: float) -> Dict[str, float]:
+        """
+        items_per_s: 전체 시간 기준 처리량
+        utilization: 작업자가 바빴던 비율 (1에 가까우면 병목 단계)
+        """
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "workers": self.workers,
+            "busy_s": round(self.busy, 3),
+            "items_per_s": round(self.items / elapsed, 1) if elapsed else 0.0,
+            "utilization": round(self.busy / (elapsed * self.workers), 2) if elapsed else 0.0,
+            "queue_max": self.queue_max,
+            "queue_avg": round(self._depth_sum / self._depth_samples, 1) if self._depth_samples else 0.0
+        }
+
+
+class IngestPipeline:
+    """
+    크기 제한 큐로 이어진 단계별 asyncio 작업자
+
+    metadata_gen / embeddings / sink가 None이면 그 단계는 그대로 통과
+    """
+
+    def __init__(
+        self,
+        loader,
+        metadata_gen=None,
+        embeddings=None,
+        sink: Optional[Sink] = None,
+        doc_types: Tuple[str, ...] = ("law", "faq", "case"),
+        queue_size: int = 256,
+        llm_batch: int = 16,
+        llm_workers: int = 2,
+        embed_batch: int = 32,
+        embed_workers: int = 2,
+        upsert_batch: int = 128,
+        batch_linger: float = 0.05,
+        report_interval: float = 5.0
+    ):
+        """
+        Args:
+            loader: UnifiedDocumentLoader (파일 목록 + split_text)
+            metadata_gen: MetadataGenerator (법령 청크 제목/키워드)
+            embeddings: aembed_documents를 가진 임베딩 모델 (OllamaEmbeddings 등)
+            sink: 저장 함수 (vectorstore_sink(...) 등, 스레드에서 호출)
+            doc_types: 처리할 문서 타입 순서
+            queue_size: 단계 사이 큐에 쌓아 둘 최대 청크 수
+            llm_batch: LLM 작업자 하나가 한 번에 맡을 청크 수
+            llm_workers: LLM 작업자 수 (한 묶음의 느린 요청을 기다리는 동안 다음 묶음 진행)
+                동시 요청 수는 작업자끼리 metadata_gen.max_concurrency를 나눠 씀
+            embed_batch: 임베딩 요청 하나에 넣을 청크 수
+            embed_workers: 동시 임베딩 요청 수
+            upsert_batch: 저장 한 번에 넣을 청크 수
+            batch_linger: 임베딩/저장 묶음이 덜 찼을 때 더 기다릴 최대 시간 (초)
+                (앞 단계가 조금씩 넘겨줘도 작은 요청을 여러 번 보내지 않게)
+            report_interval: 진행 상황 로그 간격 (초, 0이면 끔)
+        """
+        self.loader = loader
+        self.metadata_gen = metadata_gen
+        self.embeddings = embeddings
+        self.sink = sink
+        self.doc_types = doc_types
+
+        self.queue_size = queue_size
+        self.llm_batch = llm_batch
+        self.llm_workers = llm_workers
+        self.embed_batch = embed_batch
+        self.embed_workers = embed_workers
+        self.upsert_batch = upsert_batch
+        self.batch_linger = batch_linger
+        self.report_interval = report_interval
+
+        self.stages: Dict[str, StageStats] = {}
+        self._queues: Dict[str, asyncio.Queue] = {}
+
+    # 큐 도우미
+
+    async def _next_batch(
+        self,
+        queue: asyncio.Queue,
+        size: int,
+        stats: StageStats,
+        linger: float = 0.0
+    ) -> Optional[List[Any]]:
+        """
+        항목 하나를 기다린 뒤 size개 이하로 묶음
+
+        linger가 0이면 바로 꺼낼 수 있는 것까지만, 아니면 묶음이 찰 때까지 최대 linger초 더 기다림
+
+        Returns:
+            항목 리스트 (종료 표시를 만났고 남은 항목이 없으면 None)
+        """
+        stats.sample_queue(queue.qsize())
+        item = await queue.get()
+
+        if item is _DONE:
+            await queue.put(_DONE)
+            return None
+
+        batch = [item]
+        deadline = time.monotonic() + linger
+
+        while len(batch) < size:
+            if queue.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # wait_for(queue.get())는 시간 초과와 도착이 겹치면 항목을 잃을 수 있어서 짧게 폴링
+                await asyncio.sleep(min(remaining, 0.005))
+                continue
+
+            item = queue.get_nowait()
+
+            if item is _DONE:
+                await queue.put(_DONE)
+                break
+            batch.append(item)
+
+        return batch
+
+    async def _run_workers(self, name: str, workers: int, worker: Callable, output: Optional[asyncio.Queue]) -> None:
+        """같은 단계 작업자들을 실행하고 모두 끝나면 다음 큐에 종료 표시"""
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        if output is not None:
+            await output.put(_DONE)
+        logger.debug(f"[{name}] 단계 종료: {self.stages[name].items}개")
+
+    # 단계
+
+    async def _read_stage(self, output: asyncio.Queue) -> None:
+        stats = self.stages["read"]
+
+        for doc_type in self.doc_types:
+            for file_path in self.loader.iter_files(doc_type):
+                started = time.perf_counter()
+                text = await asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
+                stats.busy += time.perf_counter() - started
+                stats.items += 1
+                stats.batches += 1
+
+                await output.put((file_path, doc_type, text))
+
+        await output.put(_DONE)
+
+    async def _split_stage(self, source: asyncio.Queue, output: asyncio.Queue) -> None:
+        stats = self.stages["split"]
+
+        while True:
+            stats.sample_queue(source.qsize())
+            item = await source.get()
+            if item is _DONE:
+                break
+
+            file_path, doc_type, text = item
+            started = time.perf_counter()
+            chunks = await asyncio.to_thread(self.loader.split_text, text, str(file_path), doc_type)
+            stats.busy += time.perf_counter() - started
+            stats.items += len(chunks)
+            stats.batches += 1
+
+            for chunk in chunks:
+                await output.put(chunk)
+
+        await output.put(_DONE)
+
+    async def _llm_worker(self, source: asyncio.Queue, output: asyncio.Queue) -> None:
+        stats = self.stages["llm"]
+        concurrency = None
+        if self.metadata_gen is not None:
+            concurrency = max(1, self.metadata_gen.max_concurrency // self.llm_workers)
+
+        while True:
+            batch = await self._next_batch(source, self.llm_batch, stats)
+            if batch is None:
+                return
+
+            laws = [chunk for chunk in batch if chunk.metadata.get("type") == "law"]
+
+            if self.metadata_gen is not None and laws:
+                started = time.perf_counter()
+                results = await self.metadata_gen.agenerate_many(
+                    [chunk.page_content for chunk in laws], max_concurrency=concurrency
+                )
+                stats.busy += time.perf_counter() - started
+
+                for chunk, metadata in zip(laws, results):
+                    chunk.metadata["title"] = metadata.get("title", chunk.metadata["title"])
+                    chunk.metadata["keywords"] = metadata.get("keywords", [])
+
+            stats.items += len(batch)
+            stats.batches += 1
+
+            for chunk in batch:
+                await output.put(chunk)
+
+    async def _embed_worker(self, source: asyncio.Queue, output: asyncio.Queue) -> None:
+        stats = self.stages["embed"]
+
+        while True:
+            batch = await self._next_batch(source, self.embed_batch, stats, self.batch_linger)
+            if batch is None:
+                return
+
+            vectors = [None] * len(batch)
+            if self.embeddings is not None:
+                started = time.perf_counter()
+                vectors = await self.embeddings.aembed_documents([chunk.page_content for chunk in batch])
+                stats.busy += time.perf_counter() - started
+
+            stats.items += len(batch)
+            stats.batches += 1
+
+            for pair in zip(batch, vectors):
+                await output.put(pair)
+
+    async def _upsert_stage(self, source: asyncio.Queue) -> None:
+        stats = self.stages["upsert"]
+
+        while True:
+            batch = await self._next_batch(source, self.upsert_batch, stats, self.batch_linger)
+            if batch is None:
+                return
+
+            documents = [chunk for chunk, _ in batch]
+            vectors = [vector for _, vector in batch] if self.embeddings is not None else None
+
+            if self.sink is not None:
+                started = time.perf_counter()
+                await asyncio.to_thread(self.sink, documents, vectors)
+                stats.busy += time.perf_counter() - started
+
+            stats.items += len(batch)
+            stats.batches += 1
+
+    async def _report(self, started: float) -> None:
+        """report_interval마다 단계별 처리 수와 큐 길이 로그"""
+        while True:
+            await asyncio.sleep(self.report_interval)
+            depths = " ".join(f"{name}={queue.qsize()}" for name, queue in self._queues.items())
+            done = " ".join(f"{name}={stage.items}" for name, stage in self.stages.items())
+            logger.info(f"[파이프라인 {time.perf_counter() - started:.0f}s] 처리: {done} | 큐: {depths}")
+
+    # 실행
+
+    async def arun(self) -> Dict[str, Any]:
+        """
+        모든 단계를 동시에 실행하고 끝나면 통계 반환
+
+        한 단계라도 예외가 나면 나머지 단계를 취소하고 예외를 그대로 올림
+
+        Returns:
+            {"chunks": 저장 단계까지 간 청크 수, "elapsed_s": 초, "chunks_per_s": 초당 청크 수,
+             "stages": {단계 이름: StageStats.as_dict()}}
+        """
+        self.stages = {
+            "read": StageStats("read", 1),
+            "split": StageStats("split", 1),
+            "llm": StageStats("llm", self.llm_workers),
+            "embed": StageStats("embed", self.embed_workers),
+            "upsert": StageStats("upsert", 1)
+        }
+        # 파일 큐는 작게 (파일 하나가 클 수 있음), 청크 큐는 queue_size
+        self._queues = {
+            "split": asyncio.Queue(maxsize=2),
+            "llm": asyncio.Queue(maxsize=self.queue_size),
+            "embed": asyncio.Queue(maxsize=self.queue_size),
+            "upsert": asyncio.Queue(maxsize=self.queue_size)
+        }
+        queues = self._queues
+
+        started = time.perf_counter()
+        tasks = [
+            asyncio.ensure_future(self._read_stage(queues["split"])),
+            asyncio.ensure_future(self._split_stage(queues["split"], queues["llm"])),
+            asyncio.ensure_future(self._run_workers(
+                "llm", self.llm_workers, lambda: self._llm_worker(queues["llm"], queues["embed"]), queues["embed"]
+            )),
+            asyncio.ensure_future(self._run_workers(
+                "embed", self.embed_workers, lambda: self._embed_worker(queues["embed"], queues["upsert"]), queues["upsert"]
+            )),
+            asyncio.ensure_future(self._upsert_stage(queues["upsert"]))
+        ]
+        reporter = asyncio.ensure_future(self._report(started)) if self.report_interval > 0 else None
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+        elapsed = time.perf_counter() - started
+        chunks = self.stages["upsert"].items
+
+        result = {
+            "chunks": chunks,
+            "elapsed_s": round(elapsed, 3),
+            "chunks_per_s": round(chunks / elapsed, 1) if elapsed else 0.0,
+            "stages": {name: stage.as_dict(elapsed) for name, stage in self.stages.items()}
+        }
+        logger.info(f"✅ 파이프라인 완료: {chunks}개 청크, {elapsed:.2f}s ({result['chunks_per_s']}개/초)")
+        return result
+
+    def run(self) -> Dict[str, Any]:
+        """arun()의 동기 버전"""
+        return asyncio.run(self.arun())
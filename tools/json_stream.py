@@ -0,0 +1,94 @@
+"""
+스트리밍 JSON 스캐너 모듈
+- LLM 응답 조각을 받으면서 최상위 JSON 객체/배열이 닫히는 순간을 감지
+- 닫히면 바로 스트림을 끊어서 JSON 뒤에 붙는 설명 토큰 생성을 생략
+
+문자열 안의 괄호와 이스케이프(\\")는 세지 않음
+
+사용법:
+    scanner = JsonStreamScanner("{")
+
+    for chunk in llm.stream(messages):
+        if scanner.feed(chunk.content):
+            break                      # 최상위 객체가 닫힘 → 생성 중단
+
+    metadata = json.loads(scanner.text)
+"""
+from typing import Optional
+
+
+class JsonStreamScanner:
+    """
+    괄호 깊이를 세면서 첫 최상위 JSON 값을 잘라내는 점진 스캐너
+
+    여는 괄호 이전의 글자("```json" 같은 머리말)는 버림
+    """
+
+    _PAIRS = {"{": "}", "[": "]"}
+
+    def __init__(self, opener: str = "{"):
+        """
+        Args:
+            opener: 찾을 최상위 값의 여는 괄호 ("{" 객체, "[" 배열)
+        """
+        if opener not in self._PAIRS:
+            raise ValueError(f"지원하지 않는 여는 괄호: {opener!r}")
+
+        self.opener = opener
+        self.done = False
+
+        self._parts = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> Optional[str]:
+        """닫힌 최상위 JSON 텍스트 (아직 안 닫혔으면 None)"""
+        return self._text
+
+    def feed(self, chunk: str) -> bool:
+        """
+        응답 조각 하나 추가
+
+        Returns:
+            최상위 값이 닫혔으면 True (이후 조각은 무시)
+        """
+        if self.done:
+            return True
+
+        start = 0
+
+        # 아직 여는 괄호를 못 찾았으면 머리말 건너뛰기
+        if self._depth == 0:
+            start = chunk.find(self.opener)
+            if start == -1:
+                return False
+
+        for i in range(start, len(chunk)):
+            ch = chunk[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{" or ch == "[":
+                self._depth += 1
+            elif ch == "}" or ch == "]":
+                self._depth -= 1
+
+                if self._depth == 0:
+                    self._parts.append(chunk[start:i + 1])
+                    self._text = "".join(self._parts)
+                    self._parts = []
+                    self.done = True
+                    return True
+
+        self._parts.append(chunk[start:])
+        return False
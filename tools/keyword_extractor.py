@@ -0,0 +1,211 @@
+"""
+로컬 키워드 추출기 모듈
+- LLM 없이 조항 제목/키워드를 추출하는 1차 단계
+- 제목: 조 제목 괄호 "제50조(근로시간)" → "근로시간"
+- 키워드: 불러온 조항 전체에서 계산한 글자 n-gram TF-IDF 상위 항목
+
+MetadataGenerator는 신뢰도가 낮은 조항(괄호 제목 없음, 키워드 부족)만 LLM으로 보냄
+
+사용법:
+    extractor = LocalKeywordExtractor()
+    extractor.fit(article_texts)                 # 코퍼스 문서 빈도 계산
+
+    metadata, confidence = extractor.extract("제50조\\n(근로시간)\\n① 1주 간의 근로시간은 ...")
+    # ({"title": "근로시간", "keywords": ["근로시간", "휴게시간", ...]}, 1.0)
+"""
+import re
+import math
+from collections import Counter
+from typing import List, Dict, Tuple, Iterable
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("keyword_extractor")
+
+# 조항 머리 괄호 제목: "제50조(근로시간)", "제60조의2\n(연차 유급휴가)"
+ARTICLE_TITLE_PATTERN = re.compile(r'^\s*#*\s*제\s*\d+\s*조(?:의\s*\d+)?\s*\(([^()\n]{1,40})\)')
+
+# 한글 어절
+HANGUL_TOKEN_PATTERN = re.compile(r'[가-힣]{2,}')
+
+# 어절 끝 조사 (긴 것부터 떼어 냄)
+JOSA_SUFFIXES = (
+    "에게는", "에서는", "으로서", "으로써", "에게", "에서", "으로", "까지", "부터", "보다",
+    "에는", "에도", "과의", "와의", "이나", "이란", "란",
+    "을", "를", "이", "가", "은", "는", "의", "에", "로", "과", "와", "도", "만",
+)
+
+# 서술어 어절 (키워드 후보에서 제외)
+VERB_ENDINGS = (
+    "한다", "하여야", "하여", "하는", "하고", "하며", "하지", "하거나", "할", "한",
+    "된다", "되는", "되어", "있다", "있는", "없다", "없는", "말한다", "같다", "같은",
+    "하면", "해야", "이다", "이며", "에도", "어야", "시키며", "하였다", "였다",
+)
+
+# 조문에 흔한 접속/형식 표현
+STOP_WORDS = frozenset({
+    "경우", "또는", "다음", "각호", "이하", "이상", "그밖", "그밖에", "제외", "불구",
+    "따른", "따라", "대한", "관한", "위한", "대하여", "관하여", "위하여", "사항", "해당", "규정",
+    "대통령령", "고용노동부령",
+})
+
+class LocalKeywordExtractor:
+    """
+    괄호 제목 + 글자 n-gram TF-IDF 기반 메타데이터 추출기
+
+    신뢰도:
+        - 괄호 제목이 없으면 0 (LLM 필요)
+        - 있으면 0.5 + 0.5 × (점수가 min_score 이상인 키워드 수 / top_k)
+    """
+
+    def __init__(
+        self,
+        ngram_range: Tuple[int, int] = (2, 4),
+        top_k: int = 5,
+        min_score: float = 0.02
+    ):
+        """
+        Args:
+            ngram_range: 글자 n-gram 길이 범위 (최소, 최대)
+            top_k: 키워드 수
+            min_score: 신뢰도에 셀 최소 TF-IDF 점수
+        """
+        self.ngram_range = ngram_range
+        self.top_k = top_k
+        self.min_score = min_score
+
+        self._df: Counter = Counter()
+        self._n_docs = 0
+
+    @staticmethod
+    def _stem(token: str) -> str:
+        """어절에서 조사를 떼고, 서술어 어절이면 빈 문자열"""
+        if token.endswith(VERB_ENDINGS):
+            return ""
+
+        for suffix in JOSA_SUFFIXES:
+            if token.endswith(suffix):
+                # "간의", "일의"처럼 한 글자 + 조사는 버림
+                return token[:-len(suffix)] if len(token) - len(suffix) >= 2 else ""
+
+        return token
+
+    def _ngrams(self, text: str) -> List[str]:
+        """
+        어절(조사 제거)에서 만든 글자 n-gram 목록
+
+        어절 전체와, 복합명사를 나눈 앞/뒤 n-gram만 후보로 씀
+        ("근로시간" → "근로시간", "근로", "시간" / "로시", "근로시" 같은 조각 제외)
+        """
+        low, high = self.ngram_range
+        grams = []
+
+        for token in HANGUL_TOKEN_PATTERN.findall(text):
+            stem = self._stem(token)
+            if len(stem) < low or stem in STOP_WORDS:
+                continue
+
+            grams.append(stem)
+
+            # 앞/뒤 n-gram이 서로 겹치지 않게 나뉘는 길이만 (2+2, 2+3, 3+3 ...)
+            for n in range(low, min(high, len(stem) - low) + 1):
+                rest = len(stem) - n
+                if low <= rest <= high:
+                    for gram in (stem[:n], stem[n:]):
+                        if gram not in STOP_WORDS:
+                            grams.append(gram)
+
+        return grams
+
+    def fit(self, texts: Iterable[str]) -> "LocalKeywordExtractor":
+        """
+        코퍼스 문서 빈도(df) 계산 (다시 호출하면 새 코퍼스로 교체)
+
+        Args:
+            texts: 조항 텍스트들
+        """
+        self._df = Counter()
+        self._n_docs = 0
+
+        for text in texts:
+            self._df.update(set(self._ngrams(text)))
+            self._n_docs += 1
+
+        logger.info(f"키워드 추출기 학습: 조항 {self._n_docs}개, n-gram {len(self._df)}개")
+        return self
+
+    def _idf(self, gram: str) -> float:
+        return math.log((1 + self._n_docs) / (1 + self._df.get(gram, 0))) + 1
+
+    @staticmethod
+    def heading_title(text: str) -> str:
+        """조 제목 괄호 안 내용 (없으면 빈 문자열)"""
+        match = ARTICLE_TITLE_PATTERN.match(text) or ARTICLE_TITLE_PATTERN.match(text.replace("\n", "", 1))
+        return match.group(1).strip() if match else ""
+
+    def keywords(self, text: str, title: str = "") -> List[Tuple[str, float]]:
+        """
+        TF-IDF 상위 키워드 (겹치는 n-gram은 긴 쪽/점수 높은 쪽 하나만)
+
+        Returns:
+            (키워드, 점수) 리스트, 점수 내림차순
+        """
+        counts = Counter(self._ngrams(text))
+        if not counts:
+            return []
+
+        total = sum(counts.values())
+        scored = []
+
+        for gram, count in counts.items():
+            score = count / total * self._idf(gram) * math.sqrt(len(gram))
+            if gram in title:
+                score *= 2
+            scored.append((gram, score))
+
+        scored.sort(key=lambda x: (-x[1], x[0]))
+
+        selected: List[Tuple[str, float]] = []
+        for gram, score in scored:
+            if any(gram in chosen or chosen in gram for chosen, _ in selected):
+                continue
+            selected.append((gram, score))
+            if len(selected) == self.top_k:
+                break
+
+        return selected
+
+    def extract(self, text: str) -> Tuple[Dict[str, any], float]:
+        """
+        조항 하나의 메타데이터와 신뢰도
+
+        Returns:
+            ({"title": 제목, "keywords": [...]}, 신뢰도 0~1)
+        """
+        title = self.heading_title(text)
+        ranked = self.keywords(text, title)
+
+        if not title:
+            return {"title": "", "keywords": [gram for gram, _ in ranked]}, 0.0
+
+        strong = sum(1 for _, score in ranked if score >= self.min_score)
+        confidence = 0.5 + 0.5 * strong / self.top_k
+
+        return {"title": title, "keywords": [gram for gram, _ in ranked]}, confidence
+
+
+if __name__ == "__main__":
+    from article_scanner import iter_articles
+
+    with open("data/raw/laws/근로기준법_샘플.txt", "r", encoding="utf-8") as f:
+        law_text = f.read()
+
+    articles = [article_text for _, article_text in iter_articles(law_text)]
+    extractor = LocalKeywordExtractor().fit(articles)
+
+    for article_text in articles:
+        metadata, confidence = extractor.extract(article_text)
+        print(f"[{confidence:.1f}] {article_text.split(chr(10), 1)[0]} {metadata['title']!r} {metadata['keywords']}")
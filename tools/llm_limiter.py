@@ -0,0 +1,297 @@
+"""
+LLM 요청 동시성 제어 모듈
+- AdaptiveLimiter: AIMD 방식 동시 요청 수 조절
+    지연이 안정적이면 동시 요청 수를 천천히 늘리고 (+1 / 한 바퀴)
+    타임아웃/에러/지연 급증이면 절반으로 줄임
+- CircuitBreaker: 연속 실패가 쌓이면 LLM 호출을 막고 비LLM 대체 결과 사용
+    reset_timeout 뒤에 요청 하나로 복구 여부 확인 (half-open)
+
+공유 Ollama/vLLM 노드에서 고정 동시성으로 생기는 유휴/과부하를 줄이기 위한 것
+
+사용법:
+    limiter = AdaptiveLimiter(initial=4, max_limit=32)
+    breaker = CircuitBreaker(failure_threshold=5)
+
+    async def call(message):
+        if not breaker.allow():
+            raise CircuitOpenError()
+
+        async with limiter.slot():
+            try:
+                response = await llm.ainvoke(message)
+            except Exception:
+                breaker.record_failure()
+                raise
+
+        breaker.record_success()
+        return response
+"""
+import time
+import asyncio
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("llm_limiter")
+
+
+class CircuitOpenError(Exception):
+    """회로 차단기가 열려 있어서 LLM 요청을 보내지 않음"""
+
+
+class AdaptiveLimiter:
+    """
+    AIMD(가산 증가, 곱셈 감소) 동시 요청 제한기 (asyncio용)
+
+    - 최근 지연(이동 평균)이 기준 지연 × latency_tolerance 이하 → limit += 1/limit
+    - 실패(타임아웃, 에러) 또는 지연 급증 → limit *= backoff (한 기준 지연 시간에 한 번만)
+    - 기준 지연은 지금까지의 최소 지연에 가깝게 유지 (더 빠르면 바로 내리고, 느리면 천천히 올림)
+      → 대기열이 조금씩 길어지는 것을 기준으로 흡수하지 않음
+    - 요청 하나의 튀는 지연이 아니라 최근 이동 평균으로 급증을 판단
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_tolerance: float = 1.5,
+        backoff: float = 0.5,
+        smoothing: float = 0.3
+    ):
+        """
+        Args:
+            initial: 시작 동시 요청 수
+            min_limit: 최소 동시 요청 수
+            max_limit: 최대 동시 요청 수
+            latency_tolerance: 기준 지연의 몇 배부터 급증으로 볼지
+            backoff: 줄일 때 곱하는 비율
+            smoothing: 최근 지연 이동 평균 가중치
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.smoothing = smoothing
+
+        self.limit = float(max(min_limit, min(initial, max_limit)))
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self.recent: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+        # 통계
+        self.successes = 0
+        self.failures = 0
+        self.decreases = 0
+        self.peak_limit = self.limit
+
+    async def acquire(self) -> None:
+        """빈 자리가 날 때까지 기다렸다가 자리 하나 차지"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._lock:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+
+                waiter = loop.create_future()
+                self._waiters.append(waiter)
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                # 깨워진 뒤 취소됐으면 다음 대기자에게 양보
+                self._wake()
+                raise
+
+    def release(self, latency: Optional[float], ok: bool) -> None:
+        """
+        자리 반납 + 결과에 따라 limit 조절
+
+        Args:
+            latency: 요청 지연 (초, None이면 요청을 안 보낸 것으로 보고 조절 안 함)
+            ok: 성공 여부 (타임아웃/에러면 False)
+        """
+        with self._lock:
+            self.in_flight -= 1
+
+            if ok and latency is None:
+                pass
+            elif not ok:
+                self.failures += 1
+                self._decrease("실패")
+            else:
+                self.successes += 1
+                self._observe(latency)
+
+                if self.recent > self.baseline * self.latency_tolerance:
+                    self._decrease(f"지연 급증 {self.recent:.2f}s (기준 {self.baseline:.2f}s)")
+                else:
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                    self.peak_limit = max(self.peak_limit, self.limit)
+
+        self._wake()
+
+    def _observe(self, latency: float) -> None:
+        """최근 지연 이동 평균과 기준 지연 갱신 (잠금 안에서 호출)"""
+        if self.baseline is None:
+            self.baseline = self.recent = latency
+            return
+
+        self.recent += self.smoothing * (latency - self.recent)
+
+        if latency < self.baseline:
+            self.baseline = latency
+        else:
+            # 서버가 실제로 느려진 경우를 위해 아주 천천히 따라 올라감
+            self.baseline += 0.01 * (latency - self.baseline)
+
+    def _decrease(self, reason: str) -> None:
+        """limit 줄이기 (잠금 안에서 호출, 기준 지연 한 번에 한 번만)"""
+        now = time.monotonic()
+        if now - self._last_decrease < (self.baseline or 0.0):
+            return
+
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.backoff)
+        self.decreases += 1
+        logger.info(f"동시 요청 감소 → {int(self.limit)} ({reason})")
+
+    def _wake(self) -> None:
+        """빈 자리 수만큼 대기자 깨우기 (다른 스레드의 이벤트 루프도 안전하게)"""
+        with self._lock:
+            free = int(self.limit) - self.in_flight
+            woken = []
+            while free > 0 and self._waiters:
+                woken.append(self._waiters.popleft())
+                free -= 1
+
+        for waiter in woken:
+            waiter.get_loop().call_soon_threadsafe(_set_done, waiter)
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        자리 하나를 차지하고 블록 실행 시간을 지연으로 기록
+
+        예외면 실패로 기록 (CircuitOpenError는 요청을 안 보낸 것이므로 조절 없이 반납)
+        """
+        await self.acquire()
+        started = time.monotonic()
+
+        try:
+            yield
+        except CircuitOpenError:
+            self.release(None, True)
+            raise
+        except BaseException:
+            self.release(time.monotonic() - started, False)
+            raise
+        else:
+            self.release(time.monotonic() - started, True)
+
+    def stats(self) -> Dict[str, float]:
+        """현재/최고 limit, 기준 지연, 성공/실패/감소 횟수"""
+        return {
+            "limit": int(self.limit),
+            "peak_limit": int(self.peak_limit),
+            "in_flight": self.in_flight,
+            "baseline_s": round(self.baseline or 0.0, 4),
+            "successes": self.successes,
+            "failures": self.failures,
+            "decreases": self.decreases
+        }
+
+
+def _set_done(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 회로 차단기 (스레드 안전)
+
+    closed → (연속 실패 failure_threshold번) → open
+    open → (reset_timeout초 경과) → half-open: 요청 하나만 통과
+    half-open → 성공이면 closed, 실패면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: 열리기까지의 연속 실패 수
+            reset_timeout: 열린 뒤 복구 확인까지 기다릴 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self.trips = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 (False면 대체 결과 사용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("회로 차단기 복구 (closed)")
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+                self.trips += 1
+                logger.warning(f"회로 차단기 열림: 연속 실패 {self._failures}번 → LLM 대신 대체 결과 사용")
+
+    def stats(self) -> Dict[str, object]:
+        """상태, 열린 횟수, 거절한 요청 수"""
+        return {"state": self.state, "trips": self.trips, "rejected": self.rejected}
@@ -0,0 +1,253 @@
+"""
+LLM 메타데이터 캐시 모듈
+- 조항별 LLM 결과(제목, 키워드)를 SQLite에 저장해서 재수집 시 Ollama 호출 생략
+- 키 = sha256(조항 미리보기 300자 + 모델명 + 프롬프트 버전)
+  → 모델이나 프롬프트가 바뀐 결과만 새로 생성
+- 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+
+저장 위치:
+    data/processed/llm_metadata.sqlite
+
+사용법:
+    cache = MetadataCache()
+    key = MetadataCache.make_key(text, "qwen2.5:1.5b", "v1")
+
+    metadata = cache.get(key)
+    if metadata is None:
+        metadata = llm_generate(text)
+        cache.put(key, metadata)
+
+    print(cache.stats())   # {"hits": ..., "misses": ..., "entries": ..., "bytes": ...}
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import weakref
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("metadata_cache")
+
+DEFAULT_CACHE_PATH = "data/processed/llm_metadata.sqlite"
+
+# 프롬프트에 넣는 조항 미리보기 길이 (MetadataGenerator와 같음)
+PREVIEW_CHARS = 300
+
+# 적중 시 최근 사용 시각은 모아 두었다가 이만큼 쌓이거나 이 시간(초)이 지나면 한 번에 기록
+TOUCH_FLUSH_SIZE = 256
+TOUCH_FLUSH_INTERVAL = 5.0
+
+
+class MetadataCache:
+    """
+    (미리보기 해시, 모델, 프롬프트 버전) → 메타데이터 dict 디스크 캐시
+
+    여러 스레드에서 같이 써도 되도록 연결 하나를 잠금으로 보호
+
+    조회할 때마다 last_used를 UPDATE + commit하면 적중마다 WAL 쓰기가 생기므로,
+    적중한 키의 시각은 메모리에 모았다가 put_many / close / 임계치(TOUCH_FLUSH_*)에서 한 번에 기록
+    (LRU 순서만 조금 늦게 반영됨, 프로세스 종료 시에도 기록)
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_bytes: 저장 값 총 크기 상한 (넘으면 LRU 삭제)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON metadata(last_used)")
+        self._conn.commit()
+
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM metadata").fetchone()[0]
+
+        # 아직 기록하지 않은 최근 사용 시각 {key: time.time()}
+        self._touched: Dict[str, float] = {}
+        self._last_touch_flush = time.monotonic()
+        self._finalizer = weakref.finalize(self, MetadataCache._flush_touched, self._conn, self._lock, self._touched)
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        logger.info(f"메타데이터 캐시: {self.path} ({self._total_bytes / 1024:.0f}KB)")
+
+    @staticmethod
+    def make_key(text: str, model: str, prompt_version: str) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            text: 조항 텍스트 (앞 300자만 사용, 프롬프트에 들어가는 부분과 같음)
+            model: Ollama 모델명
+            prompt_version: 프롬프트 템플릿 버전
+        """
+        payload = "\0".join((prompt_version, model, text[:PREVIEW_CHARS]))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시 조회 (있으면 최근 사용 시각 갱신)
+
+        Returns:
+            메타데이터 dict, 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._touch([key])
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def get_many(self, keys: List[str]) -> List[Optional[Dict]]:
+        """
+        여러 키를 한 트랜잭션으로 조회 (있는 항목은 최근 사용 시각 갱신)
+
+        Returns:
+            keys와 같은 순서의 메타데이터 dict 또는 None
+        """
+        values: List[Optional[str]] = []
+
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()
+                values.append(row[0] if row is not None else None)
+
+            self._touch([key for key, value in zip(keys, values) if value is not None])
+
+            found = sum(1 for value in values if value is not None)
+            self.hits += found
+            self.misses += len(keys) - found
+
+        return [json.loads(value) if value is not None else None for value in values]
+
+    def _touch(self, keys: List[str]) -> None:
+        """적중한 키의 최근 사용 시각 모으기, 임계치를 넘으면 기록 (잠금 안에서 호출)"""
+        now = time.time()
+        for key in keys:
+            self._touched[key] = now
+
+        if self._touched and (
+            len(self._touched) >= TOUCH_FLUSH_SIZE
+            or time.monotonic() - self._last_touch_flush >= TOUCH_FLUSH_INTERVAL
+        ):
+            self._write_touched(self._conn, self._touched)
+            self._conn.commit()
+            self._last_touch_flush = time.monotonic()
+
+    @staticmethod
+    def _write_touched(conn: sqlite3.Connection, touched: Dict[str, float]) -> None:
+        """모아 둔 최근 사용 시각을 executemany 한 번으로 UPDATE (commit은 호출한 쪽에서)"""
+        if touched:
+            conn.executemany(
+                "UPDATE metadata SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in touched.items()]
+            )
+            touched.clear()
+
+    @staticmethod
+    def _flush_touched(conn: sqlite3.Connection, lock: threading.Lock, touched: Dict[str, float]) -> None:
+        """종료/가비지 컬렉션 때 남은 최근 사용 시각 기록 (weakref.finalize용이라 self 없이)"""
+        with lock:
+            MetadataCache._write_touched(conn, touched)
+            conn.commit()
+
+    def put(self, key: str, metadata: Dict) -> None:
+        """캐시 저장 (같은 키는 덮어씀)"""
+        self.put_many([(key, metadata)])
+
+    def put_many(self, items: Iterable[Tuple[str, Dict]]) -> None:
+        """
+        여러 항목을 한 트랜잭션으로 저장
+
+        Args:
+            items: (key, metadata) 목록
+        """
+        now = time.time()
+
+        with self._lock:
+            # 삭제(LRU) 전에 모아 둔 사용 시각부터 반영 (같은 트랜잭션)
+            self._write_touched(self._conn, self._touched)
+            self._last_touch_flush = time.monotonic()
+
+            for key, metadata in items:
+                value = json.dumps(metadata, ensure_ascii=False)
+                size = len(value.encode("utf-8"))
+
+                old = self._conn.execute("SELECT size FROM metadata WHERE key = ?", (key,)).fetchone()
+                if old is not None:
+                    self._total_bytes -= old[0]
+
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO metadata (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, value, size, now)
+                )
+                self._total_bytes += size
+
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """총 크기가 상한 이하가 될 때까지 오래 안 쓴 항목 삭제 (잠금 안에서 호출)"""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM metadata ORDER BY last_used LIMIT 256"
+            ).fetchall()
+
+            if not rows:
+                self._total_bytes = 0
+                break
+
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM metadata WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스/삭제 수와 현재 크기"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "bytes": self._total_bytes
+        }
+
+    def close(self) -> None:
+        """모아 둔 최근 사용 시각 기록 후 SQLite 연결 닫기"""
+        self._finalizer()
+
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,168 @@
+"""
+질문 임베딩 캐시 모듈 (검색 경로)
+- embed_query 앞에 두는 프로세스 내 LRU + TTL 캐시
+- 키 = 정규화한 질문 (NFC, 연속 공백 하나로) → "연차  휴가는?"와 "연차 휴가는?"는 같은 항목
+- 벡터는 float32 배열로 보관하고 전체 크기를 max_bytes 이하로 유지 (넘으면 오래 안 쓴 것부터 삭제)
+- 적중률 통계
+
+LangChain Embeddings를 감싸므로 벡터스토어에 그대로 넘길 수 있음 (embed_documents는 그대로 통과)
+
+사용법:
+    embedding = CachedQueryEmbeddings(OllamaEmbeddings(model="bona/bge-m3-korean:latest"))
+    vectorstore = Weaviate(client=client, index_name="...", text_key="text", embedding=embedding)
+
+    vector = embedding.embed_query("연차휴가는 며칠인가요?")   # 같은 질문이 다시 오면 Ollama 요청 없음
+    print(embedding.stats())   # {"hits": ..., "misses": ..., "hit_rate": ..., "bytes": ...}
+"""
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+from embedding_cache import normalize_text
+from single_flight import SingleFlight
+
+logger = setup_logger("query_cache")
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    embed_query / aembed_query 결과를 LRU + TTL로 캐시하는 Embeddings 래퍼
+
+    항목 크기 = 벡터 바이트 + 키 UTF-8 바이트 (dict/배열 객체 오버헤드는 ENTRY_OVERHEAD로 근사)
+    동시에 들어온 같은 질문(동기 호출)은 싱글 플라이트로 한 번만 요청
+    """
+
+    # 항목 하나의 파이썬 객체 오버헤드 근사 (OrderedDict 노드, ndarray 헤더, 튜플)
+    ENTRY_OVERHEAD = 256
+
+    def __init__(self, embeddings: Embeddings, max_bytes: int = 16 * 1024 * 1024, ttl: float = 3600.0):
+        """
+        Args:
+            embeddings: 감쌀 임베딩 모델 (OllamaEmbeddings 등)
+            max_bytes: 캐시 메모리 상한 (바이트)
+            ttl: 항목 유효 시간 (초, 0 이하면 만료 없음)
+        """
+        self.embeddings = embeddings
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # 정규화 질문 → (float32 벡터, 만료 시각, 크기)
+        self._entries: "OrderedDict[str, Tuple[np.ndarray, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.bytes = 0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    # 캐시
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        """유효한 항목이면 최근 사용으로 옮기고 벡터 반환"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and self.ttl > 0 and entry[1] < time.monotonic():
+                self._remove(key)
+                self.expired += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0].tolist()
+
+    def _put(self, key: str, vector: List[float]) -> List[float]:
+        """
+        항목 저장 후 max_bytes를 넘으면 오래 안 쓴 것부터 삭제
+
+        Returns:
+            float32로 맞춘 벡터 (첫 요청과 캐시 적중의 결과가 같도록)
+        """
+        array = np.asarray(vector, dtype=np.float32)
+        size = array.nbytes + len(key.encode("utf-8")) + self.ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return array.tolist()
+
+        expires = time.monotonic() + self.ttl if self.ttl > 0 else float("inf")
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (array, expires, size)
+            self.bytes += size
+
+            while self.bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+        return array.tolist()
+
+    def _remove(self, key: str) -> None:
+        """항목 삭제 (잠금 안에서 호출)"""
+        _, _, size = self._entries.pop(key)
+        self.bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    # Embeddings 인터페이스
+
+    def embed_query(self, text: str) -> List[float]:
+        key = normalize_text(text)
+
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        def fetch() -> List[float]:
+            return self._put(key, self.embeddings.embed_query(text))
+
+        return self._flight.do(key, fetch)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = normalize_text(text)
+
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        return self._put(key, await self.embeddings.aembed_query(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩은 캐시 없이 그대로 전달 (문서 쪽은 EmbeddingEngine/EmbeddingCache 사용)"""
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def stats(self) -> Dict[str, float]:
+        """적중/미스/만료/삭제 수, 적중률, 항목 수, 사용 바이트"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes
+        }
@@ -0,0 +1,129 @@
+"""
+싱글 플라이트(single-flight) 모듈
+- 같은 키의 요청이 동시에 여러 개 들어오면 하나만 실행하고 나머지는 그 결과를 공유
+- 같은 조문이 여러 파일(개정본, FAQ 인용 등)에 있어도 Ollama에는 한 번만 요청
+
+동기(스레드)와 비동기(asyncio) 호출 모두 concurrent.futures.Future 하나로 공유
+
+사용법:
+    flight = SingleFlight()
+
+    # 동기: 먼저 온 호출만 fn 실행, 동시에 온 같은 키 호출은 결과 대기
+    metadata = flight.do(key, lambda: llm_generate(text))
+
+    # 일괄(비동기): 새로 맡은 키만 요청하고 나머지는 진행 중인 결과를 기다림
+    owned, waiting = flight.claim(keys)
+    ...                                   # owned 키 요청 후 flight.resolve(key, result)
+    shared = await flight.wait(waiting)
+
+    print(flight.stats())                 # {"calls": ..., "duplicates": ..., "in_flight": ...}
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class SingleFlight:
+    """키별 진행 중 요청(Future) 테이블 + 중복 요청 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+        # 통계
+        self.calls = 0        # 실제로 실행한 요청
+        self.duplicates = 0   # 진행 중인 요청에 합류한 중복 요청
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        키별로 fn을 한 번만 실행 (동시에 온 같은 키 호출은 결과 공유)
+
+        fn이 예외를 내면 기다리던 호출에도 같은 예외 전달
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+                self.calls += 1
+            else:
+                self.duplicates += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.fail(key, e)
+            raise
+
+        self.resolve(key, result)
+        return result
+
+    def claim(self, keys: List[str]) -> Tuple[List[str], Dict[str, Future]]:
+        """
+        일괄 요청용: 키 목록 중 이 호출이 맡을 키와 기다릴 키 구분
+
+        같은 목록 안의 중복 키도 중복으로 셈
+
+        Returns:
+            (맡은 키 리스트 - 중복 제거, 순서 유지), {다른 호출이 진행 중인 키: Future}
+        """
+        owned: List[str] = []
+        waiting: Dict[str, Future] = {}
+        seen = set()
+
+        with self._lock:
+            for key in keys:
+                if key in seen:
+                    self.duplicates += 1
+                    continue
+                seen.add(key)
+
+                future = self._in_flight.get(key)
+                if future is not None:
+                    waiting[key] = future
+                    self.duplicates += 1
+                else:
+                    self._in_flight[key] = Future()
+                    owned.append(key)
+                    self.calls += 1
+
+        return owned, waiting
+
+    def resolve(self, key: str, result: Any) -> None:
+        """맡은 키의 결과 전달 후 진행 중 목록에서 제거"""
+        with self._lock:
+            future = self._in_flight.pop(key, None)
+
+        if future is not None:
+            future.set_result(result)
+
+    def fail(self, key: str, error: BaseException) -> None:
+        """맡은 키의 예외 전달 후 진행 중 목록에서 제거"""
+        with self._lock:
+            future = self._in_flight.pop(key, None)
+
+        if future is not None:
+            future.set_exception(error)
+
+    @staticmethod
+    async def wait(waiting: Dict[str, Future]) -> Dict[str, Any]:
+        """claim으로 받은 Future들의 결과를 이벤트 루프를 막지 않고 기다림"""
+        if not waiting:
+            return {}
+
+        keys = list(waiting)
+        results = await asyncio.gather(*(asyncio.wrap_future(waiting[key]) for key in keys))
+        return dict(zip(keys, results))
+
+    def stats(self) -> Dict[str, int]:
+        """실행/중복/진행 중 요청 수"""
+        with self._lock:
+            in_flight = len(self._in_flight)
+
+        return {"calls": self.calls, "duplicates": self.duplicates, "in_flight": in_flight}
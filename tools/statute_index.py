@@ -0,0 +1,380 @@
+"""
+법령 구조 파서 + 조문 인덱스 모듈
+- 줄 맨 앞의 제목 줄만 장/절/조로 인식 (본문 속 "제55조에 따른" 같은 참조는 무시)
+- create_sample_data.py가 만드는 "## 제1장", "### 제1조(목적)" 마크다운 제목도 인식
+- 장 → 절 → 조 → 항(①) → 호(1.) 트리 + 글자 오프셋
+- "근로기준법 제60조 ①" 같은 참조를 딕셔너리 조회 한 번으로 찾음 (벡터 검색 X)
+
+사용법:
+    index = StatuteIndex()
+    index.add_text(text, law_name="근로기준법")
+
+    node = index.resolve("근로기준법 제60조 ①")
+    print(node.label, node.text)
+"""
+import re
+import bisect
+from pathlib import Path
+from typing import List, Dict, Tuple, Iterable, Iterator, Optional
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from langchain.schema import Document
+from config.logging_config import setup_logger
+
+logger = setup_logger("statute_index")
+
+# 제목 줄 패턴 (줄 맨 앞, 마크다운 # 허용)
+_HEADING_PREFIX = r'^[ \t]*(?:#+[ \t]*)?'
+CHAPTER_PATTERN = re.compile(_HEADING_PREFIX + r'제\s*(\d+)\s*장(?:의\s*(\d+))?[ \t]*(.*)$', re.M)
+SECTION_PATTERN = re.compile(_HEADING_PREFIX + r'제\s*(\d+)\s*절(?:의\s*(\d+))?[ \t]*(.*)$', re.M)
+# 조 번호 뒤에는 "(제목)" 또는 줄 끝만 허용
+# → "제55조에 따른", "제36조 및 제37조에 따라"처럼 조문 인용으로 시작하는 본문 줄은 제외
+ARTICLE_HEADING_PATTERN = re.compile(
+    _HEADING_PREFIX + r'(제\s*(\d+)\s*조(?:의\s*(\d+))?)(?=[ \t]*(?:\(|$))[ \t]*(?:\(([^)\n]*)\))?',
+    re.M
+)
+
+# 항: ①~⑳, ㉑~㉟, ㊱~㊿ / 호: "1." "2."
+PARAGRAPH_MARKS = (
+    [chr(c) for c in range(0x2460, 0x2474)]
+    + [chr(c) for c in range(0x3251, 0x3260)]
+    + [chr(c) for c in range(0x32B1, 0x32C0)]
+)
+PARAGRAPH_NUMBERS = {mark: i for i, mark in enumerate(PARAGRAPH_MARKS, 1)}
+PARAGRAPH_PATTERN = re.compile(r'(?:^|(?<=\)))[ \t]*([' + ''.join(PARAGRAPH_MARKS) + r'])', re.M)
+ITEM_PATTERN = re.compile(r'^[ \t]*(\d+)\.[ \t]', re.M)
+
+# 참조 문자열 패턴: "근로기준법 제60조의2 ① 제3호", "제60조 제1항 2호"
+REFERENCE_PATTERN = re.compile(
+    r'^\s*(?P<law>[^\s제]\S*?)?\s*'
+    r'제\s*(?P<article>\d+)\s*조(?:\s*의\s*(?P<branch>\d+))?'
+    r'(?:\s*(?:(?P<mark>[' + ''.join(PARAGRAPH_MARKS) + r'])|제?\s*(?P<paragraph>\d+)\s*항))?'
+    r'(?:\s*제?\s*(?P<item>\d+)\s*호)?\s*$'
+)
+
+
+def article_key(number: int, branch: Optional[int] = None) -> str:
+    """조 번호 키: 제60조 → "60", 제60조의2 → "60-2" """
+    return f"{number}-{branch}" if branch else str(number)
+
+
+def iter_heading_article_spans(text: str) -> Iterator[Tuple[str, int, int]]:
+    """
+    제목 줄의 조만으로 (article_num, start, end) 생성
+
+    article_scanner.iter_article_spans와 같은 형식이지만,
+    - 본문 속 교차 참조("제55조에 따른")에서는 자르지 않음
+    - 조 범위는 다음 장/절/조 제목 줄 직전까지 ("## 제2장" 같은 제목이 앞 조에 붙지 않음)
+
+    Args:
+        text: 법령 원문
+
+    Yields:
+        (article_num, start, end) - start는 조 번호 바로 뒤
+    """
+    boundaries = sorted(
+        match.start()
+        for pattern in (CHAPTER_PATTERN, SECTION_PATTERN, ARTICLE_HEADING_PATTERN)
+        for match in pattern.finditer(text)
+    )
+
+    for match in ARTICLE_HEADING_PATTERN.finditer(text):
+        i = bisect.bisect_right(boundaries, match.start())
+        end = boundaries[i] if i < len(boundaries) else len(text)
+        yield match.group(1), match.end(1), end
+
+
+class StatuteNode:
+    """
+    법령 구조 트리의 노드 (장/절/조/항/호)
+
+    start/end는 원본 텍스트 기준 글자 오프셋
+    """
+
+    __slots__ = ("kind", "label", "key", "number", "title", "start", "end", "children", "parent", "source_text")
+
+    def __init__(
+        self,
+        kind: str,
+        label: str,
+        number: Optional[int],
+        title: str,
+        start: int,
+        end: int,
+        source_text: str,
+        parent: Optional["StatuteNode"] = None
+    ):
+        self.kind = kind            # law / chapter / section / article / paragraph / item
+        self.label = label          # "제4장", "제60조", "①", "1."
+        self.key = label            # 조는 인덱스 키 ("60", "60-2")
+        self.number = number
+        self.title = title          # "근로시간과 휴식", "연차 유급휴가"
+        self.start = start
+        self.end = end
+        self.children: List["StatuteNode"] = []
+        self.parent = parent
+        self.source_text = source_text
+
+    def __repr__(self) -> str:
+        return f"StatuteNode({self.kind}, {self.label!r}, title={self.title!r}, span=({self.start}, {self.end}))"
+
+    @property
+    def text(self) -> str:
+        """노드 범위의 원문"""
+        return self.source_text[self.start:self.end].strip()
+
+    def walk(self) -> Iterator["StatuteNode"]:
+        """자기 자신 + 모든 하위 노드 (문서 순서)"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def find(self, kind: str) -> List["StatuteNode"]:
+        """하위 노드 중 특정 종류만"""
+        return [node for node in self.walk() if node.kind == kind]
+
+
+class StatuteParser:
+    """
+    법령 텍스트 → StatuteNode 트리
+    """
+
+    def parse(self, text: str, law_name: str = "") -> StatuteNode:
+        """
+        Args:
+            text: 법령 원문
+            law_name: 법령 이름
+
+        Returns:
+            kind="law" 루트 노드
+        """
+        root = StatuteNode("law", law_name, None, law_name, 0, len(text), text)
+
+        headings = self._headings(text)
+
+        chapter = None
+        section = None
+
+        for i, (kind, start, body_start, label, key, number, title) in enumerate(headings):
+            end = self._heading_end(headings, i, len(text))
+
+            if kind == "chapter":
+                chapter = StatuteNode("chapter", label, number, title, start, end, text, root)
+                root.children.append(chapter)
+                section = None
+
+            elif kind == "section":
+                parent = chapter or root
+                section = StatuteNode("section", label, number, title, start, end, text, parent)
+                parent.children.append(section)
+
+            else:
+                parent = section or chapter or root
+                article = StatuteNode("article", label, number, title, start, end, text, parent)
+                article.key = key
+                parent.children.append(article)
+                self._parse_paragraphs(article, body_start)
+
+        return root
+
+    def _headings(self, text: str) -> List[Tuple[str, int, int, str, str, int, str]]:
+        """
+        모든 제목 줄을 (종류, 시작, 본문 시작, 라벨, 키, 번호, 제목)으로 문서 순서대로
+        """
+        headings = []
+
+        for match in CHAPTER_PATTERN.finditer(text):
+            label = f"제{match.group(1)}장" + (f"의{match.group(2)}" if match.group(2) else "")
+            headings.append(("chapter", match.start(), match.end(), label, label, int(match.group(1)), match.group(3).strip()))
+
+        for match in SECTION_PATTERN.finditer(text):
+            label = f"제{match.group(1)}절" + (f"의{match.group(2)}" if match.group(2) else "")
+            headings.append(("section", match.start(), match.end(), label, label, int(match.group(1)), match.group(3).strip()))
+
+        for match in ARTICLE_HEADING_PATTERN.finditer(text):
+            number, branch = int(match.group(2)), match.group(3)
+            label = f"제{number}조" + (f"의{branch}" if branch else "")
+            key = article_key(number, branch and int(branch))
+            headings.append(("article", match.start(), match.end(), label, key, number, (match.group(4) or "").strip()))
+
+        headings.sort(key=lambda h: h[1])
+        return headings
+
+    @staticmethod
+    def _heading_end(headings: list, i: int, text_end: int) -> int:
+        """
+        제목 i의 범위 끝: 같은 수준 이상의 다음 제목 시작
+        (장은 다음 장, 절은 다음 절/장, 조는 다음 조/절/장)
+        """
+        rank = {"chapter": 0, "section": 1, "article": 2}
+        kind = headings[i][0]
+
+        for next_kind, next_start, *_ in headings[i + 1:]:
+            if rank[next_kind] <= rank[kind]:
+                return next_start
+
+        return text_end
+
+    def _parse_paragraphs(self, article: StatuteNode, body_start: int) -> None:
+        """조 본문에서 항(①)과 호(1.)를 찾아 트리에 추가"""
+        text = article.source_text
+
+        marks = list(PARAGRAPH_PATTERN.finditer(text, body_start, article.end))
+
+        if not marks:
+            self._parse_items(article, body_start, article.end)
+            return
+
+        for i, match in enumerate(marks):
+            end = marks[i + 1].start(1) if i + 1 < len(marks) else article.end
+            mark = match.group(1)
+            paragraph = StatuteNode(
+                "paragraph", mark, PARAGRAPH_NUMBERS[mark], "", match.start(1), end, text, article
+            )
+            article.children.append(paragraph)
+            self._parse_items(paragraph, match.end(1), end)
+
+    def _parse_items(self, parent: StatuteNode, start: int, end: int) -> None:
+        text = parent.source_text
+        items = list(ITEM_PATTERN.finditer(text, start, end))
+
+        for i, match in enumerate(items):
+            item_end = items[i + 1].start() if i + 1 < len(items) else end
+            number = int(match.group(1))
+            item = StatuteNode("item", f"{number}.", number, "", match.start(1), item_end, text, parent)
+            parent.children.append(item)
+
+
+class StatuteIndex:
+    """
+    여러 법령의 구조 트리 + (법령, 조, 항, 호) → 노드 딕셔너리
+
+    키 예시:
+        ("근로기준법", "60", None, None)  → 제60조
+        ("근로기준법", "60", 1, None)     → 제60조 ①
+        ("근로기준법", "17", 1, 3)        → 제17조 ① 제3호
+    """
+
+    def __init__(self):
+        self.parser = StatuteParser()
+        self.laws: Dict[str, StatuteNode] = {}
+        self._index: Dict[Tuple[str, str, Optional[int], Optional[int]], StatuteNode] = {}
+
+    @staticmethod
+    def law_name_from_text(text: str, fallback: str) -> str:
+        """
+        첫 번째 "# 제목" 줄에서 법령 이름 추출 (괄호 부분 제외), 없으면 fallback
+        """
+        match = re.search(r'^#[ \t]+([^\n(]+)', text, re.M)
+        return match.group(1).strip() if match else fallback
+
+    def add_text(self, text: str, law_name: str) -> StatuteNode:
+        """
+        법령 하나를 파싱해서 인덱스에 추가
+
+        Args:
+            text: 법령 원문
+            law_name: 법령 이름 (조회 키)
+
+        Returns:
+            루트 노드
+        """
+        root = self.parser.parse(text, law_name)
+        self.laws[law_name] = root
+
+        for article in root.find("article"):
+            key = article.key
+            self._index.setdefault((law_name, key, None, None), article)
+
+            for child in article.children:
+                if child.kind == "paragraph":
+                    self._index.setdefault((law_name, key, child.number, None), child)
+                    for item in child.children:
+                        self._index.setdefault((law_name, key, child.number, item.number), item)
+                else:
+                    # 항 없이 바로 호가 있는 조문
+                    self._index.setdefault((law_name, key, None, child.number), child)
+
+        logger.info(f"✓ {law_name}: {len(root.find('article'))}개 조, 인덱스 {len(self._index)}개")
+        return root
+
+    def add_documents(self, documents: Iterable[Document]) -> None:
+        """
+        DocumentLoader의 법령 Document들을 인덱스에 추가
+
+        법령 이름은 "# 제목" 줄 → 없으면 파일명(stem)
+        """
+        for doc in documents:
+            fallback = Path(doc.metadata.get("source", "unknown")).stem
+            self.add_text(doc.page_content, self.law_name_from_text(doc.page_content, fallback))
+
+    def get(
+        self,
+        law_name: str,
+        article: str,
+        paragraph: Optional[int] = None,
+        item: Optional[int] = None
+    ) -> Optional[StatuteNode]:
+        """
+        키로 노드 조회 (딕셔너리 조회 한 번)
+
+        Args:
+            law_name: 법령 이름
+            article: 조 키 ("60", "60-2")
+            paragraph: 항 번호 (①=1)
+            item: 호 번호
+        """
+        return self._index.get((law_name, article, paragraph, item))
+
+    def resolve(self, reference: str, default_law: Optional[str] = None) -> Optional[StatuteNode]:
+        """
+        "근로기준법 제60조 ①", "제17조 제1항 제3호" 같은 참조 문자열로 노드 조회
+
+        Args:
+            reference: 참조 문자열
+            default_law: 법령 이름이 없을 때 쓸 법령 (없으면 등록된 법령이 하나일 때만 허용)
+
+        Returns:
+            StatuteNode, 없으면 None
+        """
+        match = REFERENCE_PATTERN.match(reference)
+        if not match:
+            return None
+
+        law_name = match.group("law") or default_law
+        if law_name is None and len(self.laws) == 1:
+            law_name = next(iter(self.laws))
+        if law_name is None:
+            return None
+
+        key = article_key(int(match.group("article")), match.group("branch") and int(match.group("branch")))
+
+        paragraph = None
+        if match.group("mark"):
+            paragraph = PARAGRAPH_NUMBERS[match.group("mark")]
+        elif match.group("paragraph"):
+            paragraph = int(match.group("paragraph"))
+
+        item = int(match.group("item")) if match.group("item") else None
+
+        return self.get(law_name, key, paragraph, item)
+
+
+if __name__ == "__main__":
+    from document_loader import DocumentLoader
+
+    index = StatuteIndex()
+    index.add_documents(DocumentLoader().load_laws())
+
+    for law_name, root in index.laws.items():
+        print(f"\n📘 {law_name}")
+        for node in root.walk():
+            if node.kind in ("chapter", "section", "article"):
+                indent = {"chapter": "  ", "section": "    ", "article": "      "}[node.kind]
+                print(f"{indent}{node.label} {node.title}")
+
+    for reference in ["근로기준법 제60조 ①", "근로기준법 제17조 ① 제3호", "근로기준법 제50조 제2항"]:
+        node = index.resolve(reference)
+        print(f"\n🔎 {reference} → {node.text if node else '없음'}")
@@ -0,0 +1,51 @@
+"""
+동기 API용 이벤트 루프 모듈
+- 동기 메서드(MetadataGenerator.generate_many, EmbeddingEngine.embed_texts 등)의 코루틴을
+  프로세스에 하나 있는 전용 이벤트 루프 스레드에서 실행하고 결과를 기다림
+- 호출마다 asyncio.run을 쓰면 매번 새 루프가 생겨서, 첫 루프에 묶인 비동기 HTTP 클라이언트
+  (ChatOllama, OllamaEmbeddings)가 두 번째 호출부터 "Event loop is closed"로 실패하고,
+  이미 이벤트 루프 안(주피터, 비동기 서버 등)에서 부르면 RuntimeError
+    → 모든 동기 호출을 같은 루프에서 돌려서 클라이언트 연결도 그대로 재사용
+
+사용법:
+    from sync_loop import run_sync
+
+    def embed_texts(self, texts):
+        return run_sync(self.aembed_texts(texts))
+"""
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def _sync_loop() -> asyncio.AbstractEventLoop:
+    """전용 이벤트 루프 (첫 호출 때 데몬 스레드에서 시작)"""
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="sync-loop", daemon=True)
+            _thread.start()
+
+    return _loop
+
+
+def run_sync(coroutine: Coroutine) -> Any:
+    """
+    코루틴을 전용 이벤트 루프에서 실행하고 끝날 때까지 기다림
+
+    Raises:
+        RuntimeError: 전용 루프 안(그 루프에서 도는 코루틴)에서 부른 경우 (스스로를 기다려 멈추므로)
+    """
+    loop = _sync_loop()
+
+    if threading.current_thread() is _thread:
+        coroutine.close()
+        raise RuntimeError("전용 이벤트 루프 안에서는 동기 API 대신 비동기 API를 await 하세요")
+
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
@@ -3,9 +3,11 @@
 - 조항 단위 분할
 - ChatOllama 기반 메타데이터 자동 생성 (제목, 키워드)
 """
-import re
 import json
-from typing import List, Dict
+import heapq
+import asyncio
+from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from start import path_extend
 path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
@@ -14,10 +16,68 @@ from langchain.schema import Document
 from langchain_ollama import ChatOllama
 from langchain.schema import HumanMessage
 from config.logging_config import setup_logger
+from ingest_manifest import IngestManifest
+from metadata_cache import MetadataCache
+from json_stream import JsonStreamScanner
+from keyword_extractor import LocalKeywordExtractor
+from single_flight import SingleFlight
+from sync_loop import run_sync
+from llm_limiter import AdaptiveLimiter, CircuitBreaker, CircuitOpenError
+from corpus_arena import CorpusArena, ChunkSpan, fixed_size_spans
+from article_scanner import iter_article_spans, MIN_ARTICLE_LENGTH
+from statute_index import iter_heading_article_spans
 
 logger = setup_logger("text_splitter")
 logger.info(f"text_splitter.py 활성화")
 
+# 청크 레코드
+class Chunk:
+    """
+    분할기 내부용 가벼운 청크 레코드
+    
+    - 원본 문서 메타데이터(source_meta)는 복사하지 않고 청크끼리 공유
+    - 청크별 필드만 보관 (chunk_id, article_num, title, keywords)
+    - LangChain으로 넘길 때만 to_document()로 Document 생성
+    """
+    
+    __slots__ = ("page_content", "source_meta", "chunk_id", "article_num", "title", "keywords")
+    
+    def __init__(
+        self,
+        page_content: str,
+        source_meta: Dict,
+        chunk_id: int,
+        article_num: Optional[str] = None,
+        title: Optional[str] = None,
+        keywords: Optional[List[str]] = None
+    ):
+        self.page_content = page_content
+        self.source_meta = source_meta
+        self.chunk_id = chunk_id
+        self.article_num = article_num
+        self.title = title
+        self.keywords = keywords
+    
+    def __repr__(self) -> str:
+        return f"Chunk(source={self.source_meta.get('source')!r}, chunk_id={self.chunk_id}, article_num={self.article_num!r})"
+    
+    def to_document(self) -> Document:
+        """
+        Document로 변환
+        
+        메타데이터 = 원본 메타데이터 복사본 + chunk_id
+        (+ 법령이면 article_num, title, keywords)
+        """
+        metadata = self.source_meta.copy()
+        metadata['chunk_id'] = self.chunk_id
+        
+        if self.article_num is not None:
+            metadata['article_num'] = self.article_num
+            metadata['title'] = self.title
+            metadata['keywords'] = self.keywords
+        
+        return Document(page_content=self.page_content, metadata=metadata)
+
 # 메타데이터 생성기
 class MetadataGenerator:
     """
@@ -25,33 +85,132 @@ class MetadataGenerator:
     조항 텍스트 → 제목 + 키워드 5개
     """
     
-    def __init__(self, model: str = "qwen2.5:1.5b"):
+    # 프롬프트(_build_prompt / _build_packed_prompt)를 바꾸면 올릴 것 → 이전 캐시 결과를 쓰지 않음
+    PROMPT_VERSION = "v1"
+    PACKED_PROMPT_VERSION = "packed-v1"
+    
+    # 실패 응답 제목
+    FAILED_TITLES = ("파싱 실패", "파싱 에러", "생성 실패")
+    
+    def __init__(
+        self,
+        model: str = "qwen2.5:1.5b",
+        max_concurrency: int = 4,
+        use_cache: bool = True,
+        cache_path: str = "data/processed/llm_metadata.sqlite",
+        pack_size: int = 1,
+        streaming: bool = False,
+        json_format: bool = False,
+        extractor: Optional[LocalKeywordExtractor] = None,
+        min_confidence: float = 0.8,
+        base_url: Optional[str] = None,
+        adaptive_concurrency: bool = False,
+        breaker_threshold: int = 0,
+        request_timeout: Optional[float] = None
+    ):
         """
         Args:
             model: Ollama 모델명
+            max_concurrency: agenerate_many 동시 요청 수 (Ollama OLLAMA_NUM_PARALLEL에 맞춤)
+            use_cache: True면 같은 조항/모델/프롬프트 결과를 디스크 캐시에서 재사용
+            cache_path: 메타데이터 캐시 파일
+            pack_size: agenerate_many에서 요청 하나에 묶을 조항 수 (1이면 조항별 요청)
+            streaming: True면 응답을 스트리밍으로 받다가 최상위 JSON이 닫히면 생성 중단
+            json_format: True면 Ollama format="json" (JSON 제약 디코딩) 사용
+                (format="json"은 객체만 만들므로 JSON 배열을 받는 묶음 요청에는 적용하지 않음)
+            extractor: 로컬 키워드 추출기 (있으면 신뢰도가 높은 조항은 LLM 생략)
+            min_confidence: 로컬 추출 결과를 그대로 쓸 최소 신뢰도
+            base_url: Ollama 주소 (None이면 ChatOllama 기본값, 가짜 서버 테스트용)
+            adaptive_concurrency: True면 agenerate_many 동시 요청 수를 AIMD로 조절
+                (max_concurrency에서 시작, 최대 8배)
+            breaker_threshold: 연속 실패가 이만큼 쌓이면 LLM 대신 조항 번호를 제목으로 사용
+                (0이면 끔, 기본값. 5 정도 권장)
+            request_timeout: 요청 하나의 제한 시간 (초, 넘으면 실패로 처리)
         """
+        self.model = model
+        llm_kwargs = {
+            **({"base_url": base_url} if base_url else {}),
+            **({"client_kwargs": {"timeout": request_timeout}} if request_timeout else {})
+        }
         self.llm = ChatOllama(
             model=model,
-            temperature=0.3
+            temperature=0.3,
+            **({"format": "json"} if json_format else {}),
+            **llm_kwargs
+        )
+        # 묶음 요청(JSON 배열 응답)용 - format="json"이면 배열 대신 객체 하나만 나오므로 따로 만듦
+        self.packed_llm = ChatOllama(model=model, temperature=0.3, **llm_kwargs) if json_format else None
+        self.streaming = streaming
+        self.extractor = extractor
+        self.min_confidence = min_confidence
+        self.max_concurrency = max_concurrency
+        self.pack_size = pack_size
+        self.request_timeout = request_timeout
+        self.cache = MetadataCache(cache_path) if use_cache else None
+        
+        # 동시성 제어 / 회로 차단기
+        self.limiter = (
+            AdaptiveLimiter(initial=max_concurrency, max_limit=max_concurrency * 8)
+            if adaptive_concurrency else None
+        )
+        self.breaker = CircuitBreaker(failure_threshold=breaker_threshold) if breaker_threshold > 0 else None
+        
+        # 비동기 스트리밍 요청을 돌릴 스레드 (동시 요청 최대치만큼)
+        self._stream_executor = (
+            ThreadPoolExecutor(max_workers=self.limiter.max_limit if self.limiter else max_concurrency)
+            if streaming else None
         )
         
-        logger.info(f"ChatOllama 초기화: {model}")
+        # 같은 조항 동시 요청은 하나로 합침
+        self.flight = SingleFlight()
+        
+        # 통계
+        self.local_hits = 0
+        
+        logger.info(f"ChatOllama 초기화: {model} (동시 요청 {max_concurrency})")
     
-    def generate(self, text: str) -> Dict[str, any]:
+    def _local_extract(self, text: str) -> Optional[Dict[str, any]]:
+        """로컬 추출기 결과 (신뢰도가 낮거나 추출기가 없으면 None → LLM 사용)"""
+        if self.extractor is None:
+            return None
+        
+        metadata, confidence = self.extractor.extract(text)
+        if confidence < self.min_confidence:
+            return None
+        
+        self.local_hits += 1
+        return metadata
+    
+    def _fallback(self, text: str) -> Dict[str, any]:
+        """회로 차단기가 열렸을 때 쓰는 비LLM 결과 (제목 = 조항 번호, 캐시하지 않음)"""
+        return {"title": self._article_label(text), "keywords": []}
+    
+    def _cache_key(self, text: str, packed: bool = False) -> str:
+        version = self.PACKED_PROMPT_VERSION if packed else self.PROMPT_VERSION
+        return MetadataCache.make_key(text, self.model, version)
+    
+    def _cache_put(self, items: List[Tuple[str, Dict, bool]]) -> None:
         """
-        텍스트 분석하여 제목과 키워드 생성
+        응답을 제대로 파싱한 결과만 캐시에 저장
         
         Args:
-            text: 분석할 조항 텍스트
-            
-        Returns:
-            {"title": "제목", "keywords": ["키워드1", ...]}
+            items: (캐시 키, 메타데이터, 파싱 성공 여부) 리스트
+                실패/파싱 실패/회로 차단기 대체 결과는 저장하지 않음 → 다음 실행에서 다시 요청
         """
+        if self.cache is None:
+            return
+        
+        items = [(key, metadata) for key, metadata, ok in items if ok]
+        if items:
+            self.cache.put_many(items)
+    
+    def _build_prompt(self, text: str) -> str:
+        """조항 텍스트로 프롬프트 생성"""
         
         # 텍스트가 너무 길면 앞부분만
         text_preview = text[:300] if len(text) > 300 else text
         
-        prompt = f"""다음 법률 조항을 분석하여 제목과 주요 키워드 5개를 추출하세요.
+        return f"""다음 법률 조항을 분석하여 제목과 주요 키워드 5개를 추출하세요.
 
 법률 조항:
 {text_preview}
@@ -63,12 +222,19 @@ class MetadataGenerator:
 }}
 
 JSON만 출력:"""
+    
+    def _parse_response(self, result_text: str) -> Dict[str, any]:
+        """LLM 응답에서 JSON 메타데이터 추출"""
+        return self._parse(result_text)[0]
+    
+    def _parse(self, result_text: str) -> Tuple[Dict[str, any], bool]:
+        """
+        LLM 응답에서 JSON 메타데이터 추출
         
+        Returns:
+            (메타데이터, 파싱 성공 여부) - 실패하면 제목이 FAILED_TITLES 중 하나인 메타데이터
+        """
         try:
-            # LangChain ChatOllama 사용
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            result_text = response.content
-            
             # JSON 추출
             json_start = result_text.find('{')
             json_end = result_text.rfind('}') + 1
@@ -77,19 +243,410 @@ JSON만 출력:"""
                 json_str = result_text[json_start:json_end]
                 metadata = json.loads(json_str)
                 
-                logger.debug(f"✓ 메타데이터: {metadata.get('title', '')[:50]}")
-                return metadata
+                # {"title": null}, 키워드가 문자열인 응답 등은 실패로 처리
+                if (
+                    not isinstance(metadata, dict)
+                    or not isinstance(metadata.get('title'), str)
+                    or not isinstance(metadata.get('keywords', []), list)
+                ):
+                    logger.warning(f"메타데이터 형식 오류: {json_str[:100]}")
+                    return {"title": "파싱 실패", "keywords": []}, False
+                
+                logger.debug(f"✓ 메타데이터: {metadata['title'][:50]}")
+                return metadata, True
             else:
                 logger.warning("JSON 추출 실패")
-                return {"title": "파싱 실패", "keywords": []}
+                return {"title": "파싱 실패", "keywords": []}, False
                 
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 에러: {e}")
-            return {"title": "파싱 에러", "keywords": []}
+            return {"title": "파싱 에러", "keywords": []}, False
         
         except Exception as e:
             logger.error(f"메타데이터 생성 실패: {e}")
+            return {"title": "생성 실패", "keywords": []}, False
+    
+    def generate(self, text: str) -> Dict[str, any]:
+        """
+        텍스트 분석하여 제목과 키워드 생성
+        
+        Args:
+            text: 분석할 조항 텍스트
+            
+        Returns:
+            {"title": "제목", "keywords": ["키워드1", ...]}
+        """
+        local = self._local_extract(text)
+        if local is not None:
+            return local
+        
+        # 동시에 들어온 같은 조항 요청은 한 번만 생성하고 결과 공유
+        return self.flight.do(self._cache_key(text), lambda: self._generate_one(text))
+    
+    def _generate_one(self, text: str) -> Dict[str, any]:
+        """캐시 조회 → LLM 요청 → 캐시 저장 (조항 하나)"""
+        if self.cache is not None:
+            key = self._cache_key(text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if self.breaker is not None and not self.breaker.allow():
+            return self._fallback(text)
+        
+        prompt = self._build_prompt(text)
+        
+        try:
+            # LangChain ChatOllama 사용
+            if self.streaming:
+                content = self._stream_json([HumanMessage(content=prompt)], "{")
+            else:
+                content = self.llm.invoke([HumanMessage(content=prompt)]).content
+            
+        except Exception as e:
+            logger.error(f"메타데이터 생성 실패: {e}")
+            if self.breaker is not None:
+                self.breaker.record_failure()
             return {"title": "생성 실패", "keywords": []}
+        
+        if self.breaker is not None:
+            self.breaker.record_success()
+        
+        metadata, ok = self._parse(content)
+        
+        if self.cache is not None:
+            self._cache_put([(key, metadata, ok)])
+        
+        return metadata
+    
+    def _llm_for(self, opener: str) -> ChatOllama:
+        """응답 형태에 맞는 모델 ("[" = 묶음 요청의 JSON 배열)"""
+        if opener == "[" and self.packed_llm is not None:
+            return self.packed_llm
+        return self.llm
+    
+    def _stream_json(self, messages: List[HumanMessage], opener: str) -> str:
+        """
+        llm.stream으로 응답을 받다가 최상위 JSON 값이 닫히면 스트림을 닫고 반환
+        
+        스트림(제너레이터)을 닫으면 Ollama HTTP 연결이 끊겨서 남은 토큰 생성도 멈춤
+        끝까지 안 닫히면 받은 전체 텍스트 반환 (기존 파싱으로 처리)
+        """
+        scanner = JsonStreamScanner(opener)
+        parts = []
+        stream = self._llm_for(opener).stream(messages)
+        
+        try:
+            for chunk in stream:
+                parts.append(chunk.content)
+                if scanner.feed(chunk.content):
+                    break
+        finally:
+            stream.close()
+        
+        return scanner.text if scanner.done else "".join(parts)
+    
+    async def _astream_json(self, messages: List[HumanMessage], opener: str) -> str:
+        """
+        _stream_json의 비동기 버전 (스트리밍 전용 스레드 풀에서 실행)
+        
+        llm.astream은 비동기 제너레이터가 여러 겹이라 중간에 닫아도 안쪽 HTTP 스트림이
+        바로 닫히지 않으므로, 동기 스트림을 스레드에서 돌려서 즉시 끊기게 함
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stream_executor, self._stream_json, messages, opener)
+    
+    async def _acomplete(self, prompts: List[str], limit: int, opener: str) -> List:
+        """
+        프롬프트들을 동시에 요청해서 응답 텍스트(또는 예외) 리스트 반환
+        
+        - 동시 요청 수: AIMD 제한기가 있으면 그것으로, 없으면 limit 고정
+        - 회로 차단기가 열려 있으면 요청하지 않고 CircuitOpenError
+        - 제한기/차단기/스트리밍을 모두 안 쓰면 abatch(max_concurrency)
+        """
+        messages = [[HumanMessage(content=prompt)] for prompt in prompts]
+        
+        if not self.streaming and self.limiter is None and self.breaker is None:
+            responses = await self._llm_for(opener).abatch(
+                messages,
+                config={"max_concurrency": limit},
+                return_exceptions=True
+            )
+            return [r if isinstance(r, Exception) else r.content for r in responses]
+        
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def request(message) -> str:
+            if self.streaming:
+                return await self._astream_json(message, opener)
+            return (await self._llm_for(opener).ainvoke(message)).content
+        
+        async def guarded(message) -> str:
+            # 자리를 얻은 시점에 확인 (기다리는 동안 차단기가 열렸을 수 있음)
+            if self.breaker is not None and not self.breaker.allow():
+                raise CircuitOpenError()
+            
+            try:
+                content = await asyncio.wait_for(request(message), self.request_timeout)
+            except Exception:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                raise
+            
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return content
+        
+        async def run(message) -> str:
+            if self.limiter is not None:
+                async with self.limiter.slot():
+                    return await guarded(message)
+            
+            async with semaphore:
+                return await guarded(message)
+        
+        return await asyncio.gather(*(run(message) for message in messages), return_exceptions=True)
+    
+    def _article_label(self, text: str) -> str:
+        """묶음 프롬프트에서 조항을 구분할 이름 (청크 첫 줄 = 조항 번호)"""
+        return text.split("\n", 1)[0].strip()[:30]
+    
+    def _build_packed_prompt(self, items: List[Tuple[str, str]]) -> str:
+        """
+        여러 조항을 한 번에 묻는 프롬프트 생성
+        
+        Args:
+            items: (조항 이름, 조항 텍스트) 리스트 (이름은 묶음 안에서 겹치지 않음)
+        """
+        articles = "\n\n".join(f"[{label}]\n{text[:300]}" for label, text in items)
+        
+        return f"""다음 법률 조항 {len(items)}개를 각각 분석하여 제목과 주요 키워드 5개를 추출하세요.
+
+{articles}
+
+출력 형식 (JSON 배열, 조항마다 하나씩):
+[
+    {{"article_num": "대괄호 안의 조항 번호", "title": "이 조항의 핵심 내용을 한 문장으로", "keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"]}}
+]
+
+JSON 배열만 출력:"""
+    
+    def _parse_packed_response(self, result_text: str, labels: List[str]) -> Dict[str, Dict]:
+        """
+        묶음 응답(JSON 배열)을 조항 이름별 메타데이터로 분리
+        
+        Returns:
+            {조항 이름: {"title", "keywords"}} (파싱 못 한 조항은 빠짐)
+        """
+        json_start = result_text.find('[')
+        json_end = result_text.rfind(']') + 1
+        
+        if json_start == -1 or json_end <= json_start:
+            logger.warning("묶음 응답에서 JSON 배열 추출 실패")
+            return {}
+        
+        try:
+            entries = json.loads(result_text[json_start:json_end])
+        except json.JSONDecodeError as e:
+            logger.warning(f"묶음 응답 JSON 파싱 에러: {e}")
+            return {}
+        
+        if not isinstance(entries, list):
+            return {}
+        
+        # "제 60 조" / "제60조" 같은 공백 차이는 무시
+        by_compact = {"".join(label.split()): label for label in labels}
+        parsed = {}
+        
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not entry.get("title"):
+                continue
+            
+            label = by_compact.get("".join(str(entry.get("article_num", "")).split()))
+            
+            # 조항 번호를 빠뜨렸으면 개수가 맞을 때만 순서로 대응
+            if label is None and "article_num" not in entry and len(entries) == len(labels):
+                label = labels[position]
+            
+            if label is not None and label not in parsed:
+                parsed[label] = {"title": entry["title"], "keywords": entry.get("keywords", [])}
+        
+        return parsed
+    
+    def _make_packs(self, indices: List[int], labels: List[str], pack_size: int) -> List[List[int]]:
+        """pack_size개씩 묶되 한 묶음 안에서 조항 이름이 겹치지 않게 분배"""
+        packs: List[List[int]] = []
+        pack_labels: List[set] = []
+        
+        for i in indices:
+            for pack, used in zip(packs, pack_labels):
+                if len(pack) < pack_size and labels[i] not in used:
+                    pack.append(i)
+                    used.add(labels[i])
+                    break
+            else:
+                packs.append([i])
+                pack_labels.append({labels[i]})
+        
+        return packs
+    
+    async def _abatch_single(self, texts: List[str], limit: int) -> List[Tuple[Dict[str, any], bool]]:
+        """
+        조항마다 프롬프트 하나씩 abatch로 동시 요청
+        
+        Returns:
+            texts 순서의 (메타데이터, 파싱 성공 여부) 리스트
+        """
+        responses = await self._acomplete([self._build_prompt(text) for text in texts], limit, "{")
+        
+        results = []
+        for text, response in zip(texts, responses):
+            if isinstance(response, CircuitOpenError):
+                results.append((self._fallback(text), False))
+            elif isinstance(response, Exception):
+                logger.error(f"메타데이터 생성 실패: {response!r}")
+                results.append(({"title": "생성 실패", "keywords": []}, False))
+            else:
+                results.append(self._parse(response))
+        
+        return results
+    
+    async def _abatch_packed(self, texts: List[str], limit: int, pack_size: int) -> List[Tuple[Dict[str, any], bool]]:
+        """
+        pack_size개 조항을 프롬프트 하나로 묶어 동시 요청
+        
+        응답에서 빠졌거나 파싱에 실패한 조항만 조항별 요청으로 다시 생성
+        
+        Returns:
+            texts 순서의 (메타데이터, 파싱 성공 여부) 리스트
+        """
+        labels = [self._article_label(text) for text in texts]
+        packs = self._make_packs(list(range(len(texts))), labels, pack_size)
+        
+        responses = await self._acomplete(
+            [self._build_packed_prompt([(labels[i], texts[i]) for i in pack]) for pack in packs],
+            limit,
+            "["
+        )
+        
+        results: List[Optional[Tuple[Dict, bool]]] = [None] * len(texts)
+        
+        for pack, response in zip(packs, responses):
+            if isinstance(response, Exception):
+                logger.error(f"묶음 메타데이터 생성 실패: {response!r}")
+                continue
+            
+            parsed = self._parse_packed_response(response, [labels[i] for i in pack])
+            for i in pack:
+                if labels[i] in parsed:
+                    results[i] = (parsed[labels[i]], True)
+        
+        failed = [i for i, result in enumerate(results) if result is None]
+        if failed:
+            logger.info(f"묶음 응답 실패 {len(failed)}개 → 조항별 재요청")
+            for i, result in zip(failed, await self._abatch_single([texts[i] for i in failed], limit)):
+                results[i] = result
+        
+        return results
+    
+    async def agenerate_many(
+        self,
+        texts: List[str],
+        max_concurrency: Optional[int] = None,
+        pack_size: Optional[int] = None
+    ) -> List[Dict[str, any]]:
+        """
+        여러 조항의 메타데이터를 동시에 생성 (ChatOllama.abatch)
+        
+        Args:
+            texts: 분석할 조항 텍스트 리스트
+            max_concurrency: 동시 요청 수 (None이면 생성 시 설정값)
+            pack_size: 요청 하나에 묶을 조항 수 (None이면 생성 시 설정값, 1이면 조항별 요청)
+            
+        Returns:
+            texts와 같은 순서의 메타데이터 리스트 (실패한 항목은 "생성 실패")
+        """
+        limit = max_concurrency or self.max_concurrency
+        pack_size = pack_size or self.pack_size
+        
+        # 로컬 추출로 충분한 조항은 요청하지 않음
+        results: List[Optional[Dict]] = [self._local_extract(text) for text in texts]
+        keys: List[Optional[str]] = [None] * len(texts)
+        local_count = sum(1 for result in results if result is not None)
+        
+        # 캐시에 있는 조항도 요청하지 않음 (묶음/조항별 결과는 따로 캐시)
+        # SQLite 조회/저장은 이벤트 루프를 막지 않게 스레드에서
+        if self.cache is not None:
+            lookup = [i for i, result in enumerate(results) if result is None]
+            for i in lookup:
+                keys[i] = self._cache_key(texts[i], packed=pack_size > 1)
+            
+            cached = await asyncio.to_thread(self.cache.get_many, [keys[i] for i in lookup])
+            for i, metadata in zip(lookup, cached):
+                results[i] = metadata
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        # 같은 조항은 한 번만 요청 (이 목록 안의 중복 + 다른 호출이 진행 중인 요청)
+        flight_keys = {i: self._cache_key(texts[i]) for i in pending}
+        owned, waiting = self.flight.claim([flight_keys[i] for i in pending])
+        owned_index = {}
+        for i in pending:
+            owned_index.setdefault(flight_keys[i], i)
+        
+        logger.info(
+            f"메타데이터 일괄 생성: {len(owned)}개 "
+            f"(로컬 {local_count}개, 캐시 {len(texts) - len(pending) - local_count}개, "
+            f"중복 {len(pending) - len(owned)}개, 동시 {limit}, 묶음 {pack_size})"
+        )
+        
+        owned_texts = [texts[owned_index[key]] for key in owned]
+        
+        try:
+            if not owned_texts:
+                generated = []
+            elif pack_size > 1:
+                generated = await self._abatch_packed(owned_texts, limit, pack_size)
+            else:
+                generated = await self._abatch_single(owned_texts, limit)
+        except BaseException as e:
+            for key in owned:
+                self.flight.fail(key, e)
+            raise
+        
+        for key, (metadata, _) in zip(owned, generated):
+            self.flight.resolve(key, metadata)
+        
+        by_key = {key: metadata for key, (metadata, _) in zip(owned, generated)}
+        by_key.update(await self.flight.wait(waiting))
+        
+        for i in pending:
+            results[i] = by_key[flight_keys[i]]
+        
+        # 다른 호출이 생성한 조항(waiting)은 그쪽에서 저장
+        if self.cache is not None:
+            await asyncio.to_thread(self._cache_put, [
+                (keys[owned_index[key]], metadata, ok)
+                for key, (metadata, ok) in zip(owned, generated)
+            ])
+        
+        return results
+    
+    def generate_many(
+        self,
+        texts: List[str],
+        max_concurrency: Optional[int] = None,
+        pack_size: Optional[int] = None
+    ) -> List[Dict[str, any]]:
+        """
+        agenerate_many의 동기 버전
+        
+        전용 이벤트 루프 스레드(sync_loop.run_sync)에서 실행하고 끝날 때까지 기다림
+        (이미 이벤트 루프 안에서 불러도, 여러 번 불러도 ChatOllama 비동기 클라이언트가 그대로 동작)
+        """
+        return run_sync(self.agenerate_many(texts, max_concurrency, pack_size))
 
 # 텍스트 분할기
 class LawTextSplitter:
@@ -99,88 +656,124 @@ class LawTextSplitter:
     - ChatOllama로 메타데이터 자동 생성
     """
     
-    def __init__(self, use_llm: bool = True, ollama_model: str = "qwen2.5:1.5b"):
+    def __init__(
+        self,
+        use_llm: bool = True,
+        ollama_model: str = "qwen2.5:1.5b",
+        structure_aware: bool = False,
+        max_concurrency: int = 4,
+        pack_size: int = 1,
+        local_extractor: bool = False
+    ):
         """
         Args:
             use_llm: LLM 메타데이터 생성 사용 여부
             ollama_model: Ollama 모델명
+            structure_aware: True면 줄 맨 앞 조 제목에서만 분할
+                (본문 속 "제55조에 따른" 같은 참조에서 조각나지 않음)
+            max_concurrency: split_documents에서 동시에 보낼 LLM 요청 수
+            pack_size: split_documents에서 LLM 요청 하나에 묶을 조항 수
+            local_extractor: True면 괄호 제목 + TF-IDF 로컬 추출을 먼저 쓰고
+                신뢰도가 낮은 조항만 LLM으로 생성 (use_llm=False면 로컬 추출만)
         """
         self.use_llm = use_llm
+        self.structure_aware = structure_aware
+        self.extractor = LocalKeywordExtractor() if local_extractor else None
         
         if self.use_llm:
-            self.metadata_gen = MetadataGenerator(model=ollama_model)
+            self.metadata_gen = MetadataGenerator(
+                model=ollama_model,
+                max_concurrency=max_concurrency,
+                pack_size=pack_size,
+                extractor=self.extractor
+            )
             logger.info("LLM 메타데이터 생성 활성화")
         else:
             self.metadata_gen = None
             logger.info("LLM 메타데이터 생성 비활성화")
     
-    def split_by_article(self, text: str) -> List[str]:
+    def split_articles(self, text: str) -> List[Tuple[str, str]]:
         """
-        조항 단위로 텍스트 분할
+        조항 단위로 텍스트 분할 (조항 번호 포함)
         
         Args:
             text: 원본 법률 문서
             
         Returns:
-            조항별로 나눈 텍스트 리스트
+            (조항 번호, "조항 번호\n내용") 리스트
         """
         logger.info("조항 단위 분할 시작")
         
-        # 정규식: 제N조, 제N조의N
-        pattern = r'(제\s*\d+\s*조(?:의\s*\d+)?)'
-        
-        # 분할
-        chunks = re.split(pattern, text)
+        spans = iter_heading_article_spans(text) if self.structure_aware else iter_article_spans(text)
         
-        # 조항 번호 + 내용 합치기
         articles = []
-        for i in range(1, len(chunks), 2):
-            if i + 1 < len(chunks):
-                article_num = chunks[i].strip()
-                article_content = chunks[i + 1].strip()
-                
-                # 너무 짧으면 제외
-                if len(article_content) < 50:
-                    logger.debug(f"건너뜀: {article_num} (내용 부족)")
-                    continue
-                
-                full_article = f"{article_num}\n{article_content}"
-                articles.append(full_article)
+        for article_num, start, end in spans:
+            article_content = text[start:end].strip()
+            
+            # 너무 짧으면 제외
+            if len(article_content) < MIN_ARTICLE_LENGTH:
+                logger.debug(f"건너뜀: {article_num} (내용 부족)")
+                continue
+            
+            articles.append((article_num, f"{article_num}\n{article_content}"))
         
         logger.info(f"✓ {len(articles)}개 조항으로 분할")
         return articles
     
-    def split_document(self, document: Document) -> List[Document]:
+    def split_by_article(self, text: str) -> List[str]:
         """
-        Document 객체를 조항 단위로 분할 + 메타데이터 생성
+        조항 단위로 텍스트 분할
+        
+        Args:
+            text: 원본 법률 문서
+            
+        Returns:
+            조항별로 나눈 텍스트 리스트
+        """
+        return [article_text for _, article_text in self.split_articles(text)]
+    
+    def fit_extractor(self, documents: List[Document]) -> None:
+        """
+        로컬 추출기 TF-IDF 문서 빈도를 여러 문서의 전체 조항으로 한 번 계산
+        
+        split_chunks는 문서마다 다시 학습하지 않으므로, 로컬 추출기를 쓰면
+        먼저 코퍼스 전체로 이 메서드를 호출할 것 (TextSplitterManager.split_all은 자동으로 호출)
+        """
+        if self.extractor is None:
+            return
+        
+        self.extractor.fit(
+            article_text
+            for document in documents
+            for _, article_text in self.split_articles(document.page_content)
+        )
+    
+    def split_chunks(self, document: Document) -> List[Chunk]:
+        """
+        Document를 조항 단위 Chunk 레코드로 분할 + 메타데이터 생성
+        
+        로컬 추출기는 학습된 상태 그대로 사용 (fit_extractor 참고)
         
         Args:
             document: 원본 Document
             
         Returns:
-            조항별 Document 리스트
+            조항별 Chunk 리스트 (원본 메타데이터 공유)
         """
         logger.info(f"문서 분할: {document.metadata.get('filename', 'unknown')}")
         
-        # 1. 조항 분할
-        articles = self.split_by_article(document.page_content)
+        # 1. 조항 분할 (조항 번호도 같이)
+        articles = self.split_articles(document.page_content)
         
         if not articles:
             logger.warning("분할된 조항이 없음")
             return []
         
-        # 2. 각 조항을 Document로
-        chunked_docs = []
+        # 2. 각 조항을 Chunk로
+        chunks = []
         
-        for idx, article_text in enumerate(articles, 1):
-            # 조항 번호 추출
-            article_match = re.match(r'(제\s*\d+\s*조(?:의\s*\d+)?)', article_text)
-            article_num = article_match.group(1) if article_match else f"청크{idx}"
-            
-            # 메타데이터 복사
-            metadata = document.metadata.copy()
-            metadata['chunk_id'] = idx
-            metadata['article_num'] = article_num
+        for idx, (article_num, article_text) in enumerate(articles, 1):
+            chunk = Chunk(article_text, document.metadata, idx, article_num)
             
             # LLM으로 제목/키워드 생성
             if self.use_llm and self.metadata_gen:
@@ -189,36 +782,95 @@ class LawTextSplitter:
                     
                     llm_metadata = self.metadata_gen.generate(article_text)
                     
-                    metadata['title'] = llm_metadata.get('title', article_num)
-                    metadata['keywords'] = llm_metadata.get('keywords', [])
+                    chunk.title = llm_metadata.get('title', article_num)
+                    chunk.keywords = llm_metadata.get('keywords', [])
                     
-                    logger.info(f"✓ {article_num}: {metadata['title']}")
+                    logger.info(f"✓ {article_num}: {chunk.title}")
                     
                 except Exception as e:
                     logger.warning(f"메타데이터 실패: {article_num} - {e}")
-                    metadata['title'] = article_num
-                    metadata['keywords'] = []
+                    chunk.title = article_num
+                    chunk.keywords = []
             else:
-                metadata['title'] = article_num
-                metadata['keywords'] = []
+                self._apply_local_metadata(chunk)
             
-            # Document 생성
-            chunk_doc = Document(
-                page_content=article_text,
-                metadata=metadata
-            )
+            chunks.append(chunk)
+        
+        logger.info(f"✓ {len(chunks)}개 청크 생성")
+        return chunks
+    
+    def split_document(self, document: Document) -> List[Document]:
+        """
+        Document 객체를 조항 단위로 분할 + 메타데이터 생성
+        
+        Args:
+            document: 원본 Document
+            
+        Returns:
+            조항별 Document 리스트
+        """
+        return [chunk.to_document() for chunk in self.split_chunks(document)]
+    
+    def split_chunk_groups(self, documents: List[Document], refit: bool = True) -> List[List[Chunk]]:
+        """
+        여러 Document를 조항 단위로 분할하고 메타데이터는 한꺼번에 동시 생성
+        
+        모든 문서의 조항을 먼저 나눈 뒤 MetadataGenerator.generate_many로
+        요청을 묶어 보냄 (문서/조항 순서와 chunk_id는 split_chunks와 같음)
+        
+        Args:
+            documents: Document 리스트
+            refit: True면 이 문서들의 전체 조항으로 로컬 추출기 학습
+                (호출하는 쪽에서 fit_extractor로 이미 학습했으면 False)
+            
+        Returns:
+            문서별 Chunk 리스트의 리스트 (입력 순서)
+        """
+        groups = []
+        
+        for document in documents:
+            articles = self.split_articles(document.page_content)
+            groups.append([
+                Chunk(article_text, document.metadata, idx, article_num)
+                for idx, (article_num, article_text) in enumerate(articles, 1)
+            ])
+        
+        chunks = [chunk for group in groups for chunk in group]
+        
+        # 불러온 전체 조항으로 TF-IDF 문서 빈도 계산
+        if self.extractor is not None and refit:
+            self.extractor.fit(chunk.page_content for chunk in chunks)
+        
+        if self.use_llm and self.metadata_gen and chunks:
+            results = self.metadata_gen.generate_many([chunk.page_content for chunk in chunks])
             
-            chunked_docs.append(chunk_doc)
+            for chunk, llm_metadata in zip(chunks, results):
+                chunk.title = llm_metadata.get('title', chunk.article_num)
+                chunk.keywords = llm_metadata.get('keywords', [])
+        else:
+            for chunk in chunks:
+                self._apply_local_metadata(chunk)
         
-        logger.info(f"✓ {len(chunked_docs)}개 청크 생성")
-        return chunked_docs
+        return groups
     
-    def split_documents(self, documents: List[Document]) -> List[Document]:
+    def _apply_local_metadata(self, chunk: Chunk) -> None:
+        """LLM 없이 제목/키워드 채우기 (로컬 추출기가 없으면 조항 번호만)"""
+        if self.extractor is None:
+            chunk.title = chunk.article_num
+            chunk.keywords = []
+            return
+        
+        metadata, _ = self.extractor.extract(chunk.page_content)
+        chunk.title = metadata["title"] or chunk.article_num
+        chunk.keywords = metadata["keywords"]
+    
+    def split_documents(self, documents: List[Document], refit: bool = True) -> List[Document]:
         """
         여러 Document 한꺼번에 분할
         
         Args:
             documents: Document 리스트
+            refit: split_chunk_groups 참고
             
         Returns:
             분할된 Document 리스트
@@ -227,11 +879,11 @@ class LawTextSplitter:
         logger.info(f"전체 문서 분할: {len(documents)}개")
         logger.info("=" * 50)
         
-        all_chunks = []
-        
-        for doc in documents:
-            chunks = self.split_document(doc)
-            all_chunks.extend(chunks)
+        all_chunks = [
+            chunk.to_document()
+            for group in self.split_chunk_groups(documents, refit)
+            for chunk in group
+        ]
         
         logger.info(f"✅ 전체 분할 완료: {len(all_chunks)}개")
         return all_chunks
@@ -253,40 +905,40 @@ class SimpleSplitter:
         self.chunk_overlap = chunk_overlap
         logger.info(f"SimpleSplitter: size={chunk_size}, overlap={chunk_overlap}")
     
-    def split_document(self, document: Document) -> List[Document]:
+    def split_chunks(self, document: Document) -> List[Chunk]:
         """
-        고정 크기로 분할
+        고정 크기 Chunk 레코드로 분할 (원본 메타데이터 공유)
         
         Args:
             document: 원본 Document
             
         Returns:
-            분할된 Document 리스트
+            Chunk 리스트
         """
         text = document.page_content
-        chunks = []
         
-        start = 0
-        chunk_id = 1
-        
-        while start < len(text):
-            end = start + self.chunk_size
-            chunk_text = text[start:end]
-            
-            metadata = document.metadata.copy()
-            metadata['chunk_id'] = chunk_id
-            
-            chunks.append(Document(
-                page_content=chunk_text,
-                metadata=metadata
-            ))
-            
-            start = end - self.chunk_overlap
-            chunk_id += 1
+        chunks = [
+            Chunk(text[start:end], document.metadata, chunk_id)
+            for chunk_id, (start, end) in enumerate(
+                fixed_size_spans(len(text), self.chunk_size, self.chunk_overlap), 1
+            )
+        ]
         
         logger.debug(f"분할 완료: {len(chunks)}개")
         return chunks
     
+    def split_document(self, document: Document) -> List[Document]:
+        """
+        고정 크기로 분할
+        
+        Args:
+            document: 원본 Document
+            
+        Returns:
+            분할된 Document 리스트
+        """
+        return [chunk.to_document() for chunk in self.split_chunks(document)]
+    
     def split_documents(self, documents: List[Document]) -> List[Document]:
         """여러 문서 분할"""
         all_chunks = []
@@ -295,6 +947,26 @@ class SimpleSplitter:
         
         logger.info(f"✓ {len(all_chunks)}개 청크")
         return all_chunks
+    
+    def split_spans(self, arena: CorpusArena) -> List[ChunkSpan]:
+        """
+        아레나의 모든 문서를 오프셋 레코드로 분할 (본문 복사 없음)
+        
+        split_documents와 같은 경계/chunk_id. 본문이 필요하면
+        arena.text(span) / arena.to_document(span)으로 생성
+        
+        Args:
+            arena: CorpusArena
+            
+        Returns:
+            ChunkSpan 리스트
+        """
+        spans = []
+        for doc_id in range(len(arena)):
+            spans.extend(arena.fixed_spans(doc_id, self.chunk_size, self.chunk_overlap))
+        
+        logger.info(f"✓ {len(spans)}개 청크 (아레나)")
+        return spans
 
 # 통합 분할 관리자
 class TextSplitterManager:
@@ -302,21 +974,100 @@ class TextSplitterManager:
     문서 타입별 적절한 분할기 선택
     """
     
-    def __init__(self, use_llm: bool = True, ollama_model: str = "qwen2.5:1.5b"):
+    def __init__(
+        self,
+        use_llm: bool = True,
+        ollama_model: str = "qwen2.5:1.5b",
+        incremental: bool = False,
+        processed_dir: str = "data/processed",
+        structure_aware: bool = False,
+        llm_concurrency: int = 4,
+        llm_pack_size: int = 1,
+        local_extractor: bool = False
+    ):
         """
         Args:
             use_llm: LLM 메타데이터 생성 여부
             ollama_model: Ollama 모델명
+            incremental: True면 내용이 같은 문서는 이전 청크 재사용
+            processed_dir: 매니페스트/청크 캐시 폴더
+            structure_aware: 법령을 조 제목 줄 기준으로 분할
+            llm_concurrency: 법령 메타데이터 동시 요청 수
+            llm_pack_size: 법령 메타데이터 요청 하나에 묶을 조항 수
+            local_extractor: 법령 제목/키워드를 로컬 추출기로 먼저 생성
         """
         self.law_splitter = LawTextSplitter(
             use_llm=use_llm,
-            ollama_model=ollama_model
+            ollama_model=ollama_model,
+            structure_aware=structure_aware,
+            max_concurrency=llm_concurrency,
+            pack_size=llm_pack_size,
+            local_extractor=local_extractor
         )
         self.simple_splitter = SimpleSplitter()
         
+        # 청크 캐시 구분용 파이프라인 이름
+        llm_tag = ollama_model if use_llm else "no-llm"
+        if use_llm and llm_pack_size > 1:
+            llm_tag += f":pack{llm_pack_size}"
+        if local_extractor:
+            llm_tag += ":local"
+        self.law_pipeline = f"splitter:law{':structural' if structure_aware else ''}:{llm_tag}"
+        self.simple_pipeline = (
+            f"splitter:simple:{self.simple_splitter.chunk_size}/{self.simple_splitter.chunk_overlap}"
+        )
+        self.manifest = IngestManifest(processed_dir) if incremental else None
+        
         logger.info("TextSplitterManager 초기화")
     
-    def split_all(self, documents_dict: Dict[str, List[Document]]) -> List[Document]:
+    def _split_category(self, splitter, documents: List[Document], pipeline: str) -> List[Document]:
+        """
+        한 카테고리 분할 (증분 모드면 내용이 같은 문서는 캐시 재사용)
+        
+        Args:
+            splitter: LawTextSplitter 또는 SimpleSplitter
+            documents: Document 리스트
+            pipeline: 청크 캐시 구분용 이름
+            
+        Returns:
+            분할된 Document 리스트 (입력 순서 유지)
+        """
+        # 법령 로컬 추출기는 split_all에서 전체 법령으로 이미 학습함
+        if self.manifest is None:
+            if isinstance(splitter, LawTextSplitter):
+                return splitter.split_documents(documents, refit=False)
+            return splitter.split_documents(documents)
+        
+        results = []
+        misses = []
+        
+        for doc in documents:
+            cached = self.manifest.lookup_text(doc.metadata.get("source", ""), doc.page_content, pipeline)
+            results.append(cached)
+            
+            if cached is None:
+                misses.append(doc)
+        
+        # 바뀐 문서만 분할 (법령은 LLM 요청을 한꺼번에)
+        if isinstance(splitter, LawTextSplitter):
+            groups = iter([
+                [chunk.to_document() for chunk in group]
+                for group in splitter.split_chunk_groups(misses, refit=False)
+            ])
+        else:
+            groups = iter([splitter.split_document(doc) for doc in misses])
+        
+        all_chunks = []
+        
+        for doc, cached in zip(documents, results):
+            if cached is None:
+                cached = next(groups)
+                self.manifest.record(doc.metadata.get("source", ""), doc.page_content, cached, pipeline)
+            all_chunks.extend(cached)
+        
+        return all_chunks
+    
+    def split_all(self, documents_dict: Dict[str, List[Document]], workers: int = 1) -> List[Document]:
         """
         모든 문서를 타입에 맞게 분할
         
@@ -326,40 +1077,184 @@ class TextSplitterManager:
                 "faqs": [Document, ...],
                 "cases": [Document, ...]
             }
+            workers: 2 이상이면 프로세스 풀로 분할 (결과/chunk_id는 순차와 동일)
             
         Returns:
             분할된 모든 Document 리스트
         """
         logger.info("=" * 60)
-        logger.info("전체 문서 분할 시작")
+        logger.info(f"전체 문서 분할 시작 (workers={workers})")
+        logger.info("=" * 60)
+        
+        # 로컬 추출기는 (증분 모드에서 캐시된 문서까지) 전체 법령으로 한 번만 학습
+        if documents_dict.get("laws"):
+            self.law_splitter.fit_extractor(documents_dict["laws"])
+        
+        if workers > 1:
+            all_chunks = self._split_all_parallel(documents_dict, workers)
+        else:
+            all_chunks = self._split_all_serial(documents_dict)
+        
+        if self.manifest is not None:
+            self.manifest.save()
+            logger.info(f"매니페스트: {self.manifest.stats()}")
+        
+        logger.info("=" * 60)
+        logger.info(f"✅ 전체: {len(all_chunks)}개 청크")
         logger.info("=" * 60)
         
+        return all_chunks
+    
+    def _split_all_serial(self, documents_dict: Dict[str, List[Document]]) -> List[Document]:
+        """법령 → FAQ → 판례 순서로 한 프로세스에서 분할"""
         all_chunks = []
         
         # 법령: 조항 분할 + LLM
         if "laws" in documents_dict and documents_dict["laws"]:
             logger.info("\n[1] 법령 (조항 + LLM)")
-            law_chunks = self.law_splitter.split_documents(documents_dict["laws"])
+            law_chunks = self._split_category(self.law_splitter, documents_dict["laws"], self.law_pipeline)
             all_chunks.extend(law_chunks)
         
         # FAQ: 단순 분할
         if "faqs" in documents_dict and documents_dict["faqs"]:
             logger.info("\n[2] FAQ (단순)")
-            faq_chunks = self.simple_splitter.split_documents(documents_dict["faqs"])
+            faq_chunks = self._split_category(self.simple_splitter, documents_dict["faqs"], self.simple_pipeline)
             all_chunks.extend(faq_chunks)
         
         # 판례: 단순 분할
         if "cases" in documents_dict and documents_dict["cases"]:
             logger.info("\n[3] 판례 (단순)")
-            case_chunks = self.simple_splitter.split_documents(documents_dict["cases"])
+            case_chunks = self._split_category(self.simple_splitter, documents_dict["cases"], self.simple_pipeline)
             all_chunks.extend(case_chunks)
         
-        logger.info("=" * 60)
-        logger.info(f"✅ 전체: {len(all_chunks)}개 청크")
-        logger.info("=" * 60)
+        return all_chunks
+    
+    def _split_all_parallel(self, documents_dict: Dict[str, List[Document]], workers: int) -> List[Document]:
+        """
+        문서들을 크기 균형 배치로 나눠 ProcessPoolExecutor에서 분할
+        
+        - 정규식/문자열 작업만 프로세스로 보냄 (LLM을 쓰는 법령은 부모 프로세스에서 처리)
+        - 결과는 문서 순서대로 합치므로 chunk_id/순서가 순차 실행과 같음
+        """
+        categories = [
+            ("laws", self.law_splitter, self.law_pipeline, "law"),
+            ("faqs", self.simple_splitter, self.simple_pipeline, "simple"),
+            ("cases", self.simple_splitter, self.simple_pipeline, "simple"),
+        ]
+        
+        jobs = []        # (splitter, pipeline, kind, Document) - 문서 순서
+        results = {}     # 작업 번호 → Document 청크 리스트
+        pool_jobs = []   # 프로세스로 보낼 작업 번호
+        local_jobs = []  # 부모 프로세스에서 처리할 작업 번호 (LLM, 로컬 추출기)
+        
+        for category, splitter, pipeline, kind in categories:
+            for doc in documents_dict.get(category) or []:
+                job_id = len(jobs)
+                jobs.append((splitter, pipeline, kind, doc))
+                
+                if self.manifest is not None:
+                    cached = self.manifest.lookup_text(doc.metadata.get("source", ""), doc.page_content, pipeline)
+                    if cached is not None:
+                        results[job_id] = cached
+                        continue
+                
+                # LLM/로컬 추출기(코퍼스 전체 TF-IDF)가 필요한 법령은 부모 프로세스에서
+                if kind == "law" and (self.law_splitter.use_llm or self.law_splitter.extractor is not None):
+                    local_jobs.append(job_id)
+                else:
+                    pool_jobs.append(job_id)
+        
+        batches = _balanced_batches(
+            [(job_id, len(jobs[job_id][3].page_content)) for job_id in pool_jobs],
+            n_batches=workers * 4
+        )
+        logger.info(f"프로세스 분할: {len(pool_jobs)}개 문서 → {len(batches)}개 배치, 부모 프로세스: {len(local_jobs)}개")
+        
+        config = {
+            "structure_aware": self.law_splitter.structure_aware,
+            "chunk_size": self.simple_splitter.chunk_size,
+            "chunk_overlap": self.simple_splitter.chunk_overlap,
+        }
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _split_batch,
+                    [(job_id, jobs[job_id][2], jobs[job_id][3]) for job_id in batch],
+                    config
+                )
+                for batch in batches
+            ]
+            
+            # 프로세스들이 도는 동안 LLM이 필요한 법령은 여기서 처리 (요청은 한꺼번에)
+            groups = self.law_splitter.split_chunk_groups([jobs[job_id][3] for job_id in local_jobs], refit=False)
+            for job_id, group in zip(local_jobs, groups):
+                results[job_id] = [chunk.to_document() for chunk in group]
+            
+            for future in futures:
+                for job_id, chunks in future.result():
+                    results[job_id] = [chunk.to_document() for chunk in chunks]
+        
+        if self.manifest is not None:
+            for job_id in pool_jobs + local_jobs:
+                _, pipeline, _, doc = jobs[job_id]
+                self.manifest.record(doc.metadata.get("source", ""), doc.page_content, results[job_id], pipeline)
+        
+        all_chunks = []
+        for job_id in range(len(jobs)):
+            all_chunks.extend(results[job_id])
         
         return all_chunks
 
+# 프로세스 풀 작업 (모듈 최상위 함수여야 pickle 가능)
+
+# 작업 프로세스마다 한 번만 만드는 분할기 (설정별)
+_worker_splitters: Dict[Tuple, Tuple[LawTextSplitter, SimpleSplitter]] = {}
+
+def _balanced_batches(sizes: List[Tuple[int, int]], n_batches: int) -> List[List[int]]:
+    """
+    (작업 번호, 크기) 목록을 총 크기가 비슷한 배치들로 나눔 (큰 것부터 가장 가벼운 배치에)
+    
+    Returns:
+        작업 번호 리스트들 (각 배치 안은 작업 번호 순)
+    """
+    n_batches = max(1, min(n_batches, len(sizes)))
+    heap = [(0, i) for i in range(n_batches)]
+    batches = [[] for _ in range(n_batches)]
+    
+    for job_id, size in sorted(sizes, key=lambda x: x[1], reverse=True):
+        total, i = heapq.heappop(heap)
+        batches[i].append(job_id)
+        heapq.heappush(heap, (total + size, i))
+    
+    return [sorted(batch) for batch in batches if batch]
+
+def _split_batch(batch: List[Tuple[int, str, Document]], config: Dict) -> List[Tuple[int, List[Chunk]]]:
+    """
+    작업 프로세스에서 문서 배치 분할 (LLM 없이)
+    
+    Args:
+        batch: (작업 번호, "law"/"simple", Document) 리스트
+        config: 분할기 설정
+        
+    Returns:
+        (작업 번호, Chunk 리스트) 리스트
+    """
+    key = tuple(sorted(config.items()))
+    
+    if key not in _worker_splitters:
+        _worker_splitters[key] = (
+            LawTextSplitter(use_llm=False, structure_aware=config["structure_aware"]),
+            SimpleSplitter(chunk_size=config["chunk_size"], chunk_overlap=config["chunk_overlap"])
+        )
+    
+    law_splitter, simple_splitter = _worker_splitters[key]
+    
+    return [
+        (job_id, (law_splitter if kind == "law" else simple_splitter).split_chunks(doc))
+        for job_id, kind, doc in batch
+    ]
+
 # 테스트
 
 if __name__ == "__main__":
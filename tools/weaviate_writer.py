@@ -0,0 +1,223 @@
+"""
+Weaviate 일괄 적재 모듈
+- 클라이언트 batch API 사용 (동적 묶음 크기 + 병렬 작업자)
+- 객체 UUID = uuid5(source + chunk_id) → 다시 적재하면 같은 객체를 덮어씀 (클래스 삭제/재생성 없이 upsert)
+- 초당 객체 수와 실패한 객체 보고
+
+weaviate_사용해보기 예제와 같은 v3 클라이언트(weaviate.Client) API 기준
+
+사용법:
+    client = weaviate.Client("http://localhost:8080")
+    writer = WeaviateBatchWriter(client, "LaborLaw", num_workers=2)
+    writer.ensure_class()                       # 없을 때만 생성 (있으면 그대로)
+
+    ids, matrix = EmbeddingEngine().embed_chunks(chunks)
+    report = writer.write(chunks, matrix)       # {"objects": ..., "failed": ..., "objects_per_s": ...}
+
+    # 파이프라인 저장 단계로 사용
+    IngestPipeline(loader, ..., sink=writer.sink)
+"""
+import time
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from start import path_extend
+path_extend() # 모든 디렉토리 임포트 가능하게 경로 추가
+
+from config.logging_config import setup_logger
+
+logger = setup_logger("weaviate_writer")
+
+# 보고에 남길 실패 객체 최대 수
+MAX_FAILED_REPORT = 100
+
+
+def chunk_uuid(source: str, chunk_id: int) -> str:
+    """(source, chunk_id) → 결정적 UUID (weaviate.util.generate_uuid5)"""
+    from weaviate.util import generate_uuid5
+
+    return generate_uuid5(f"{source}#{chunk_id}")
+
+
+def _property_value(value: Any) -> Any:
+    """Weaviate 속성으로 넣을 수 있는 값 (문자열/숫자/불리언/문자열 리스트, 나머지는 문자열)"""
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return str(value)
+
+
+class WeaviateBatchWriter:
+    """
+    청크 + 벡터를 Weaviate 클래스 하나에 일괄 upsert
+
+    실패 집계는 batch 콜백에서 객체별 오류를 모아서 함 (작업자 스레드에서 호출되므로 잠금 사용)
+    """
+
+    def __init__(
+        self,
+        client,
+        class_name: str,
+        text_key: str = "text",
+        batch_size: int = 100,
+        dynamic: bool = True,
+        num_workers: int = 2,
+        timeout_retries: int = 3
+    ):
+        """
+        Args:
+            client: weaviate.Client (v3 API)
+            class_name: 저장할 클래스
+            text_key: 본문을 넣을 속성 이름
+            batch_size: 시작 묶음 크기 (dynamic이면 서버 응답 시간에 맞춰 자동 조절)
+            dynamic: 동적 묶음 크기 사용 여부
+            num_workers: 묶음을 동시에 보낼 작업자 수
+            timeout_retries: 시간 초과 시 재시도 횟수
+        """
+        self.client = client
+        self.class_name = class_name
+        self.text_key = text_key
+        self.batch_size = batch_size
+        self.dynamic = dynamic
+        self.num_workers = num_workers
+        self.timeout_retries = timeout_retries
+
+        self._lock = threading.Lock()
+
+        # 통계
+        self.objects = 0
+        self.failed = 0
+        self.seconds = 0.0
+        self.failed_objects: List[Dict[str, str]] = []
+
+    def ensure_class(self, properties: Optional[List[Dict]] = None) -> bool:
+        """
+        클래스가 없으면 생성 (있으면 지우지 않고 그대로 사용)
+
+        Args:
+            properties: 속성 스키마 (None이면 본문 + source / type만 정의하고 나머지는 자동 스키마)
+
+        Returns:
+            새로 만들었으면 True
+        """
+        if self.client.schema.exists(self.class_name):
+            return False
+
+        self.client.schema.create_class({
+            "class": self.class_name,
+            "vectorizer": "none",   # 벡터는 EmbeddingEngine에서 만들어서 넣음
+            "properties": properties or [
+                {"name": self.text_key, "dataType": ["text"]},
+                {"name": "source", "dataType": ["text"]},
+                {"name": "type", "dataType": ["text"]},
+            ]
+        })
+        logger.info(f"Weaviate 클래스 생성: {self.class_name}")
+        return True
+
+    def _on_result(self, results: Optional[List[Dict]]) -> None:
+        """batch 콜백: 객체별 오류 집계"""
+        if not results:
+            return
+
+        for result in results:
+            errors = (result.get("result") or {}).get("errors")
+            if not errors:
+                continue
+
+            messages = "; ".join(error.get("message", "") for error in errors.get("error", []))
+            with self._lock:
+                self.failed += 1
+                if len(self.failed_objects) < MAX_FAILED_REPORT:
+                    self.failed_objects.append({"id": result.get("id", ""), "error": messages})
+
+    def write(self, documents: Sequence, vectors: Optional[Sequence] = None) -> Dict[str, Any]:
+        """
+        청크들을 일괄 upsert
+
+        Args:
+            documents: Document 리스트 (metadata에 source, chunk_id 필요)
+            vectors: 같은 순서의 벡터 (float32 행렬 또는 리스트, None이면 클래스 vectorizer에 맡김)
+
+        Returns:
+            이번 호출의 {"objects", "failed", "seconds", "objects_per_s"}
+        """
+        self.client.batch.configure(
+            batch_size=self.batch_size,
+            dynamic=self.dynamic,
+            num_workers=self.num_workers,
+            timeout_retries=self.timeout_retries,
+            callback=self._on_result
+        )
+
+        failed_before = self.failed
+        started = time.perf_counter()
+
+        with self.client.batch as batch:
+            for i, doc in enumerate(documents):
+                properties = {self.text_key: doc.page_content}
+                for key, value in doc.metadata.items():
+                    properties[key] = _property_value(value)
+
+                vector = None
+                if vectors is not None:
+                    vector = vectors[i]
+                    vector = vector.tolist() if hasattr(vector, "tolist") else vector
+
+                batch.add_data_object(
+                    data_object=properties,
+                    class_name=self.class_name,
+                    uuid=chunk_uuid(doc.metadata["source"], doc.metadata["chunk_id"]),
+                    vector=vector
+                )
+
+        elapsed = time.perf_counter() - started
+        failed = self.failed - failed_before
+
+        with self._lock:
+            self.objects += len(documents)
+            self.seconds += elapsed
+
+        report = {
+            "objects": len(documents),
+            "failed": failed,
+            "seconds": round(elapsed, 3),
+            "objects_per_s": round(len(documents) / elapsed, 1) if elapsed else 0.0
+        }
+        logger.info(
+            f"Weaviate 적재: {self.class_name} {len(documents)}개 ({report['objects_per_s']}개/초), 실패 {failed}개"
+        )
+        return report
+
+    def sink(self, documents: List, vectors: Optional[Sequence]) -> None:
+        """IngestPipeline 저장 함수"""
+        self.write(documents, vectors)
+
+    def stats(self) -> Dict[str, Any]:
+        """누적 객체 수, 실패 수, 초당 객체 수, 실패 객체 (최대 MAX_FAILED_REPORT개)"""
+        return {
+            "objects": self.objects,
+            "failed": self.failed,
+            "seconds": round(self.seconds, 3),
+            "objects_per_s": round(self.objects / self.seconds, 1) if self.seconds else 0.0,
+            "failed_objects": list(self.failed_objects)
+        }
+
+
+if __name__ == "__main__":
+    import weaviate
+    from document_load_and_split import UnifiedDocumentLoader
+    from embeddings import EmbeddingEngine
+
+    print("⚠️  Weaviate(localhost:8080) + ollama pull bona/bge-m3-korean:latest 필요\n")
+
+    chunks = UnifiedDocumentLoader(use_llm=False).load_all()
+    _, matrix = EmbeddingEngine().embed_chunks(chunks)
+
+    writer = WeaviateBatchWriter(weaviate.Client("http://localhost:8080"), "LaborLaw")
+    writer.ensure_class()
+
+    print(writer.write(chunks, matrix))
+    print(writer.write(chunks, matrix))   # 두 번째는 같은 UUID를 덮어씀 (객체 수 그대로)
+    print(writer.stats())